@@ -129,19 +129,35 @@ class DataCollector:
 
         # Capture waveforms
         waveforms = {}
-        for ch in channels:
+        for ch in self._enabled_channels(channels, warn=True):
             try:
-                channel = getattr(self.scope, f"channel{ch}")
-                if channel.enabled:
-                    waveforms[ch] = self.scope.waveform.acquire(ch)
-                    logger.info(f"Captured {len(waveforms[ch].voltage)} samples from channel {ch}")
-                else:
-                    logger.warning(f"Channel {ch} is not enabled, skipping")
+                waveforms[ch] = self.scope.waveform.acquire(ch)
+                logger.info(f"Captured {len(waveforms[ch].voltage)} samples from channel {ch}")
             except Exception as e:
                 logger.error(f"Failed to capture channel {ch}: {e}")
 
         return waveforms
 
+    def _enabled_channels(self, channels: List[int], warn: bool = False) -> List[int]:
+        """Filter channels down to those enabled on the scope.
+
+        All channel states are read with one compound query, rather than one
+        query per requested channel.
+
+        Args:
+            channels: Requested channel numbers
+            warn: If True, log a warning for each requested channel that is skipped
+
+        Returns:
+            Requested channels that are enabled, in the requested order
+        """
+        enabled = set(self.scope.get_enabled_channels())
+        if warn:
+            for ch in channels:
+                if ch not in enabled:
+                    logger.warning(f"Channel {ch} is not enabled, skipping")
+        return [ch for ch in channels if ch in enabled]
+
     def batch_capture(
         self,
         channels: List[int],
@@ -293,11 +309,9 @@ class DataCollector:
 
                 # Capture waveforms
                 waveforms = {}
-                for ch in channels:
+                for ch in self._enabled_channels(channels):
                     try:
-                        channel = getattr(self.scope, f"channel{ch}")
-                        if channel.enabled:
-                            waveforms[ch] = self.scope.waveform.acquire(ch)
+                        waveforms[ch] = self.scope.waveform.acquire(ch)
                     except Exception as e:
                         logger.error(f"Failed to capture channel {ch}: {e}")
 
@@ -95,6 +95,28 @@ class BaseConnection(ABC):
         """
         pass
 
+    def read_raw_into(self, buffer: Union[bytearray, memoryview]) -> int:
+        """Read raw binary data into a caller-provided buffer.
+
+        Reads until the buffer is full or the device stops sending, so the
+        same buffer can be reused across transfers instead of allocating a
+        new bytes object each time. This default implementation copies from
+        read_raw(); connections that can receive in place override it.
+
+        Args:
+            buffer: Writable buffer to fill
+
+        Returns:
+            Number of bytes written to the start of ``buffer``
+
+        Raises:
+            SiglentConnectionError: If not connected
+            SiglentTimeoutError: If read times out
+        """
+        data = self.read_raw(len(buffer))[: len(buffer)]
+        memoryview(buffer)[: len(data)] = data
+        return len(data)
+
     @property
     def is_connected(self) -> bool:
         """Check if connected to oscilloscope.
@@ -364,6 +364,14 @@ class MockConnection(BaseConnection):
         command = command.strip()
         self.queries.append(command)
 
+        # Compound query ("C1:TRA?;C2:TRA?") - answer each part, joined by ';'
+        if ";" in command and command not in self.custom_responses:
+            return ";".join(self._answer(part.strip()) for part in command.split(";"))
+
+        return self._answer(command)
+
+    def _answer(self, command: str) -> str:
+        """Return the deterministic response for a single SCPI query."""
         if command in self.custom_responses:
             override = self.custom_responses[command]
             if isinstance(override, list):
@@ -2,7 +2,7 @@
 
 import socket
 import time
-from typing import Optional
+from typing import Optional, Union
 
 from scpi_control import exceptions
 from scpi_control.connection.base import BaseConnection
@@ -173,33 +173,60 @@ class SocketConnection(BaseConnection):
         if not self._connected or not self._socket:
             raise exceptions.SiglentConnectionError(f"Not connected to oscilloscope at {self.host}:{self.port}")
 
+        if size is not None:
+            # Read exact number of bytes straight into one buffer
+            view = memoryview(bytearray(size))
+            return bytes(view[: self.read_raw_into(view)])
+
         try:
-            if size is not None:
-                # Read exact number of bytes
-                data = b""
-                remaining = size
-                while remaining > 0:
-                    chunk = self._socket.recv(min(remaining, self._buffer_size))
+            # Read all available data
+            data = bytearray()
+            self._socket.settimeout(0.5)  # Short timeout for binary reads
+            try:
+                while True:
+                    chunk = self._socket.recv(self._buffer_size)
                     if not chunk:
                         break
                     data += chunk
-                    remaining -= len(chunk)
-                return data
-            else:
-                # Read all available data
-                data = b""
-                self._socket.settimeout(0.5)  # Short timeout for binary reads
-                try:
-                    while True:
-                        chunk = self._socket.recv(self._buffer_size)
-                        if not chunk:
-                            break
-                        data += chunk
-                except socket.timeout:
-                    pass  # Expected when no more data
-                finally:
-                    self._socket.settimeout(self.timeout)  # Restore timeout
-                return data
+            except socket.timeout:
+                pass  # Expected when no more data
+            finally:
+                self._socket.settimeout(self.timeout)  # Restore timeout
+            return bytes(data)
+        except socket.error as e:
+            self._connected = False
+            command_context = f" after '{self._last_command}'" if self._last_command else ""
+            raise exceptions.SiglentConnectionError(f"Read error from {self.host}:{self.port}{command_context}: {e}")
+
+    def read_raw_into(self, buffer: Union[bytearray, memoryview]) -> int:
+        """Read raw binary data into a caller-provided buffer.
+
+        Receives directly into ``buffer`` with socket.recv_into(), so large
+        transfers neither allocate per chunk nor concatenate.
+
+        Args:
+            buffer: Writable buffer to fill
+
+        Returns:
+            Number of bytes received (less than len(buffer) only if the
+            device closed the connection)
+
+        Raises:
+            SiglentConnectionError: If not connected
+            SiglentTimeoutError: If read times out
+        """
+        if not self._connected or not self._socket:
+            raise exceptions.SiglentConnectionError(f"Not connected to oscilloscope at {self.host}:{self.port}")
+
+        view = memoryview(buffer).cast("B")
+        received = 0
+        try:
+            while received < len(view):
+                n = self._socket.recv_into(view[received:], min(len(view) - received, self._buffer_size))
+                if not n:
+                    break
+                received += n
+            return received
         except socket.error as e:
             self._connected = False
             command_context = f" after '{self._last_command}'" if self._last_command else ""
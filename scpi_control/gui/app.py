@@ -1,5 +1,6 @@
 """GUI application entry point for Siglent oscilloscope control."""
 
+import importlib.util
 import logging
 import sys
 import warnings
@@ -34,9 +35,13 @@ def _check_gui_dependencies():
     except ImportError:
         missing_optional.append("pyqtgraph>=0.13.0 (recommended for high-performance live view)")
 
+    # Only look for QtWebEngine - importing it loads the Chromium libraries,
+    # which the VNC window does lazily when it is first opened
     try:
-        import PyQt6.QtWebEngineWidgets
+        webengine_available = importlib.util.find_spec("PyQt6.QtWebEngineWidgets") is not None
     except ImportError:
+        webengine_available = False
+    if not webengine_available:
         missing_optional.append("PyQt6-WebEngine>=6.6.0 (recommended for VNC display)")
 
     # Handle missing required dependencies
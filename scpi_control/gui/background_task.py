@@ -0,0 +1,68 @@
+"""Thread-pool task for one-shot blocking operations.
+
+Some GUI actions block for a long time: run/stop/single and auto setup are
+single SCPI calls that can hang until the connection timeout when the scope
+stops responding, and rendering an image export at full resolution takes
+hundreds of milliseconds. BackgroundTask runs such a call on a QThreadPool
+thread and reports the outcome through Qt signals, so the GUI thread never
+waits on it.
+
+Thread Safety:
+    - The signals object is created on the GUI thread, so connected slots
+      run there (queued connection)
+    - The task holds no state besides the callable it runs
+
+Signals (on BackgroundTask.signals):
+    finished(object): Emitted with the callable's return value
+    error_occurred(str): Emitted with the error message if the callable raised
+
+Example:
+    >>> task = BackgroundTask(scope.auto_setup)
+    >>> task.signals.finished.connect(lambda _: print("Auto setup complete"))
+    >>> task.signals.error_occurred.connect(handle_error)
+    >>> QThreadPool.globalInstance().start(task)
+"""
+
+import logging
+from typing import Any, Callable
+
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal
+
+logger = logging.getLogger(__name__)
+
+
+class BackgroundTaskSignals(QObject):
+    """Signals emitted by BackgroundTask (QRunnable cannot define signals itself).
+
+    Signals:
+        finished: Emitted with the callable's return value (object)
+        error_occurred: Emitted when the callable raised (str)
+    """
+
+    finished = pyqtSignal(object)  # return value of the callable
+    error_occurred = pyqtSignal(str)  # error message
+
+
+class BackgroundTask(QRunnable):
+    """Run one blocking call on a thread pool."""
+
+    def __init__(self, func: Callable[[], Any]):
+        """Initialize the task.
+
+        Args:
+            func: Callable performing the operation (no arguments)
+        """
+        super().__init__()
+        self.func = func
+        self.signals = BackgroundTaskSignals()
+
+    def run(self):
+        """Run the callable and emit its result or error."""
+        try:
+            result = self.func()
+        except Exception as e:
+            logger.error(f"Background task {getattr(self.func, '__name__', self.func)} failed: {e}")
+            self.signals.error_occurred.emit(str(e))
+            return
+
+        self.signals.finished.emit(result)
@@ -12,7 +12,12 @@ Thread Safety:
     - Uses Qt signals/slots for thread-safe communication
     - Worker runs in separate thread via QThread
     - GUI thread only handles display updates (<1ms)
-    - No shared mutable state between threads
+    - Voltage arrays are double-buffered: the worker only refills a buffer set
+      once the GUI has released it via frame_displayed() or frame_dropped(),
+      otherwise it falls back to freshly allocated arrays
+    - With wait_for_display set, at most one frame is queued for the GUI: the
+      worker waits for frame_displayed() before acquiring the next frame, so
+      a busy GUI thread never accumulates a backlog of stale frames
 
 Signals:
     waveforms_ready(list): Emitted when new waveforms are acquired
@@ -21,7 +26,7 @@ Signals:
 
 Example:
     >>> worker = LiveViewWorker(scope)
-    >>> worker.waveforms_ready.connect(display.plot_multiple_waveforms)
+    >>> worker.waveforms_ready.connect(display.update_waveforms)
     >>> worker.error_occurred.connect(handle_error)
     >>> worker.start()
     >>> # ... later ...
@@ -29,10 +34,14 @@ Example:
 """
 
 import logging
+import threading
+import time
 import traceback
+from collections import deque
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional
 
+import numpy as np
 from PyQt6.QtCore import QThread, pyqtSignal
 
 from scpi_control.gui.utils.validators import WaveformValidator
@@ -64,7 +73,31 @@ class LiveViewWorker(QThread):
         super().__init__(parent)
         self.scope = scope
         self.running = False
+        # Cleared while paused; the run loop blocks on it instead of polling
+        self._resume = threading.Event()
+        self._resume.set()
+        # Set by frame_displayed()/frame_dropped(); the single-slot hand-off blocks on it
+        self._displayed = threading.Event()
         self.update_interval = 200  # ms
+        # Only enable if the consumer calls frame_displayed() for every frame
+        self.wait_for_display = False
+        # After finding no enabled channels, wait this long before probing again
+        self.idle_probe_interval = 2.0  # s
+        self._idle_until = 0.0
+
+        # Two sets of per-channel voltage buffers, ping-ponged between frames.
+        # Buffers grow only when a channel's record length changes. float32 is
+        # plenty for 8/16-bit ADC codes and halves the memory traffic per frame.
+        self.buffer_dtype = np.float32
+        self._buffers: List[Dict[int, np.ndarray]] = [{}, {}]
+        self._buffer_index = 0
+        self._frame_buffer_index: Optional[int] = None
+        # Buffer set index of each emitted frame not yet released by the GUI
+        # (None for frames built from fresh arrays). Bounded so a consumer that
+        # never calls frame_displayed() simply disables buffer reuse.
+        self._in_flight: deque = deque(maxlen=8)
+        self._frames_emitted = 0
+        self._frames_displayed = 0
 
     def run(self):
         """Thread run method - continuously acquires waveforms."""
@@ -72,13 +105,31 @@ class LiveViewWorker(QThread):
         logger.info("Live view worker thread started")
 
         while self.running:
+            # Nobody can see the plot - sleep until resumed or stopped
+            if self.paused:
+                self._resume.wait()
+                continue
+
+            # Single-slot hand-off: don't queue a frame behind one not yet drawn
+            if self.wait_for_display and self._frames_emitted > self._frames_displayed:
+                self._displayed.clear()
+                # Re-check after clearing so a frame_displayed() in between isn't missed
+                if self._frames_emitted > self._frames_displayed:
+                    self._displayed.wait(self.update_interval / 1000)
+                continue
+
+            cycle_start = time.perf_counter()
+
             try:
                 # Acquire waveforms from enabled channels
                 waveforms = self._acquire_waveforms()
 
                 if waveforms:
                     # Emit signal with waveforms
+                    self._in_flight.append(self._frame_buffer_index)
+                    self._frames_emitted += 1
                     self.waveforms_ready.emit(waveforms)
+                    self._buffer_index ^= 1
                 else:
                     logger.debug("No waveforms acquired in this cycle")
 
@@ -99,8 +150,10 @@ class LiveViewWorker(QThread):
                 }
                 self.error_occurred.emit(error_info)
 
-            # Sleep for update interval
-            self.msleep(self.update_interval)
+            # Sleep for whatever is left of the update interval, so slow
+            # acquisitions don't stretch the frame period to RTT + interval
+            elapsed_ms = (time.perf_counter() - cycle_start) * 1000
+            self.msleep(max(0, int(self.update_interval - elapsed_ms)))
 
         logger.info("Live view worker thread stopped")
 
@@ -117,39 +170,45 @@ class LiveViewWorker(QThread):
 
         waveforms = []
         valid_waveforms = []
-        supported_channels = self.scope.supported_channels if hasattr(self.scope, "supported_channels") else range(1, 5)
+
+        # Nothing was enabled on the last probe - don't re-query every frame
+        if time.monotonic() < self._idle_until:
+            return []
 
         # Emit status: checking channels
         self.status_update.emit("Checking enabled channels...")
 
-        enabled_channels = []
-        for ch_num in supported_channels:
-            try:
-                channel = getattr(self.scope, f"channel{ch_num}", None)
-                if channel is not None and channel.enabled:
-                    enabled_channels.append(ch_num)
-            except Exception:
-                continue
+        enabled_channels = self.scope.get_enabled_channels()
 
         if not enabled_channels:
+            self._idle_until = time.monotonic() + self.idle_probe_interval
             self.status_update.emit("No enabled channels")
             return []
 
-        # Acquire from each enabled channel
-        for ch_num in enabled_channels:
-            try:
-                self.status_update.emit(f"Acquiring CH{ch_num}...")
-                logger.debug(f"Worker acquiring waveform from channel {ch_num}")
-                waveform = self.scope.get_waveform(ch_num)
-                if waveform:
-                    waveforms.append(waveform)
-                    logger.debug(f"Worker got {len(waveform.voltage)} samples from CH{ch_num}")
-
-            except Exception as e:
-                # Log at WARNING level so users can see acquisition errors
-                logger.warning(f"Worker error acquiring CH{ch_num}: {e}")
-                self.status_update.emit(f"Error on CH{ch_num}: {str(e)[:40]}")
-                continue
+        # Refill the current buffer set unless the GUI still holds it
+        if self._buffer_index in self._in_flight:
+            self._frame_buffer_index = None
+            buffers: Dict[int, np.ndarray] = {}
+        else:
+            self._frame_buffer_index = self._buffer_index
+            buffers = self._buffers[self._buffer_index]
+
+        # Acquire all enabled channels (settings are read in one compound query).
+        # A channel that fails is reported and skipped; the others still update.
+        channels_str = ", ".join(f"CH{ch_num}" for ch_num in enabled_channels)
+        try:
+            self.status_update.emit(f"Acquiring {channels_str}...")
+            logger.debug(f"Worker acquiring waveforms from channels {enabled_channels}")
+            out = {ch_num: buffers.get(ch_num, np.empty(0, dtype=self.buffer_dtype)) for ch_num in enabled_channels}
+            waveforms = self.scope.get_waveforms(enabled_channels, out, on_error=self._report_channel_error)
+            for waveform in waveforms:
+                buffers[waveform.channel] = waveform.voltage
+                logger.debug(f"Worker got {len(waveform.voltage)} samples from CH{waveform.channel}")
+
+        except Exception as e:
+            # Log at WARNING level so users can see acquisition errors
+            logger.warning(f"Worker error acquiring {channels_str}: {e}")
+            self.status_update.emit(f"Error on {channels_str}: {str(e)[:40]}")
 
         # Validate all acquired waveforms before emitting
         if waveforms:
@@ -172,8 +231,65 @@ class LiveViewWorker(QThread):
 
         return valid_waveforms
 
+    def _report_channel_error(self, ch_num: int, error: Exception):
+        """Report a channel whose waveform download failed.
+
+        Args:
+            ch_num: Channel number
+            error: Exception raised while acquiring the channel
+        """
+        # Log at WARNING level so users can see acquisition errors
+        logger.warning(f"Worker error acquiring CH{ch_num}: {error}")
+        self.status_update.emit(f"Error on CH{ch_num}: {str(error)[:40]}")
+
+    def frame_displayed(self):
+        """Release the buffers of the previously displayed frame.
+
+        Called from the GUI thread each time a new frame has been plotted.
+        The newest frame stays on screen, so only the frame before it is
+        handed back to the worker for reuse.
+        """
+        self._frames_displayed += 1
+        if self._frames_displayed > 1 and self._in_flight:
+            self._in_flight.popleft()
+        self._displayed.set()
+
+    def frame_dropped(self):
+        """Release the buffers of a frame that was discarded without being drawn.
+
+        Called from the GUI thread instead of frame_displayed() for a frame
+        it drops (e.g. while paused). The frame still on screen keeps its
+        buffers; only the dropped frame's own entry is removed.
+        """
+        self._frames_displayed += 1
+        if self._in_flight:
+            self._in_flight.pop()
+        self._displayed.set()
+
+    @property
+    def paused(self) -> bool:
+        """Whether acquisition is paused (set by the GUI while the display is hidden)."""
+        return not self._resume.is_set()
+
+    @paused.setter
+    def paused(self, paused: bool):
+        if paused:
+            self._resume.clear()
+        else:
+            self._resume.set()
+
+    def invalidate_enabled_channels(self):
+        """Probe channel enable states on the next frame.
+
+        Call after actions that may enable channels (e.g. auto setup) so live
+        view doesn't wait out idle_probe_interval.
+        """
+        self._idle_until = 0.0
+
     def stop(self):
         """Stop the worker thread."""
         logger.info("Stopping live view worker...")
         self.running = False
+        self._resume.set()  # Wake the run loop if paused
+        self._displayed.set()  # ...or waiting for the GUI to draw a frame
         self.wait(2000)  # Wait up to 2 seconds for thread to finish
@@ -1,16 +1,36 @@
 """Main window for Siglent oscilloscope control GUI."""
 
+import functools
+import inspect
 import logging
-from typing import TYPE_CHECKING, Optional
+from datetime import datetime
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple
 
 import numpy as np
 
 if TYPE_CHECKING:
     from scpi_control.gui.vnc_window import VNCWindow
 
-from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtCore import QEvent, Qt, QThreadPool, QTimer
 from PyQt6.QtGui import QAction
-from PyQt6.QtWidgets import QFileDialog, QGroupBox, QHBoxLayout, QInputDialog, QMainWindow, QMessageBox, QProgressDialog, QPushButton, QSplitter, QStatusBar, QTabWidget, QVBoxLayout, QWidget
+from PyQt6.QtWidgets import (
+    QDialog,
+    QDockWidget,
+    QFileDialog,
+    QGroupBox,
+    QInputDialog,
+    QListWidget,
+    QListWidgetItem,
+    QMainWindow,
+    QMessageBox,
+    QProgressDialog,
+    QPushButton,
+    QSplitter,
+    QStatusBar,
+    QTabWidget,
+    QVBoxLayout,
+    QWidget,
+)
 
 from scpi_control import DataLogger, Oscilloscope, PowerSupply
 from scpi_control.exceptions import SiglentConnectionError, SiglentError
@@ -30,8 +50,10 @@ except ImportError:
     logger.warning("PyQtGraph not available, using matplotlib (install with: pip install 'Siglent-Oscilloscope[gui]')")
 from scpi_control.gui.connection_manager import ConnectionManager
 from scpi_control.gui.live_view_worker import LiveViewWorker
+from scpi_control.gui.background_task import BackgroundTask
 from scpi_control.gui.waveform_capture_worker import WaveformCaptureWorker
 from scpi_control.gui.widgets.channel_control import ChannelControl
+from scpi_control.gui.widgets.connect_dialog import ConnectDialog
 from scpi_control.gui.widgets.cursor_panel import CursorPanel
 from scpi_control.gui.widgets.error_dialog import DetailedErrorDialog
 from scpi_control.gui.widgets.fft_display import FFTDisplay
@@ -51,14 +73,56 @@ from scpi_control.reference_waveform import ReferenceWaveform
 logger = logging.getLogger(__name__)
 
 
+def requires_scope(error_message: str, error_title: str = "Error"):
+    """Decorator for MainWindow slots that need a connected oscilloscope.
+
+    Scope-dependent actions are disabled while disconnected, so a call without
+    a scope is silently ignored. Any SiglentError raised by the slot is
+    reported through MainWindow._report_error().
+    Extra arguments emitted by Qt signals (e.g. ``triggered(bool)``) are
+    dropped when the slot does not accept them.
+
+    Args:
+        error_message: Message prefix reported when the slot raises SiglentError
+        error_title: Title of the error report
+    """
+
+    def decorator(func):
+        params = list(inspect.signature(func).parameters.values())[1:]
+        accepts_varargs = any(p.kind == p.VAR_POSITIONAL for p in params)
+        max_args = None if accepts_varargs else len(params)
+
+        @functools.wraps(func)
+        def wrapper(self, *args):
+            if not self.scope:
+                logger.debug(f"Ignoring {func.__name__}: no oscilloscope connected")
+                return None
+            try:
+                return func(self, *args[:max_args])
+            except SiglentError as e:
+                logger.error(f"{error_message}: {e}")
+                self._report_error(error_title, f"{error_message}:\n{str(e)}")
+                return None
+
+        return wrapper
+
+    return decorator
+
+
 class MainWindow(QMainWindow):
     """Main application window for oscilloscope control."""
 
+    # Maximum number of entries kept in the error dock
+    MAX_ERROR_LOG_ENTRIES = 500
+
     def __init__(self):
         """Initialize main window."""
         super().__init__()
 
         self.scope: Optional[Oscilloscope] = None
+        # Oscilloscope instances by (host, port), reused when reconnecting
+        self._scope_cache: Dict[Tuple[str, int], Oscilloscope] = {}
+        self._device_model: Optional[str] = None  # Model of the connected scope
         self.psu: Optional[PowerSupply] = None
         self.daq: Optional[DataLogger] = None
         self.is_live_view = False
@@ -66,9 +130,19 @@ class MainWindow(QMainWindow):
         self.capture_worker: Optional[WaveformCaptureWorker] = None
         self.progress_dialog: Optional[QProgressDialog] = None
 
+        # Runs one-shot scope operations (run/stop/auto setup) off the GUI
+        # thread. One thread, since the scope has a single SCPI connection.
+        self._io_pool = QThreadPool(self)
+        self._io_pool.setMaxThreadCount(1)
+        # Pending tasks, kept alive until their result signal has been handled
+        self._scpi_tasks: set = set()
+
         # Connection manager
         self.connection_manager = ConnectionManager()
 
+        # Oscilloscope connect dialog (reused for every connect attempt)
+        self.connect_dialog = ConnectDialog("Connect to Oscilloscope", "Enter oscilloscope IP address:", self)
+
         # Reference waveform manager
         self.reference_manager = ReferenceWaveform()
 
@@ -94,6 +168,8 @@ class MainWindow(QMainWindow):
         self.vnc_window: Optional[VNCWindow] = None
 
         self._init_ui()
+        self._create_error_dock()
+        self._build_actions()
         self._create_menus()
         self._create_toolbar()
         self._create_status_bar()
@@ -106,19 +182,13 @@ class MainWindow(QMainWindow):
         # Set wider rectangular window (1600x850) for better waveform display
         self.setGeometry(100, 100, 1600, 850)
 
-        # Create central widget
-        central_widget = QWidget()
-        self.setCentralWidget(central_widget)
-
-        # Main layout
-        main_layout = QHBoxLayout(central_widget)
-
-        # Create splitter for resizable panels
+        # The splitter is the central widget (resizable control/display panels)
         splitter = QSplitter(Qt.Orientation.Horizontal)
 
         # IMPORTANT: Create waveform display first, before control panel
         # because control panel needs to connect signals to it
         self.waveform_display = WaveformDisplay()
+        self.waveform_display.frames_presented.connect(self._on_frames_presented)
 
         # Left panel - Controls
         left_panel = self._create_control_panel()
@@ -132,17 +202,14 @@ class MainWindow(QMainWindow):
         # With 1600px width: ~400px controls, ~1200px display
         splitter.setSizes([400, 1200])
 
-        main_layout.addWidget(splitter)
+        self.setCentralWidget(splitter)
 
     def _create_control_panel(self) -> QWidget:
         """Create the left control panel.
 
         Returns:
-            Control panel widget
+            Control panel widget (the control tab widget itself)
         """
-        panel = QWidget()
-        layout = QVBoxLayout(panel)
-
         # Create tab widget for controls
         self.tabs = QTabWidget()
 
@@ -243,9 +310,7 @@ class MainWindow(QMainWindow):
         self.data_logger_control.error_occurred.connect(self._on_daq_error)
         self.tabs.addTab(self.data_logger_control, "Data Logger")
 
-        layout.addWidget(self.tabs)
-
-        return panel
+        return self.tabs
 
     def _create_display_panel(self) -> QWidget:
         """Create the right display panel.
@@ -253,10 +318,6 @@ class MainWindow(QMainWindow):
         Returns:
             Display panel widget
         """
-        panel = QWidget()
-        layout = QVBoxLayout(panel)
-        layout.setContentsMargins(0, 0, 0, 0)
-
         # Waveform display (already created in _init_ui)
         waveform_group = QGroupBox("Waveform Display")
         waveform_layout = QVBoxLayout(waveform_group)
@@ -265,9 +326,88 @@ class MainWindow(QMainWindow):
         # Use the waveform_display already created in _init_ui
         waveform_layout.addWidget(self.waveform_display)
 
-        layout.addWidget(waveform_group)
+        return waveform_group
+
+    def _build_actions(self):
+        """Create the actions shared by the menu bar and the toolbar."""
+        self.act_connect = QAction("&Connect to Oscilloscope...", self)
+        self.act_connect.setShortcut("Ctrl+O")
+        self.act_connect.setShortcutContext(Qt.ShortcutContext.ApplicationShortcut)
+        self.act_connect.triggered.connect(self._on_connect)
+
+        self.act_disconnect = QAction("&Disconnect Oscilloscope", self)
+        self.act_disconnect.triggered.connect(self._on_disconnect)
+
+        self.act_run = QAction("&Run", self)
+        self.act_run.setShortcut("F5")
+        self.act_run.setShortcutContext(Qt.ShortcutContext.ApplicationShortcut)
+        self.act_run.triggered.connect(self._on_run)
+
+        self.act_stop = QAction("&Stop", self)
+        self.act_stop.setShortcut("F6")
+        self.act_stop.setShortcutContext(Qt.ShortcutContext.ApplicationShortcut)
+        self.act_stop.triggered.connect(self._on_stop)
+
+        self.act_single = QAction("S&ingle", self)
+        self.act_single.setShortcut("F7")
+        self.act_single.setShortcutContext(Qt.ShortcutContext.ApplicationShortcut)
+        self.act_single.triggered.connect(self._on_single)
+
+        self.act_capture = QAction("&Capture Waveform", self)
+        self.act_capture.setShortcut("F8")
+        self.act_capture.setShortcutContext(Qt.ShortcutContext.ApplicationShortcut)
+        self.act_capture.triggered.connect(self._on_capture_waveform)
+
+        self.live_view_action = QAction("&Live View", self)
+        self.live_view_action.setCheckable(True)
+        self.live_view_action.setShortcut("Ctrl+R")
+        self.live_view_action.setShortcutContext(Qt.ShortcutContext.ApplicationShortcut)
+        self.live_view_action.toggled.connect(self._on_toggle_live_view)
+
+        self.act_auto_setup = QAction("&Auto Setup", self)
+        self.act_auto_setup.triggered.connect(self._on_auto_setup)
+
+        self.act_save_waveform = QAction("Save &Waveform...", self)
+        self.act_save_waveform.setShortcut("Ctrl+S")
+        self.act_save_waveform.setShortcutContext(Qt.ShortcutContext.ApplicationShortcut)
+        self.act_save_waveform.triggered.connect(self._on_save_waveform)
+
+        # Toolbar buttons show the shorter icon text
+        self.act_screenshot = QAction("Save S&creenshot...", self)
+        self.act_screenshot.setIconText("Screenshot")
+        self.act_screenshot.setToolTip("Save screenshot from oscilloscope display")
+        self.act_screenshot.setShortcut("Ctrl+Shift+S")
+        self.act_screenshot.setShortcutContext(Qt.ShortcutContext.ApplicationShortcut)
+        self.act_screenshot.triggered.connect(self._on_save_screenshot)
+
+        self.act_vnc = QAction("Open &Scope Display (VNC)...", self)
+        self.act_vnc.setIconText("Open Scope Display")
+        self.act_vnc.setShortcut("Ctrl+D")
+        self.act_vnc.setShortcutContext(Qt.ShortcutContext.ApplicationShortcut)
+        self.act_vnc.triggered.connect(self._on_open_vnc_window)
+
+        # Nothing to run/capture until an oscilloscope is connected
+        self._set_scope_actions_enabled(False)
+
+    def _set_scope_actions_enabled(self, enabled: bool):
+        """Enable or disable all actions that need a connected oscilloscope.
+
+        Capture stays disabled while live view is running, since both would
+        compete for the same SCPI connection. Connect is only enabled while
+        disconnected.
 
-        return panel
+        Args:
+            enabled: True when an oscilloscope is connected
+        """
+        for action in (self.act_disconnect, self.act_run, self.act_stop, self.act_single, self.act_auto_setup, self.act_save_waveform, self.act_screenshot, self.live_view_action):
+            action.setEnabled(enabled)
+        self.act_capture.setEnabled(enabled and not self.is_live_view)
+        self.act_connect.setEnabled(not enabled)
+
+        if not enabled and self.live_view_action.isChecked():
+            self.live_view_action.blockSignals(True)
+            self.live_view_action.setChecked(False)
+            self.live_view_action.blockSignals(False)
 
     def _create_menus(self):
         """Create menu bar."""
@@ -276,20 +416,15 @@ class MainWindow(QMainWindow):
         # File menu
         file_menu = menubar.addMenu("&File")
 
-        connect_action = QAction("&Connect to Oscilloscope...", self)
-        connect_action.setShortcut("Ctrl+O")
-        connect_action.triggered.connect(self._on_connect)
-        file_menu.addAction(connect_action)
-
-        disconnect_action = QAction("&Disconnect Oscilloscope", self)
-        disconnect_action.triggered.connect(self._on_disconnect)
-        file_menu.addAction(disconnect_action)
+        file_menu.addAction(self.act_connect)
+        file_menu.addAction(self.act_disconnect)
 
         file_menu.addSeparator()
 
         # Power Supply menu items
         psu_connect_action = QAction("Connect to &Power Supply...", self)
         psu_connect_action.setShortcut("Ctrl+P")
+        psu_connect_action.setShortcutContext(Qt.ShortcutContext.ApplicationShortcut)
         psu_connect_action.triggered.connect(self._on_psu_connect)
         file_menu.addAction(psu_connect_action)
 
@@ -302,6 +437,7 @@ class MainWindow(QMainWindow):
         # Data Logger/DAQ menu items
         daq_connect_action = QAction("Connect to &Data Logger...", self)
         daq_connect_action.setShortcut("Ctrl+L")
+        daq_connect_action.setShortcutContext(Qt.ShortcutContext.ApplicationShortcut)
         daq_connect_action.triggered.connect(self._on_daq_connect)
         file_menu.addAction(daq_connect_action)
 
@@ -317,68 +453,39 @@ class MainWindow(QMainWindow):
 
         file_menu.addSeparator()
 
-        save_waveform_action = QAction("Save &Waveform...", self)
-        save_waveform_action.setShortcut("Ctrl+S")
-        save_waveform_action.triggered.connect(self._on_save_waveform)
-        file_menu.addAction(save_waveform_action)
+        file_menu.addAction(self.act_save_waveform)
 
-        save_screenshot_action = QAction("Save S&creenshot...", self)
-        save_screenshot_action.setShortcut("Ctrl+Shift+S")
-        save_screenshot_action.triggered.connect(self._on_save_screenshot)
-        file_menu.addAction(save_screenshot_action)
+        file_menu.addAction(self.act_screenshot)
 
         file_menu.addSeparator()
 
         exit_action = QAction("E&xit", self)
         exit_action.setShortcut("Ctrl+Q")
+        exit_action.setShortcutContext(Qt.ShortcutContext.ApplicationShortcut)
         exit_action.triggered.connect(self.close)
         file_menu.addAction(exit_action)
 
         # Acquisition menu
         acq_menu = menubar.addMenu("&Acquisition")
 
-        run_action = QAction("&Run", self)
-        run_action.setShortcut("F5")
-        run_action.triggered.connect(self._on_run)
-        acq_menu.addAction(run_action)
-
-        stop_action = QAction("&Stop", self)
-        stop_action.setShortcut("F6")
-        stop_action.triggered.connect(self._on_stop)
-        acq_menu.addAction(stop_action)
-
-        single_action = QAction("S&ingle", self)
-        single_action.setShortcut("F7")
-        single_action.triggered.connect(self._on_single)
-        acq_menu.addAction(single_action)
+        acq_menu.addAction(self.act_run)
+        acq_menu.addAction(self.act_stop)
+        acq_menu.addAction(self.act_single)
 
         acq_menu.addSeparator()
 
-        capture_action = QAction("&Capture Waveform", self)
-        capture_action.setShortcut("F8")
-        capture_action.triggered.connect(self._on_capture_waveform)
-        acq_menu.addAction(capture_action)
+        acq_menu.addAction(self.act_capture)
 
-        live_view_action = QAction("&Live View", self)
-        live_view_action.setCheckable(True)
-        live_view_action.setShortcut("Ctrl+R")
-        live_view_action.toggled.connect(self._on_toggle_live_view)
-        acq_menu.addAction(live_view_action)
-        self.live_view_action = live_view_action  # Store reference for external access
+        acq_menu.addAction(self.live_view_action)
 
         # View menu
         view_menu = menubar.addMenu("&View")
 
-        vnc_action = QAction("Open &Scope Display (VNC)...", self)
-        vnc_action.setShortcut("Ctrl+D")
-        vnc_action.triggered.connect(self._on_open_vnc_window)
-        view_menu.addAction(vnc_action)
+        view_menu.addAction(self.act_vnc)
 
         view_menu.addSeparator()
 
-        auto_setup_action = QAction("&Auto Setup", self)
-        auto_setup_action.triggered.connect(self._on_auto_setup)
-        view_menu.addAction(auto_setup_action)
+        view_menu.addAction(self.act_auto_setup)
 
         view_menu.addSeparator()
 
@@ -397,11 +504,19 @@ class MainWindow(QMainWindow):
         reset_zoom_action.triggered.connect(self._on_reset_zoom)
         view_menu.addAction(reset_zoom_action)
 
+        view_menu.addSeparator()
+
+        # Show/hide the non-blocking error log
+        error_log_action = self._error_dock.toggleViewAction()
+        error_log_action.setText("&Error Log")
+        view_menu.addAction(error_log_action)
+
         # Help menu
         help_menu = menubar.addMenu("&Help")
 
         shortcuts_action = QAction("&Keyboard Shortcuts", self)
         shortcuts_action.setShortcut("F1")
+        shortcuts_action.setShortcutContext(Qt.ShortcutContext.ApplicationShortcut)
         shortcuts_action.triggered.connect(self._on_show_shortcuts)
         help_menu.addAction(shortcuts_action)
 
@@ -436,7 +551,7 @@ class MainWindow(QMainWindow):
             }
         """
         )
-        connect_btn.clicked.connect(self._on_connect)
+        connect_btn.clicked.connect(self.act_connect.trigger)
         toolbar.addWidget(connect_btn)
 
         disconnect_btn = QPushButton("Disconnect")
@@ -459,43 +574,82 @@ class MainWindow(QMainWindow):
             }
         """
         )
-        disconnect_btn.clicked.connect(self._on_disconnect)
+        disconnect_btn.clicked.connect(self.act_disconnect.trigger)
         toolbar.addWidget(disconnect_btn)
 
         toolbar.addSeparator()
 
-        run_action = QAction("Run", self)
-        run_action.triggered.connect(self._on_run)
-        toolbar.addAction(run_action)
-
-        stop_action = QAction("Stop", self)
-        stop_action.triggered.connect(self._on_stop)
-        toolbar.addAction(stop_action)
-
-        single_action = QAction("Single", self)
-        single_action.triggered.connect(self._on_single)
-        toolbar.addAction(single_action)
+        toolbar.addAction(self.act_run)
+        toolbar.addAction(self.act_stop)
+        toolbar.addAction(self.act_single)
 
         toolbar.addSeparator()
 
-        capture_action = QAction("Capture Waveform", self)
-        capture_action.triggered.connect(self._on_capture_waveform)
-        toolbar.addAction(capture_action)
-
-        screenshot_action = QAction("Screenshot", self)
-        screenshot_action.setToolTip("Save screenshot from oscilloscope display")
-        screenshot_action.triggered.connect(self._on_save_screenshot)
-        toolbar.addAction(screenshot_action)
+        toolbar.addAction(self.act_capture)
+        toolbar.addAction(self.act_screenshot)
 
         toolbar.addSeparator()
 
-        vnc_action = QAction("Open Scope Display", self)
-        vnc_action.triggered.connect(self._on_open_vnc_window)
-        toolbar.addAction(vnc_action)
+        toolbar.addAction(self.act_vnc)
 
     def _create_status_bar(self):
         """Create status bar."""
-        self.statusBar().showMessage("Not connected")
+        # Cache the status bar - it is updated on every live view frame
+        self._status = self.statusBar()
+        self._status.showMessage("Not connected")
+
+    def _set_status(self, message: str):
+        """Show a status bar message unless it is already displayed.
+
+        Live view reports the same status on every frame; skipping identical
+        messages avoids repainting the status bar each time.
+
+        Args:
+            message: Message to show
+        """
+        if message != self._status.currentMessage():
+            self._status.showMessage(message)
+
+    def _create_error_dock(self):
+        """Create the dockable error log (hidden until first opened from the View menu)."""
+        self._error_list = QListWidget()
+
+        self._error_dock = QDockWidget("Errors", self)
+        self._error_dock.setObjectName("ErrorDock")
+        self._error_dock.setWidget(self._error_list)
+        self.addDockWidget(Qt.DockWidgetArea.BottomDockWidgetArea, self._error_dock)
+        self._error_dock.hide()
+
+    def _report_error(self, title: str, message: str, modal: bool = True, details: Optional[str] = None):
+        """Report an error without stalling acquisition.
+
+        Every error is appended to the error dock and flashed on the status bar.
+        A modal dialog is only shown when ``modal`` is True (user-initiated action)
+        and live view is not running, so transient LAN hiccups never block the
+        live acquisition loop behind a dialog.
+
+        Args:
+            title: Short error title (e.g., "Capture Error")
+            message: Error message
+            modal: Whether a modal dialog may be shown for this error
+            details: Optional technical details shown as the log entry tooltip
+        """
+        timestamp = datetime.now().strftime("%H:%M:%S")
+        item = QListWidgetItem(f"[{timestamp}] {title}: {' '.join(message.split())}")
+        if details:
+            item.setToolTip(details)
+        self._error_list.addItem(item)
+
+        # Keep the log bounded during long live-view sessions
+        while self._error_list.count() > self.MAX_ERROR_LOG_ENTRIES:
+            self._error_list.takeItem(0)
+        self._error_list.scrollToBottom()
+
+        brief_msg = message.splitlines()[0] if message else ""
+        self._status.showMessage(f"{title}: {brief_msg}", 5000)
+
+        if modal and not self.is_live_view:
+            QMessageBox.critical(self, title, message)
 
     def _update_recent_connections_menu(self):
         """Update the recent connections menu."""
@@ -548,15 +702,17 @@ class MainWindow(QMainWindow):
 
     def _on_connect(self):
         """Handle connect action."""
-        # Get default IP from last connection
-        last_connection = self.connection_manager.get_last_connection()
-        default_ip = last_connection.get("host", "192.168.1.100") if last_connection else "192.168.1.100"
-
-        # Get IP address from user
-        ip, ok = QInputDialog.getText(self, "Connect to Oscilloscope", "Enter oscilloscope IP address:", text=default_ip)
-
-        if ok and ip:
-            self._connect_to_scope(ip)
+        # Offer recent hosts, defaulting to the last connection
+        recent_hosts = []
+        for connection in self.connection_manager.get_recent_connections():
+            host = connection.get("host")
+            if host and host not in recent_hosts:
+                recent_hosts.append(host)
+        self.connect_dialog.set_recent_hosts(recent_hosts, default=recent_hosts[0] if recent_hosts else "192.168.1.100")
+
+        # Get IP address from user (dialog only accepts a valid IP/hostname)
+        if self.connect_dialog.exec() == QDialog.DialogCode.Accepted:
+            self._connect_to_scope(self.connect_dialog.host())
 
     def _connect_to_scope(self, ip: str, port: int = 5024):
         """Connect to oscilloscope at specified IP and port.
@@ -565,13 +721,19 @@ class MainWindow(QMainWindow):
             ip: IP address or hostname
             port: TCP port (default: 5024)
         """
+        # Connecting blocks until the socket connects or times out - connect
+        # requests queued up in the meantime find the action disabled
+        self.act_connect.setEnabled(False)
         try:
-            self.statusBar().showMessage(f"Connecting to {ip}...")
-            self.scope = Oscilloscope(ip, port)
+            self._set_status(f"Connecting to {ip}...")
+            self.scope = self._scope_cache.get((ip, port))
+            if self.scope is None:
+                self.scope = self._scope_cache[(ip, port)] = Oscilloscope(ip, port)
             self.scope.connect()
 
             device_info = self.scope.device_info
             model = device_info.get("model", "Unknown") if device_info else "Unknown"
+            self._device_model = model
 
             # Pass scope reference to all control widgets
             self.channel_control.set_scope(self.scope)
@@ -597,8 +759,10 @@ class MainWindow(QMainWindow):
                 status_msg = f"Connected to {model} at {ip}"
                 info_msg = f"Successfully connected to {model}\nIP: {ip}"
 
-            self.statusBar().showMessage(status_msg)
-            QMessageBox.information(self, "Connected", info_msg)
+            self._set_status(status_msg)
+            self._set_scope_actions_enabled(True)
+            # Defer the modal so the status bar and empty waveform view paint first
+            QTimer.singleShot(0, lambda: QMessageBox.information(self, "Connected", info_msg))
             logger.info(f"Connected to oscilloscope at {ip}")
 
             # Add to recent connections
@@ -606,10 +770,13 @@ class MainWindow(QMainWindow):
             self._update_recent_connections_menu()
 
         except (SiglentConnectionError, SiglentError) as e:
-            self.statusBar().showMessage("Connection failed")
-            QMessageBox.critical(self, "Connection Error", f"Failed to connect to oscilloscope:\n{str(e)}")
+            self._report_error("Connection Error", f"Failed to connect to oscilloscope:\n{str(e)}")
             logger.error(f"Connection failed: {e}")
             self.scope = None
+            self._device_model = None
+            self._set_scope_actions_enabled(False)
+        finally:
+            self.act_connect.setEnabled(self.scope is None or not self.scope.is_connected)
 
     def _on_disconnect(self):
         """Handle disconnect action."""
@@ -622,8 +789,12 @@ class MainWindow(QMainWindow):
                 self.live_view_worker.stop()
                 self.live_view_worker = None
 
+            # Let a pending run/stop/auto setup finish before closing the socket
+            self._io_pool.waitForDone(5000)
             self.scope.disconnect()
             self.scope = None
+            self._device_model = None
+            self._set_scope_actions_enabled(False)
 
             # Clear scope reference from all control widgets
             self.channel_control.set_scope(None)
@@ -634,10 +805,8 @@ class MainWindow(QMainWindow):
             if hasattr(self, "vector_graphics_panel"):
                 self.vector_graphics_panel.set_scope(None)
 
-            self.statusBar().showMessage("Disconnected")
+            self._set_status("Disconnected")
             logger.info("Disconnected from oscilloscope")
-        else:
-            QMessageBox.warning(self, "Not Connected", "No oscilloscope connected")
 
     def _on_psu_connect(self):
         """Handle PSU connect action."""
@@ -655,7 +824,7 @@ class MainWindow(QMainWindow):
             port: TCP port (default: 5024)
         """
         try:
-            self.statusBar().showMessage(f"Connecting to PSU at {ip}...")
+            self._set_status(f"Connecting to PSU at {ip}...")
             self.psu = PowerSupply(ip, port)
             self.psu.connect()
 
@@ -682,7 +851,7 @@ class MainWindow(QMainWindow):
                 status_msg = f"PSU Connected to {model} at {ip}"
                 info_msg = f"Successfully connected to {model}\nIP: {ip}"
 
-            self.statusBar().showMessage(status_msg)
+            self._set_status(status_msg)
             QMessageBox.information(self, "PSU Connected", info_msg)
             logger.info(f"Connected to power supply at {ip}")
 
@@ -693,7 +862,7 @@ class MainWindow(QMainWindow):
                     break
 
         except (SiglentConnectionError, SiglentError) as e:
-            self.statusBar().showMessage("PSU connection failed")
+            self._set_status("PSU connection failed")
             QMessageBox.critical(self, "PSU Connection Error", f"Failed to connect to power supply:\n{str(e)}")
             logger.error(f"PSU connection failed: {e}")
             self.psu = None
@@ -707,7 +876,7 @@ class MainWindow(QMainWindow):
             # Clear PSU reference from control widget
             self.psu_control.set_psu(None)
 
-            self.statusBar().showMessage("PSU Disconnected")
+            self._set_status("PSU Disconnected")
             logger.info("Disconnected from power supply")
         else:
             QMessageBox.warning(self, "Not Connected", "No power supply connected")
@@ -733,7 +902,7 @@ class MainWindow(QMainWindow):
             port: TCP port (default: 5024)
         """
         try:
-            self.statusBar().showMessage(f"Connecting to DAQ at {ip}...")
+            self._set_status(f"Connecting to DAQ at {ip}...")
             self.daq = DataLogger(ip, port)
             self.daq.connect()
 
@@ -754,7 +923,7 @@ class MainWindow(QMainWindow):
                 status_msg = f"DAQ Connected to {model} at {ip}"
                 info_msg = f"Successfully connected to {model}\nIP: {ip}"
 
-            self.statusBar().showMessage(status_msg)
+            self._set_status(status_msg)
             QMessageBox.information(self, "DAQ Connected", info_msg)
             logger.info(f"Connected to data logger at {ip}")
 
@@ -765,7 +934,7 @@ class MainWindow(QMainWindow):
                     break
 
         except (SiglentConnectionError, SiglentError) as e:
-            self.statusBar().showMessage("DAQ connection failed")
+            self._set_status("DAQ connection failed")
             QMessageBox.critical(
                 self,
                 "DAQ Connection Error",
@@ -783,7 +952,7 @@ class MainWindow(QMainWindow):
             # Clear DAQ reference from control widget
             self.data_logger_control.set_daq(None)
 
-            self.statusBar().showMessage("DAQ Disconnected")
+            self._set_status("DAQ Disconnected")
             logger.info("Disconnected from data logger")
         else:
             QMessageBox.warning(self, "Not Connected", "No data logger connected")
@@ -801,54 +970,67 @@ class MainWindow(QMainWindow):
         dialog = DetailedErrorDialog(error_info, self)
         dialog.exec()
 
+    def _run_scpi_task(self, func: Callable, action: QAction, done_message: str, error_message: str, on_finished: Optional[Callable] = None):
+        """Run a blocking scope call on the SCPI I/O pool.
+
+        The triggering action is disabled until the call completes, so it
+        cannot be queued up repeatedly while the scope is busy.
+
+        Args:
+            func: Scope method to call (no arguments)
+            action: Action that started the call
+            done_message: Status message shown on success
+            error_message: Message prefix reported on failure
+            on_finished: Optional callable run on the GUI thread after success
+        """
+
+        def finished(_result):
+            self._scpi_tasks.discard(task)
+            action.setEnabled(self.scope is not None)
+            if on_finished:
+                on_finished()
+            self._set_status(done_message)
+            logger.info(done_message)
+
+        def failed(message: str):
+            self._scpi_tasks.discard(task)
+            action.setEnabled(self.scope is not None)
+            self._report_error("Error", f"{error_message}:\n{message}")
+
+        task = BackgroundTask(func)
+        task.setAutoDelete(False)  # Lifetime managed through self._scpi_tasks
+        task.signals.finished.connect(finished)
+        task.signals.error_occurred.connect(failed)
+        self._scpi_tasks.add(task)
+        action.setEnabled(False)
+        self._io_pool.start(task)
+
+    @requires_scope("Failed to start acquisition")
     def _on_run(self):
         """Handle run action."""
-        if self.scope:
-            try:
-                self.scope.run()
-                self.statusBar().showMessage("Acquisition running (AUTO trigger)")
-                logger.info("Acquisition started")
-            except SiglentError as e:
-                QMessageBox.critical(self, "Error", f"Failed to start acquisition:\n{str(e)}")
-        else:
-            QMessageBox.warning(self, "Not Connected", "No oscilloscope connected")
+        self._run_scpi_task(self.scope.run, self.act_run, "Acquisition running (AUTO trigger)", "Failed to start acquisition")
 
+    @requires_scope("Failed to stop acquisition")
     def _on_stop(self):
         """Handle stop action."""
-        if self.scope:
-            try:
-                self.scope.stop()
-                self.statusBar().showMessage("Acquisition stopped")
-                logger.info("Acquisition stopped")
-            except SiglentError as e:
-                QMessageBox.critical(self, "Error", f"Failed to stop acquisition:\n{str(e)}")
-        else:
-            QMessageBox.warning(self, "Not Connected", "No oscilloscope connected")
+        self._run_scpi_task(self.scope.stop, self.act_stop, "Acquisition stopped", "Failed to stop acquisition")
 
+    @requires_scope("Failed to arm single trigger")
     def _on_single(self):
         """Handle single trigger action."""
-        if self.scope:
-            try:
-                self.scope.trigger_single()
-                self.statusBar().showMessage("Single trigger armed")
-                logger.info("Single trigger armed")
-            except SiglentError as e:
-                QMessageBox.critical(self, "Error", f"Failed to arm single trigger:\n{str(e)}")
-        else:
-            QMessageBox.warning(self, "Not Connected", "No oscilloscope connected")
+        self._run_scpi_task(self.scope.trigger_single, self.act_single, "Single trigger armed", "Failed to arm single trigger")
 
+    @requires_scope("Auto setup failed")
     def _on_auto_setup(self):
         """Handle auto setup action."""
-        if self.scope:
-            try:
-                self.statusBar().showMessage("Running auto setup...")
-                self.scope.auto_setup()
-                self.statusBar().showMessage("Auto setup complete")
-                logger.info("Auto setup complete")
-            except SiglentError as e:
-                QMessageBox.critical(self, "Error", f"Auto setup failed:\n{str(e)}")
-        else:
-            QMessageBox.warning(self, "Not Connected", "No oscilloscope connected")
+        self._set_status("Running auto setup...")
+        self._run_scpi_task(self.scope.auto_setup, self.act_auto_setup, "Auto setup complete", "Auto setup failed", on_finished=self._on_auto_setup_finished)
+
+    def _on_auto_setup_finished(self):
+        """Handle auto setup completion."""
+        if self.live_view_worker:
+            # Auto setup may have enabled channels
+            self.live_view_worker.invalidate_enabled_channels()
 
     def _on_open_vnc_window(self):
         """Handle opening VNC window."""
@@ -893,7 +1075,6 @@ class MainWindow(QMainWindow):
     def _on_save_screenshot(self):
         """Handle save screenshot action."""
         if not self.scope:
-            QMessageBox.warning(self, "Not Connected", "No oscilloscope connected")
             return
 
         try:
@@ -903,13 +1084,13 @@ class MainWindow(QMainWindow):
             filename, selected_filter = QFileDialog.getSaveFileName(self, "Save Screenshot", "screenshot.bmp", file_filter)
 
             if filename:
-                self.statusBar().showMessage("Capturing screenshot using SCDP...")
+                self._set_status("Capturing screenshot using SCDP...")
                 logger.info(f"Saving screenshot to {filename}")
 
                 # Capture and save screenshot (SCDP returns BMP format)
                 self.scope.screen_capture.save_screenshot(filename)
 
-                self.statusBar().showMessage(f"Screenshot saved to {filename}")
+                self._set_status(f"Screenshot saved to {filename}")
                 QMessageBox.information(
                     self,
                     "Screenshot Saved",
@@ -918,7 +1099,7 @@ class MainWindow(QMainWindow):
                 logger.info(f"Screenshot saved successfully to {filename}")
 
         except Exception as e:
-            self.statusBar().showMessage("Screenshot capture failed")
+            self._set_status("Screenshot capture failed")
             QMessageBox.critical(
                 self,
                 "Screenshot Error",
@@ -926,86 +1107,64 @@ class MainWindow(QMainWindow):
             )
             logger.error(f"Screenshot capture failed: {e}")
 
+    @requires_scope("Failed to start capture", error_title="Capture Error")
     def _on_capture_waveform(self):
         """Handle capture waveform action - uses background worker to prevent GUI freeze."""
-        if not self.scope:
-            QMessageBox.warning(self, "Not Connected", "No oscilloscope connected")
-            return
-
         # Don't allow new capture while one is in progress
         if self.capture_worker and self.capture_worker.isRunning():
             QMessageBox.warning(self, "Capture in Progress", "Please wait for current capture to complete")
             return
 
-        try:
-            logger.info("=== Capture Waveform Started ===")
+        logger.info("=== Capture Waveform Started ===")
 
-            # Get list of enabled channels
-            enabled_channels = []
-            supported_channels = self.scope.supported_channels if hasattr(self.scope, "supported_channels") else range(1, 5)
+        # Get list of enabled channels
+        enabled_channels = self.scope.get_enabled_channels()
+        logger.info(f"Enabled channels: {enabled_channels}")
 
-            for ch_num in supported_channels:
+        if not enabled_channels:
+            # Ask user if they want to enable channel 1
+            reply = QMessageBox.question(
+                self,
+                "No Channels Enabled",
+                "No channels are currently enabled.\n\nWould you like to enable Channel 1?",
+                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+            )
+            if reply == QMessageBox.StandardButton.Yes:
                 try:
-                    channel = getattr(self.scope, f"channel{ch_num}", None)
-                    if channel:
-                        is_enabled = channel.enabled
-                        logger.info(f"Channel {ch_num} enabled: {is_enabled}")
-                        if is_enabled:
-                            enabled_channels.append(ch_num)
-                except Exception as e:
-                    logger.warning(f"Could not check channel {ch_num} status: {e}")
-
-            logger.info(f"Enabled channels: {enabled_channels}")
+                    self.scope.channel1.enable()
+                    # Wait a bit for scope to process
+                    from PyQt6.QtCore import QThread
 
-            if not enabled_channels:
-                # Ask user if they want to enable channel 1
-                reply = QMessageBox.question(
-                    self,
-                    "No Channels Enabled",
-                    "No channels are currently enabled.\n\nWould you like to enable Channel 1?",
-                    QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-                )
-                if reply == QMessageBox.StandardButton.Yes:
-                    try:
-                        self.scope.channel1.enable()
-                        # Wait a bit for scope to process
-                        from PyQt6.QtCore import QThread
-
-                        QThread.msleep(100)
-                        enabled_channels = [1]
-                        logger.info("Enabled channel 1 for capture")
-                    except Exception as e:
-                        QMessageBox.critical(self, "Error", f"Could not enable channel 1:\n{str(e)}")
-                        logger.error(f"Failed to enable channel 1: {e}")
-                        return
-                else:
-                    logger.info("User cancelled capture")
+                    QThread.msleep(100)
+                    enabled_channels = [1]
+                    logger.info("Enabled channel 1 for capture")
+                except Exception as e:
+                    self._report_error("Error", f"Could not enable channel 1:\n{str(e)}")
+                    logger.error(f"Failed to enable channel 1: {e}")
                     return
+            else:
+                logger.info("User cancelled capture")
+                return
 
-            # Create progress dialog
-            self.progress_dialog = QProgressDialog("Initializing capture...", "Cancel", 0, 100, self)
-            self.progress_dialog.setWindowTitle("Capturing Waveforms")
-            self.progress_dialog.setWindowModality(Qt.WindowModality.WindowModal)
-            self.progress_dialog.setAutoClose(True)
-            self.progress_dialog.setMinimumDuration(0)  # Show immediately
-            self.progress_dialog.canceled.connect(self._on_capture_cancelled)
-
-            # Create and configure worker
-            self.capture_worker = WaveformCaptureWorker(self.scope, enabled_channels, self)
-            self.capture_worker.progress_update.connect(self._on_capture_progress)
-            self.capture_worker.waveforms_ready.connect(self._on_capture_complete)
-            self.capture_worker.capture_complete.connect(self._on_capture_finished)
-            self.capture_worker.error_occurred.connect(self._on_capture_error)
-
-            # Start capture in background thread
-            logger.info(f"Starting background capture for channels: {enabled_channels}")
-            self.statusBar().showMessage("Capturing waveforms...")
-            self.capture_worker.start()
-
-        except SiglentError as e:
-            self.statusBar().showMessage("Capture failed")
-            QMessageBox.critical(self, "Capture Error", f"Failed to start capture:\n{str(e)}")
-            logger.error(f"Waveform capture failed: {e}", exc_info=True)
+        # Create progress dialog
+        self.progress_dialog = QProgressDialog("Initializing capture...", "Cancel", 0, 100, self)
+        self.progress_dialog.setWindowTitle("Capturing Waveforms")
+        self.progress_dialog.setWindowModality(Qt.WindowModality.WindowModal)
+        self.progress_dialog.setAutoClose(True)
+        self.progress_dialog.setMinimumDuration(0)  # Show immediately
+        self.progress_dialog.canceled.connect(self._on_capture_cancelled)
+
+        # Create and configure worker
+        self.capture_worker = WaveformCaptureWorker(self.scope, enabled_channels, self)
+        self.capture_worker.progress_update.connect(self._on_capture_progress)
+        self.capture_worker.waveforms_ready.connect(self._on_capture_complete)
+        self.capture_worker.capture_complete.connect(self._on_capture_finished)
+        self.capture_worker.error_occurred.connect(self._on_capture_error)
+
+        # Start capture in background thread
+        logger.info(f"Starting background capture for channels: {enabled_channels}")
+        self._set_status("Capturing waveforms...")
+        self.capture_worker.start()
 
     def _on_capture_progress(self, message: str, percentage: int):
         """Handle progress updates from capture worker."""
@@ -1021,7 +1180,7 @@ class MainWindow(QMainWindow):
 
         logger.info(f"Displaying {len(waveforms)} captured waveform(s)...")
         self.waveform_display.plot_multiple_waveforms(waveforms)
-        self.statusBar().showMessage(f"Captured {len(waveforms)} waveform(s)")
+        self._set_status(f"Captured {len(waveforms)} waveform(s)")
 
     def _on_capture_finished(self, waveform_count: int):
         """Handle capture completion."""
@@ -1032,8 +1191,7 @@ class MainWindow(QMainWindow):
         """Handle capture errors from worker."""
         self._close_progress_dialog()
 
-        self.statusBar().showMessage("Capture failed")
-        QMessageBox.warning(self, "Capture Failed", error_message)
+        self._report_error("Capture Failed", error_message)
         logger.error(f"Capture error: {error_message}")
 
     def _on_capture_cancelled(self):
@@ -1042,7 +1200,7 @@ class MainWindow(QMainWindow):
         if self.capture_worker and self.capture_worker.isRunning():
             logger.info("User cancelled capture")
             self.capture_worker.cancel()
-            self.statusBar().showMessage("Capture cancelled")
+            self._set_status("Capture cancelled")
             self._close_progress_dialog()
 
     def _close_progress_dialog(self):
@@ -1065,7 +1223,6 @@ class MainWindow(QMainWindow):
             checked: True to enable live view, False to disable
         """
         if not self.scope:
-            QMessageBox.warning(self, "Not Connected", "No oscilloscope connected")
             # Uncheck the action since we can't enable live view
             self.live_view_action.blockSignals(True)
             self.live_view_action.setChecked(False)
@@ -1073,6 +1230,8 @@ class MainWindow(QMainWindow):
             return
 
         self.is_live_view = checked
+        # Capture would compete with the live view worker for the connection
+        self.act_capture.setEnabled(not checked)
 
         if checked:
             try:
@@ -1084,23 +1243,9 @@ class MainWindow(QMainWindow):
                 self.scope.run()
 
                 # Check if at least one channel is enabled
-                any_enabled = False
                 logger.debug("Checking for enabled channels...")
 
-                for ch_num in range(1, 5):
-                    try:
-                        channel = getattr(self.scope, f"channel{ch_num}", None)
-                        if channel is not None:
-                            is_enabled = channel.enabled
-                            logger.debug(f"Channel {ch_num} enabled: {is_enabled}")
-                            if is_enabled:
-                                any_enabled = True
-                                break
-                    except Exception as e:
-                        logger.debug(f"Error checking channel {ch_num}: {e}")
-                        pass
-
-                if not any_enabled:
+                if not self.scope.get_enabled_channels():
                     # Enable channel 1 by default if none are enabled
                     logger.warning("No channels enabled, attempting to enable channel 1")
                     try:
@@ -1121,9 +1266,12 @@ class MainWindow(QMainWindow):
                 self.live_view_worker.waveforms_ready.connect(self._on_waveforms_ready)
                 self.live_view_worker.error_occurred.connect(self._on_live_view_error)
                 self.live_view_worker.status_update.connect(self._on_live_view_status)
+                # _on_waveforms_ready() acknowledges every frame
+                self.live_view_worker.wait_for_display = True
+                self._update_live_view_paused()
                 self.live_view_worker.start()
 
-                self.statusBar().showMessage("Live view enabled (AUTO mode)")
+                self._set_status("Live view enabled (AUTO mode)")
                 logger.info("Live view worker thread started")
 
             except Exception as e:
@@ -1136,6 +1284,7 @@ class MainWindow(QMainWindow):
 
                 # Disable live view flag and uncheck the menu action
                 self.is_live_view = False
+                self.act_capture.setEnabled(True)
                 self.live_view_action.blockSignals(True)
                 self.live_view_action.setChecked(False)
                 self.live_view_action.blockSignals(False)
@@ -1146,7 +1295,7 @@ class MainWindow(QMainWindow):
                 self.live_view_worker.stop()
                 self.live_view_worker = None
 
-            self.statusBar().showMessage("Live view disabled")
+            self._set_status("Live view disabled")
             logger.info("Live view disabled")
 
     def _on_waveforms_ready(self, waveforms):
@@ -1159,15 +1308,36 @@ class MainWindow(QMainWindow):
         """
         logger.info(f"Received {len(waveforms)} waveforms from worker thread")
 
+        # Frame acquired just before the display was hidden - drop it, it
+        # would be stale by the time the display is shown again
+        if self.live_view_worker and self.live_view_worker.paused:
+            self.live_view_worker.frame_dropped()
+            return
+
         if waveforms:
-            # Update display (this is fast with PyQtGraph)
-            self.waveform_display.plot_multiple_waveforms(waveforms, fast_update=True)
+            # Update the existing curves in place (this is fast with PyQtGraph).
+            # The worker's buffers are released from _on_frames_presented(),
+            # once the coalesced refresh has actually replaced the curve data.
+            self.waveform_display.update_waveforms(waveforms)
 
             # Update status
             num_channels = len(waveforms)
-            self.statusBar().showMessage(f"Live view: {num_channels} channel(s) updating")
+            self._set_status(f"Live view: {num_channels} channel(s) updating")
         else:
-            self.statusBar().showMessage("Live view: No enabled channels")
+            self._set_status("Live view: No enabled channels")
+
+    def _on_frames_presented(self, count: int):
+        """Handle live frames reaching the plot.
+
+        The previous frame is off screen now, so the worker may reuse its
+        buffers.
+
+        Args:
+            count: Number of live frames the display refresh covered
+        """
+        if self.live_view_worker:
+            for _ in range(count):
+                self.live_view_worker.frame_displayed()
 
     def _on_live_view_error(self, error_info):
         """Handle errors from background worker thread.
@@ -1179,17 +1349,19 @@ class MainWindow(QMainWindow):
         error_msg = error_info.get("message", "Unknown error") if isinstance(error_info, dict) else str(error_info)
         logger.error(f"Live view worker error: {error_msg}")
 
-        # Update status bar with brief message
+        # Never block the acquisition loop with a modal dialog - the traceback
+        # is available as a tooltip in the error dock instead
+        details = error_info.get("traceback") if isinstance(error_info, dict) else None
         brief_msg = error_msg[:60] if len(error_msg) > 60 else error_msg
-        self.statusBar().showMessage(f"Live view error: {brief_msg}", 5000)
+        self._report_error("Live view error", brief_msg, modal=False, details=details)
 
-        # Show detailed error dialog if we have structured error info
-        if isinstance(error_info, dict):
-            dialog = DetailedErrorDialog(error_info, self)
-            dialog.exec()
-        else:
-            # Fallback for old-style string errors
-            QMessageBox.warning(self, "Live View Error", str(error_info))
+    def _update_live_view_paused(self):
+        """Pause live acquisition while the waveform display cannot be seen."""
+        if self.live_view_worker:
+            hidden = self.isMinimized() or not self.waveform_display.isVisible()
+            if hidden != self.live_view_worker.paused:
+                logger.debug(f"Live view {'paused' if hidden else 'resumed'} (waveform display {'hidden' if hidden else 'visible'})")
+            self.live_view_worker.paused = hidden
 
     def _on_live_view_status(self, status_msg):
         """Handle status updates from live view worker.
@@ -1198,13 +1370,12 @@ class MainWindow(QMainWindow):
             status_msg: Status message string
         """
         # Update status bar with worker status
-        self.statusBar().showMessage(status_msg)
+        self._set_status(status_msg)
         logger.debug(f"Live view status: {status_msg}")
 
     def _on_save_waveform(self):
         """Handle save waveform action."""
         if not self.scope:
-            QMessageBox.warning(self, "Not Connected", "No oscilloscope connected")
             return
 
         # Check if waveform display has data
@@ -1233,7 +1404,7 @@ class MainWindow(QMainWindow):
 
                 file_format = format_map.get(selected_filter)
 
-                self.statusBar().showMessage("Saving waveform...")
+                self._set_status("Saving waveform...")
 
                 # Save all captured waveforms
                 waveforms = self.waveform_display.current_waveforms
@@ -1251,12 +1422,12 @@ class MainWindow(QMainWindow):
                         self.scope.waveform.save_waveform(wf, ch_filename, format=file_format)
                     msg = f"Saved {len(waveforms)} waveforms to {os.path.dirname(filename)}"
 
-                self.statusBar().showMessage(msg)
+                self._set_status(msg)
                 QMessageBox.information(self, "Waveform Saved", msg)
                 logger.info(f"Waveform(s) saved successfully")
 
         except Exception as e:
-            self.statusBar().showMessage("Save failed")
+            self._set_status("Save failed")
             QMessageBox.critical(self, "Save Error", f"Failed to save waveform:\n{str(e)}")
             logger.error(f"Waveform save failed: {e}")
 
@@ -1276,7 +1447,7 @@ class MainWindow(QMainWindow):
         """Reset zoom on waveform display."""
         if hasattr(self.waveform_display, "reset_zoom"):
             self.waveform_display.reset_zoom()
-            self.statusBar().showMessage("Zoom reset")
+            self._set_status("Zoom reset")
             logger.info("Reset zoom")
         else:
             QMessageBox.information(
@@ -1356,6 +1527,9 @@ class MainWindow(QMainWindow):
     def _on_fft_compute_requested(self, channel: str, window: str):
         """Handle FFT computation request.
 
+        Waveforms are acquired on a background thread; the FFT is computed
+        when they arrive.
+
         Args:
             channel: Channel name (C1, C2, C3, C4, M1, M2)
             window: Window function name
@@ -1364,20 +1538,46 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "Not Connected", "No oscilloscope connected")
             return
 
+        if channel.startswith("C"):
+            # Hardware channel
+            channels = [int(channel[1])]
+        else:
+            # Math channel - needs every source channel
+            math_channel = self.scope.math1 if channel == "M1" else self.scope.math2
+            if not math_channel or not math_channel.enabled:
+                QMessageBox.warning(self, "No Data", f"No waveform data available for {channel}")
+                return
+            channels = self.scope.supported_channels
+
+        self._fetch_waveforms_async(
+            channels,
+            lambda waveforms: self._compute_fft(channel, window, waveforms),
+            f"Acquiring {channel} for FFT...",
+        )
+
+    def _compute_fft(self, channel: str, window: str, waveforms: list):
+        """Compute and display the FFT once waveforms have been acquired.
+
+        Args:
+            channel: Channel name (C1, C2, C3, C4, M1, M2)
+            window: Window function name
+            waveforms: Waveforms acquired for the request
+        """
+        if not self.scope:
+            return
+
         try:
-            # Get waveform data
             waveform = None
 
             if channel.startswith("C"):
                 # Hardware channel
-                ch_num = int(channel[1])
-                waveform = self.scope.get_waveform(ch_num)
+                waveform = waveforms[0] if waveforms else None
             elif channel == "M1":
                 # Math channel 1
-                waveform = self._compute_math_waveform(self.scope.math1)
+                waveform = self._compute_math_waveform(self.scope.math1, waveforms)
             elif channel == "M2":
                 # Math channel 2
-                waveform = self._compute_math_waveform(self.scope.math2)
+                waveform = self._compute_math_waveform(self.scope.math2, waveforms)
 
             if waveform is None:
                 QMessageBox.warning(self, "No Data", f"No waveform data available for {channel}")
@@ -1389,7 +1589,7 @@ class MainWindow(QMainWindow):
             if fft_result:
                 # Display FFT result
                 self.fft_display.set_fft_result(fft_result)
-                self.statusBar().showMessage(f"FFT computed for {channel} using {window} window")
+                self._set_status(f"FFT computed for {channel} using {window} window")
                 logger.info(f"FFT computed for {channel}")
             else:
                 QMessageBox.warning(self, "FFT Error", "Failed to compute FFT")
@@ -1398,11 +1598,12 @@ class MainWindow(QMainWindow):
             QMessageBox.critical(self, "FFT Error", f"Error computing FFT:\n{str(e)}")
             logger.error(f"FFT computation error: {e}")
 
-    def _compute_math_waveform(self, math_channel):
+    def _compute_math_waveform(self, math_channel, waveforms: list):
         """Compute math channel waveform.
 
         Args:
             math_channel: MathChannel instance
+            waveforms: Acquired source waveforms
 
         Returns:
             Computed waveform or None
@@ -1410,18 +1611,35 @@ class MainWindow(QMainWindow):
         if not math_channel or not math_channel.enabled:
             return None
 
-        # Get all available waveforms
-        waveforms = {}
-        for ch_num in self.scope.supported_channels:
-            try:
-                wf = self.scope.get_waveform(ch_num)
-                if wf:
-                    waveforms[f"C{ch_num}"] = wf
-            except Exception as e:
-                logger.warning(f"Failed to get waveform for C{ch_num}: {e}")
-
         # Compute math result
-        return math_channel.compute(waveforms)
+        return math_channel.compute({f"C{wf.channel}": wf for wf in waveforms})
+
+    def _fetch_waveforms_async(self, channels: List[int], on_ready: Callable[[list], None], status_msg: str) -> bool:
+        """Acquire waveforms on a background thread and pass them to a callback.
+
+        Keeps SCPI transfers for one-off analysis requests (FFT, protocol
+        decode) off the GUI thread, reusing the capture worker so only one
+        capture talks to the scope at a time.
+
+        Args:
+            channels: Channel numbers to acquire
+            on_ready: Called on the GUI thread with the list of valid waveforms
+            status_msg: Status bar message shown while acquiring
+
+        Returns:
+            True if the acquisition was started, False if a capture is already running
+        """
+        if self.capture_worker and self.capture_worker.isRunning():
+            QMessageBox.warning(self, "Capture in Progress", "Please wait for current capture to complete")
+            return False
+
+        self.capture_worker = WaveformCaptureWorker(self.scope, list(channels), self)
+        self.capture_worker.waveforms_ready.connect(on_ready)
+        self.capture_worker.error_occurred.connect(lambda error_message: self._report_error("Acquisition Failed", error_message))
+
+        self._set_status(status_msg)
+        self.capture_worker.start()
+        return True
 
     def _on_save_reference(self):
         """Handle save reference request."""
@@ -1440,7 +1658,7 @@ class MainWindow(QMainWindow):
                 # Create metadata
                 metadata = {
                     "source": "Live capture",
-                    "model": (self.scope.device_info.get("model", "Unknown") if self.scope else "Unknown"),
+                    "model": self._device_model or "Unknown",
                 }
 
                 # Save reference
@@ -1484,7 +1702,7 @@ class MainWindow(QMainWindow):
 
                     self.reference_panel.update_comparison_stats(correlation, rms_diff)
 
-                self.statusBar().showMessage("Reference loaded")
+                self._set_status("Reference loaded")
                 logger.info(f"Reference loaded: {filepath}")
             else:
                 QMessageBox.warning(self, "Error", "Failed to load reference")
@@ -1544,6 +1762,9 @@ class MainWindow(QMainWindow):
     def _on_protocol_decode_requested(self, protocol: str, params: dict, channel_map: dict):
         """Handle protocol decode request.
 
+        Waveforms are acquired on a background thread; decoding runs when
+        they arrive.
+
         Args:
             protocol: Protocol name ('I2C', 'SPI', 'UART')
             params: Decode parameters
@@ -1553,46 +1774,63 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "Not Connected", "No oscilloscope connected")
             return
 
+        # Select decoder
+        if protocol == "I2C":
+            decoder = self.i2c_decoder
+        elif protocol == "SPI":
+            decoder = self.spi_decoder
+        elif protocol == "UART":
+            decoder = self.uart_decoder
+        else:
+            QMessageBox.warning(self, "Error", f"Unknown protocol: {protocol}")
+            return
+
+        # Extract channel numbers ('C1' -> 1), acquiring each channel once
+        channels = sorted({int(channel_str[1]) for channel_str in channel_map.values()})
+
+        self._fetch_waveforms_async(
+            channels,
+            lambda waveforms: self._decode_protocol(protocol, decoder, params, channel_map, waveforms),
+            f"Acquiring waveforms for {protocol} decode...",
+        )
+
+    def _decode_protocol(self, protocol: str, decoder, params: dict, channel_map: dict, waveforms: list):
+        """Decode protocol events once waveforms have been acquired.
+
+        Args:
+            protocol: Protocol name ('I2C', 'SPI', 'UART')
+            decoder: Decoder instance for the protocol
+            params: Decode parameters
+            channel_map: Channel mapping (signal_name -> channel_number)
+            waveforms: Waveforms acquired for the request
+        """
         try:
-            # Get waveforms based on channel mapping
-            waveforms = {}
-            for signal_name, channel_str in channel_map.items():
-                # Extract channel number
-                ch_num = int(channel_str[1])  # 'C1' -> 1
+            by_channel = {f"C{wf.channel}": wf for wf in waveforms}
 
-                # Get waveform
-                waveform = self.scope.get_waveform(ch_num)
+            # Map waveforms to signal names
+            signal_waveforms = {}
+            for signal_name, channel_str in channel_map.items():
+                waveform = by_channel.get(channel_str)
                 if waveform:
-                    waveforms[signal_name] = waveform
+                    signal_waveforms[signal_name] = waveform
                 else:
                     QMessageBox.warning(self, "No Data", f"No waveform data available for channel {channel_str}")
                     return
 
-            # Select decoder
-            if protocol == "I2C":
-                decoder = self.i2c_decoder
-            elif protocol == "SPI":
-                decoder = self.spi_decoder
-            elif protocol == "UART":
-                decoder = self.uart_decoder
-            else:
-                QMessageBox.warning(self, "Error", f"Unknown protocol: {protocol}")
-                return
-
             # Decode
-            self.statusBar().showMessage(f"Decoding {protocol}...")
-            events = decoder.decode(waveforms, **params)
+            self._set_status(f"Decoding {protocol}...")
+            events = decoder.decode(signal_waveforms, **params)
 
             # Display results
             self.protocol_decode_panel.display_events(events)
 
-            self.statusBar().showMessage(f"{protocol} decode complete: {len(events)} events")
+            self._set_status(f"{protocol} decode complete: {len(events)} events")
             logger.info(f"{protocol} decode complete: {len(events)} events")
 
         except Exception as e:
             QMessageBox.critical(self, "Decode Error", f"Error decoding protocol:\n{str(e)}")
             logger.error(f"Protocol decode error: {e}")
-            self.statusBar().showMessage("Decode failed")
+            self._set_status("Decode failed")
 
     def _on_protocol_export_requested(self):
         """Handle protocol event export request."""
@@ -1699,6 +1937,22 @@ class MainWindow(QMainWindow):
         """
         QMessageBox.about(self, "About Siglent Oscilloscope Control", about_text)
 
+    def changeEvent(self, event):
+        """Handle window state changes (pause live view while minimized)."""
+        if event.type() == QEvent.Type.WindowStateChange:
+            self._update_live_view_paused()
+        super().changeEvent(event)
+
+    def showEvent(self, event):
+        """Handle window show event."""
+        super().showEvent(event)
+        self._update_live_view_paused()
+
+    def hideEvent(self, event):
+        """Handle window hide event."""
+        super().hideEvent(event)
+        self._update_live_view_paused()
+
     def closeEvent(self, event):
         """Handle window close event."""
         # Stop live view if running
@@ -1709,6 +1963,7 @@ class MainWindow(QMainWindow):
 
         # Disconnect from scope
         if self.scope:
+            self._io_pool.waitForDone(5000)
             self.scope.disconnect()
 
         # Disconnect from PSU
@@ -0,0 +1,86 @@
+"""Connection dialog with recent-host history and input validation.
+
+Replaces QInputDialog.getText() for instrument connections. The host field
+is an editable combo box pre-filled with recent connections, and a regular
+expression validator keeps the OK button disabled until the input is a
+well-formed IPv4 address or hostname, so typos never reach a socket connect
+that would block until the connection timeout expires.
+"""
+
+import logging
+from typing import List, Optional
+
+from PyQt6.QtCore import QRegularExpression
+from PyQt6.QtGui import QRegularExpressionValidator
+from PyQt6.QtWidgets import QComboBox, QDialog, QDialogButtonBox, QLabel, QVBoxLayout
+
+logger = logging.getLogger(__name__)
+
+# Dotted-quad IPv4 address (each octet 0-255) or a hostname containing at least
+# one letter (so out-of-range dotted quads are not accepted as hostnames)
+HOST_PATTERN = r"^(((25[0-5]|2[0-4]\d|1?\d?\d)\.){3}(25[0-5]|2[0-4]\d|1?\d?\d)|(?=.*[A-Za-z])[A-Za-z0-9]([A-Za-z0-9.-]{0,251}[A-Za-z0-9])?)$"
+
+
+class ConnectDialog(QDialog):
+    """Dialog for entering an instrument IP address or hostname.
+
+    Example:
+        >>> dialog = ConnectDialog("Connect to Oscilloscope", "Enter oscilloscope IP address:", parent=window)
+        >>> dialog.set_recent_hosts(["192.168.1.100", "192.168.1.101"])
+        >>> if dialog.exec() == QDialog.DialogCode.Accepted:
+        ...     host = dialog.host()
+    """
+
+    def __init__(self, title: str, prompt: str, parent=None):
+        """Initialize the connect dialog.
+
+        Args:
+            title: Window title
+            prompt: Label text shown above the host field
+            parent: Parent widget
+        """
+        super().__init__(parent)
+        self.setWindowTitle(title)
+
+        layout = QVBoxLayout(self)
+        layout.addWidget(QLabel(prompt))
+
+        self.host_combo = QComboBox()
+        self.host_combo.setEditable(True)
+        self.host_combo.setInsertPolicy(QComboBox.InsertPolicy.NoInsert)
+        self.host_combo.setValidator(QRegularExpressionValidator(QRegularExpression(HOST_PATTERN), self))
+        self.host_combo.editTextChanged.connect(self._update_ok_button)
+        layout.addWidget(self.host_combo)
+
+        self.button_box = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel)
+        self.button_box.accepted.connect(self.accept)
+        self.button_box.rejected.connect(self.reject)
+        layout.addWidget(self.button_box)
+
+        self._update_ok_button()
+
+    def set_recent_hosts(self, hosts: List[str], default: Optional[str] = None):
+        """Populate the host history.
+
+        Args:
+            hosts: Recent hosts, most recent first
+            default: Host to pre-select (defaults to the most recent host)
+        """
+        self.host_combo.clear()
+        self.host_combo.addItems(hosts)
+        text = default if default is not None else (hosts[0] if hosts else "")
+        self.host_combo.setEditText(text)
+        self.host_combo.lineEdit().selectAll()
+        self._update_ok_button()
+
+    def host(self) -> str:
+        """Get the entered host.
+
+        Returns:
+            IP address or hostname entered by the user
+        """
+        return self.host_combo.currentText().strip()
+
+    def _update_ok_button(self, *args):
+        """Enable OK only when the host field holds acceptable input."""
+        self.button_box.button(QDialogButtonBox.StandardButton.Ok).setEnabled(self.host_combo.lineEdit().hasAcceptableInput())
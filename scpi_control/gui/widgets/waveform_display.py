@@ -1,7 +1,11 @@
 """Waveform display widget using matplotlib."""
 
+import dataclasses
 import logging
-from typing import Any, Dict, List, Optional
+import operator
+import pickle
+from collections import OrderedDict
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
 
 import matplotlib
 import numpy as np
@@ -15,13 +19,19 @@ plt.ion()
 from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.backends.backend_qtagg import NavigationToolbar2QT as NavigationToolbar
 from matplotlib.figure import Figure
-from PyQt6.QtCore import Qt
+from matplotlib.lines import Line2D
+from matplotlib.ticker import EngFormatter
+from PyQt6.QtCore import Qt, QThreadPool, QTimer, pyqtSignal
 from PyQt6.QtWidgets import QCheckBox, QFileDialog, QGroupBox, QHBoxLayout, QLabel, QPushButton, QVBoxLayout, QWidget
 
+from scpi_control.gui.background_task import BackgroundTask
 from scpi_control.waveform import WaveformData
 
 logger = logging.getLogger(__name__)
 
+# Marker attributes reported by get_marker_measurements(), in result order
+_MARKER_FIELDS = operator.attrgetter("marker_id", "measurement_type", "channel", "result", "unit", "enabled")
+
 
 class WaveformDisplay(QWidget):
     """Widget for displaying oscilloscope waveforms using matplotlib.
@@ -34,6 +44,10 @@ class WaveformDisplay(QWidget):
     - Export to image
     """
 
+    # Emitted once a redraw has drawn live frames, with the number of
+    # update_waveforms() frames it covered
+    frames_presented = pyqtSignal(int)
+
     # Channel colors (matching typical oscilloscope colors)
     CHANNEL_COLORS = {
         1: "#FFD700",  # Yellow/Gold
@@ -42,6 +56,19 @@ class WaveformDisplay(QWidget):
         4: "#00FF00",  # Green
     }
 
+    # Number of distinct time axes kept for reuse across frames
+    TIME_CACHE_SIZE = 8
+
+    # Minimum time between redraws (~30 FPS); updates arriving faster are coalesced
+    REDRAW_INTERVAL_MS = 33
+
+    # Pending redraw work, from cheapest to most expensive. Flags accumulate
+    # until the redraw timer fires; the most expensive one decides the path.
+    DIRTY_COSMETIC = 0x1  # Axes decoration changed (grid) - repaint only
+    DIRTY_STYLE = 0x2  # Artist styling changed (theme) - repaint with a fresh background
+    DIRTY_DATA = 0x4  # Trace data changed - update lines and blit
+    DIRTY_PLOT = 0x8  # Channels changed - full replot (legend, overlay, markers)
+
     def __init__(self, parent=None):
         """Initialize waveform display widget.
 
@@ -54,6 +81,43 @@ class WaveformDisplay(QWidget):
         self.current_waveforms: List[WaveformData] = []  # Store most recently displayed waveforms
         self.show_grid = True
 
+        # Persistent plot artists - updated in place instead of clearing the axes
+        self._lines: Dict[int, Line2D] = {}  # One trace per channel
+        # Per channel: (time array, (xlim, n_pixels), visible slice) behind the line's x data
+        self._line_x_state: Dict[int, Tuple[np.ndarray, tuple, slice]] = {}
+        self._last_channel_set: Optional[FrozenSet[int]] = None  # Channels plotted by the last full replot
+        self._legend = None  # Created on first plot, hidden (not removed) while empty
+        self._legend_entries: Tuple[str, ...] = ()  # Labels in self._legend
+
+        # Per-channel line style, built once and only used when a line is created
+        self._channel_line_kwargs = {channel: dict(color=color, linewidth=1.0, label=f"CH{channel}", alpha=0.9) for channel, color in self.CHANNEL_COLORS.items()}
+        self._overlay_artists: List[Any] = []  # Reference/difference overlay artists
+
+        # Read-only time axes keyed by (samples, t0, dt, t_end), least recently used first
+        self._time_cache: "OrderedDict[Tuple[int, float, float, float], np.ndarray]" = OrderedDict()
+
+        # Min/max envelope output buffers, two points per axes pixel column.
+        # Reallocated only when the axes width changes; Line2D copies its data,
+        # so every trace can be decimated into the same buffers.
+        self._dec_buf_x = np.empty(0)
+        self._dec_buf_y = np.empty(0, dtype=np.float32)
+
+        # Blitting state - live frames only redraw the traces over a cached
+        # rendering of the static parts (axes, grid, ticks, legend)
+        self._blit_enabled = True
+        self._background = None  # Axes region rendered without the traces
+        self._background_key = None  # View (bbox, xlim, ylim) the background was rendered for
+        self._capturing_background = False
+
+        # Redraw coalescing - data updates only schedule a redraw, so a burst
+        # of waveforms between frames costs a single render
+        self._dirty_flags = 0
+        self._redraw_timer = QTimer(self)
+        self._redraw_timer.setSingleShot(True)
+        self._redraw_timer.setInterval(self.REDRAW_INTERVAL_MS)
+        self._redraw_timer.timeout.connect(self._do_replot)
+        self._pending_frames = 0  # update_waveforms() frames not yet drawn
+
         # Cursor state
         self.cursor_mode = "off"  # 'off', 'vertical', 'horizontal', 'both'
         self.cursor_lines = {"v1": None, "v2": None, "h1": None, "h2": None}
@@ -65,6 +129,8 @@ class WaveformDisplay(QWidget):
         self.reference_line = None  # Matplotlib line for reference
         self.show_reference = False  # Whether to show reference overlay
         self.show_difference = False  # Whether to show difference instead of overlay
+        # Reference resampled onto a live time grid, keyed by (length, first, last)
+        self._ref_interp_cache: Optional[Tuple[Tuple[int, float, float], np.ndarray]] = None
 
         # Measurement marker state
         self.measurement_markers = []  # List of MeasurementMarker objects
@@ -74,6 +140,9 @@ class WaveformDisplay(QWidget):
         self.pending_marker_channel = None  # Channel for pending marker
         self.dragging_marker_handle = None  # (marker, handle_id) during drag
 
+        # Image export running on the thread pool (kept referenced until done)
+        self._export_task: Optional[BackgroundTask] = None
+
         self._init_ui()
         logger.info("Waveform display widget initialized")
 
@@ -83,13 +152,27 @@ class WaveformDisplay(QWidget):
         layout.setContentsMargins(0, 0, 0, 0)
 
         # Create matplotlib figure and canvas
-        self.figure = Figure(figsize=(10, 6), facecolor="#1a1a1a")
+        # Constrained layout re-solves the margins on full draws only (blitted
+        # live frames skip it) and follows canvas resizes, unlike a one-off tight_layout()
+        self.figure = Figure(figsize=(10, 6), facecolor="#1a1a1a", constrained_layout=True)
         self.canvas = FigureCanvas(self.figure)
         self.ax = self.figure.add_subplot(111, facecolor="#0a0a0a")
 
         # Configure axes
         self._configure_axes()
 
+        # Placeholder shown while there is nothing to plot
+        self._placeholder = self.ax.text(
+            0.5,
+            0.5,
+            "No waveform data",
+            horizontalalignment="center",
+            verticalalignment="center",
+            transform=self.ax.transAxes,
+            color="#888888",
+            fontsize=14,
+        )
+
         # Create navigation toolbar
         self.toolbar = NavigationToolbar(self.canvas, self)
 
@@ -108,8 +191,20 @@ class WaveformDisplay(QWidget):
         self.canvas.mpl_connect("motion_notify_event", self._on_mouse_move)
         self.canvas.mpl_connect("key_press_event", self._on_key_press)
 
+        # Any full redraw or resize makes the cached background stale
+        self.canvas.mpl_connect("draw_event", self._on_draw_event)
+        self.canvas.mpl_connect("resize_event", self._invalidate_background)
+
+        # Traces are decimated for the visible x range - redo it when zooming/panning
+        self.ax.callbacks.connect("xlim_changed", self._on_xlim_changed)
+
     def _configure_axes(self):
-        """Configure matplotlib axes appearance."""
+        """Configure matplotlib axes appearance.
+
+        Runs once from _init_ui: replots only touch the traces, and set_theme
+        restyles the affected artists directly. Layout is left to the
+        figure's constrained layout engine.
+        """
         # Set dark theme colors
         self.ax.set_facecolor("#0a0a0a")
         self.ax.tick_params(colors="#888888", which="both")
@@ -119,16 +214,16 @@ class WaveformDisplay(QWidget):
         self.ax.spines["right"].set_color("#444444")
 
         # Set labels
-        self.ax.set_xlabel("Time (s)", color="#cccccc", fontsize=10)
+        self.ax.set_xlabel("Time", color="#cccccc", fontsize=10)
         self.ax.set_ylabel("Voltage (V)", color="#cccccc", fontsize=10)
         self.ax.set_title("Waveform Display", color="#cccccc", fontsize=12)
 
+        # Data stays in seconds; ticks are labelled in engineering units (ns, µs, ms)
+        self.ax.xaxis.set_major_formatter(EngFormatter(unit="s", places=2))
+
         # Enable grid
         self.ax.grid(True, alpha=0.3, color="#444444", linestyle="--", linewidth=0.5)
 
-        # Tight layout
-        self.figure.tight_layout()
-
     def _create_control_panel(self) -> QWidget:
         """Create control panel with buttons.
 
@@ -156,9 +251,9 @@ class WaveformDisplay(QWidget):
         layout.addWidget(clear_btn)
 
         # Export button
-        export_btn = QPushButton("Export Image...")
-        export_btn.clicked.connect(self._on_export)
-        layout.addWidget(export_btn)
+        self.export_btn = QPushButton("Export Image...")
+        self.export_btn.clicked.connect(self._on_export)
+        layout.addWidget(self.export_btn)
 
         # Channel info label
         self.info_label = QLabel("No data")
@@ -178,10 +273,10 @@ class WaveformDisplay(QWidget):
             self.waveforms.clear()
 
         # Store waveform
-        self.waveforms[waveform.channel] = waveform
+        self.waveforms[waveform.channel] = self._to_display_waveform(waveform)
 
-        # Replot all waveforms
-        self._replot()
+        # Replot all waveforms on the next redraw
+        self._schedule_replot(self.DIRTY_PLOT)
 
         logger.info(f"Plotted waveform from channel {waveform.channel}")
 
@@ -198,18 +293,24 @@ class WaveformDisplay(QWidget):
 
         for waveform in waveforms:
             logger.debug(f"Adding waveform from channel {waveform.channel}, {len(waveform.voltage)} samples")
-            self.waveforms[waveform.channel] = waveform
+            self.waveforms[waveform.channel] = self._to_display_waveform(waveform)
 
-        # Store current waveforms for saving
+        # Store current (full precision) waveforms for saving
         self.current_waveforms = waveforms
 
-        logger.debug("Calling _replot()...")
-        if fast_update:
-            self._fast_replot()
-        else:
-            self._replot()
+        logger.debug("Scheduling replot...")
+        self._schedule_replot(self.DIRTY_DATA if fast_update else self.DIRTY_PLOT)
+
+        logger.info(f"Queued {len(waveforms)} waveforms for display")
+
+    def update_waveforms(self, waveforms: List[WaveformData]):
+        """Update the display with a live view frame.
 
-        logger.info(f"Plotted {len(waveforms)} waveforms successfully")
+        Args:
+            waveforms: List of WaveformData objects to display
+        """
+        self.plot_multiple_waveforms(waveforms, fast_update=True)
+        self._pending_frames += 1
 
     def update_waveform(self, waveform: WaveformData):
         """Update existing waveform or add new one.
@@ -217,12 +318,71 @@ class WaveformDisplay(QWidget):
         Args:
             waveform: WaveformData object to update/add
         """
-        self.waveforms[waveform.channel] = waveform
-        self._replot()
+        self.waveforms[waveform.channel] = self._to_display_waveform(waveform)
+
+        # Blits only the traces unless the channel is new
+        self._schedule_replot(self.DIRTY_DATA)
+
+    def _to_display_waveform(self, waveform: WaveformData) -> WaveformData:
+        """Return the waveform prepared for display.
+
+        The voltage becomes a contiguous float32 array: float32 keeps a 24-bit
+        mantissa, far more than any scope ADC's resolution, and halves the
+        memory every decimation and redraw pass reads. The time axis stays
+        float64 (long records need the resolution) but is swapped for a cached
+        array when an identical axis was seen before, so consecutive frames
+        share a single time array.
+
+        Args:
+            waveform: Waveform as acquired
+
+        Returns:
+            The same waveform if nothing needed changing, otherwise a copy
+        """
+        changes = {}
+
+        voltage = waveform.voltage
+        if voltage.dtype != np.float32 or not voltage.flags.c_contiguous:
+            changes["voltage"] = np.ascontiguousarray(voltage, dtype=np.float32)
+
+        time = self._cached_time_axis(waveform.time)
+        if time is not waveform.time:
+            changes["time"] = time
+
+        return dataclasses.replace(waveform, **changes) if changes else waveform
+
+    def _cached_time_axis(self, time: np.ndarray) -> np.ndarray:
+        """Return a shared read-only time axis equal to ``time``.
+
+        Args:
+            time: Time array in seconds
+
+        Returns:
+            Cached array for the same axis, or a read-only view of ``time``
+        """
+        if len(time) < 2:
+            return time
+
+        key = (len(time), float(time[0]), float(time[1] - time[0]), float(time[-1]))
+        cached = self._time_cache.get(key)
+        if cached is not None:
+            self._time_cache.move_to_end(key)
+            return cached
+
+        cached = time.view()
+        cached.setflags(write=False)
+        self._time_cache[key] = cached
+        if len(self._time_cache) > self.TIME_CACHE_SIZE:
+            self._time_cache.popitem(last=False)
+
+        return cached
 
     def clear_channel(self, channel: int):
         """Clear waveform for a specific channel.
 
+        The channel's line is only hidden, so turning the channel back on
+        reuses it instead of building a new artist.
+
         Args:
             channel: Channel number to clear (1-4)
         """
@@ -232,111 +392,232 @@ class WaveformDisplay(QWidget):
             logger.info(f"Cleared channel {channel}")
 
     def clear_all(self):
-        """Clear all waveforms."""
+        """Clear all waveforms and remove their lines."""
         self.waveforms.clear()
+        self._time_cache.clear()
+        for line in self._lines.values():
+            line.remove()
+        self._lines.clear()
+        self._line_x_state.clear()
+        if self._legend is not None:
+            self._legend.remove()
+            self._legend = None
+            self._legend_entries = ()
         self._replot()
         logger.info("Cleared all waveforms")
 
+    def _schedule_replot(self, flags: int):
+        """Schedule a redraw.
+
+        Args:
+            flags: DIRTY_* bits describing what changed
+        """
+        self._dirty_flags |= flags
+        if not self._redraw_timer.isActive():
+            self._redraw_timer.start()
+
+    def _do_replot(self):
+        """Run the scheduled redraw (also flushes a pending one immediately).
+
+        Takes the cheapest path that covers every pending change.
+        """
+        self._redraw_timer.stop()
+        flags = self._dirty_flags
+        self._dirty_flags = 0
+
+        if flags & self.DIRTY_PLOT:
+            self._replot()
+        elif flags & self.DIRTY_DATA:
+            # Style/cosmetic changes invalidated the background, so the blit
+            # re-renders it along with the new trace data
+            self._fast_replot()
+        elif flags & self.DIRTY_STYLE:
+            self._invalidate_background()
+            self.canvas.draw_idle()
+        elif flags & self.DIRTY_COSMETIC:
+            self.canvas.draw_idle()
+
+        if self._pending_frames:
+            frames, self._pending_frames = self._pending_frames, 0
+            self.frames_presented.emit(frames)
+
     def _fast_replot(self):
-        """Fast replot for live view - updates data without clearing axes."""
+        """Fast replot for live view - updates trace data only."""
         logger.debug(f"_fast_replot called, have {len(self.waveforms)} waveform(s)")
 
         if not self.waveforms:
             return
 
-        # Update existing lines or create new ones
-        for channel, waveform in sorted(self.waveforms.items()):
-            color = self.CHANNEL_COLORS.get(channel, "#FFFFFF")
-            time_data, time_unit = self._convert_time_units(waveform.time)
+        # Channels appeared or disappeared - legend and labels need a full replot
+        if frozenset(self.waveforms) != self._last_channel_set:
+            self._replot()
+            return
+
+        self._update_lines()
+
+        # Update axis limits only when the traces no longer fit the view, so
+        # the cached background stays valid across frames
+        self._autoscale_if_needed()
+
+        # Redraw only the traces
+        self._fast_update()
+        logger.debug("Fast replot complete")
+
+    def _autoscale_if_needed(self):
+        """Autoscale when the data leaves the view or fills less than half of it."""
+        self.ax.relim(visible_only=True)
+        data_lim = self.ax.dataLim
+        for autoscale_on, (low, high), (data_low, data_high) in (
+            (self.ax.get_autoscalex_on(), self.ax.get_xlim(), data_lim.intervalx),
+            (self.ax.get_autoscaley_on(), self.ax.get_ylim(), data_lim.intervaly),
+        ):
+            if autoscale_on and (data_low < low or data_high > high or (data_high - data_low) < 0.5 * (high - low)):
+                self.ax.autoscale_view()
+                return
+
+    def _fast_update(self):
+        """Redraw the traces over the cached background and blit the axes.
+
+        Falls back to a full draw when blitting is unavailable.
+        """
+        if not self._blit_enabled or not self.canvas.supports_blit:
+            self.canvas.draw_idle()
+            return
+
+        if self._background is None or self._background_key != self._view_key():
+            self._capture_background()
+
+        self.canvas.restore_region(self._background)
+        for line in self._lines.values():
+            self.ax.draw_artist(line)
+        self.canvas.blit(self.ax.bbox)
+
+    def _capture_background(self):
+        """Render the figure without the traces and cache the axes region."""
+        self._capturing_background = True
+        try:
+            visible = {channel: line.get_visible() for channel, line in self._lines.items()}
+            for line in self._lines.values():
+                line.set_visible(False)
+            self.canvas.draw()
+            self._background = self.canvas.copy_from_bbox(self.ax.bbox)
+            self._background_key = self._view_key()
+        finally:
+            for channel, line in self._lines.items():
+                line.set_visible(visible.get(channel, True))
+            self._capturing_background = False
+
+    def _view_key(self) -> tuple:
+        """Describe the current view for background cache validation."""
+        return (tuple(self.ax.bbox.bounds), self.ax.get_xlim(), self.ax.get_ylim())
+
+    def _invalidate_background(self, event=None):
+        """Drop the cached background so the next fast update re-renders it.
+
+        Args:
+            event: Matplotlib event (unused, allows use as a callback)
+        """
+        self._background = None
+
+    def _on_xlim_changed(self, ax):
+        """Re-decimate the traces from the stored waveforms for the new x range.
+
+        Args:
+            ax: Axes whose limits changed
+        """
+        if not self._lines:
+            return
+
+        self._update_lines()
+
+        # Fit the voltage axis to the newly decimated data
+        if self.ax.get_autoscaley_on():
+            self.ax.relim(visible_only=True)
+            self.ax.autoscale_view(scalex=False)
+
+    def _on_draw_event(self, event):
+        """Handle full canvas draws (zoom, pan, cursors, replots).
+
+        Args:
+            event: Matplotlib draw event
+        """
+        if not self._capturing_background:
+            self._invalidate_background()
+
+    def _update_lines(self):
+        """Push waveform data into the per-channel lines.
+
+        Lines are created when a channel first appears and hidden (not
+        removed) when it disappears, so toggling a channel is an O(1)
+        visibility change. While the time axis, x limits and axes width are
+        unchanged (the usual live view case), only the y data is recomputed
+        and set.
+        """
+        # Hide lines of channels that are no longer displayed
+        for channel, line in self._lines.items():
+            if channel not in self.waveforms:
+                line.set_visible(False)
+
+        n_pixels = int(self.ax.bbox.width)
+        view = (self.ax.get_xlim(), n_pixels)
 
-            # Downsample if necessary for display performance
-            time_data, voltage_data = self._downsample_for_display(time_data, waveform.voltage)
+        for channel, waveform in sorted(self.waveforms.items()):
+            line = self._lines.get(channel)
+            if line is None:
+                line_kwargs = self._channel_line_kwargs.get(channel) or dict(color="#FFFFFF", linewidth=1.0, label=f"CH{channel}", alpha=0.9)
+                (line,) = self.ax.plot([], [], **line_kwargs)
+                self._lines[channel] = line
+            line.set_visible(True)
+
+            x_state = self._line_x_state.get(channel)
+            if x_state is not None and x_state[0] is waveform.time and x_state[1] == view:
+                # Same x data as the last frame - only the voltages changed
+                visible = x_state[2]
+                voltage_data = self._decimate_voltage(waveform.voltage[visible], n_pixels)
+                line.set_ydata(self._with_endpoints(waveform.voltage, voltage_data, visible))
+                continue
+
+            # Reduce the visible part to a min/max envelope per screen column
+            visible = self._visible_slice(waveform.time)
+            time_data, voltage_data = self._decimate_minmax(waveform.time[visible], waveform.voltage[visible], n_pixels)
+            time_data = self._with_endpoints(waveform.time, time_data, visible)
+            voltage_data = self._with_endpoints(waveform.voltage, voltage_data, visible)
 
             if len(voltage_data) < len(waveform.voltage):
-                logger.debug(f"Downsampled CH{channel} from {len(waveform.voltage)} to {len(voltage_data)} points for fast display")
-
-            # Find existing line for this channel
-            line_found = False
-            for line in self.ax.get_lines():
-                if line.get_label() == f"CH{channel}":
-                    # Update existing line
-                    line.set_data(time_data, voltage_data)
-                    line_found = True
-                    break
-
-            if not line_found:
-                # Create new line
-                self.ax.plot(
-                    time_data,
-                    voltage_data,
-                    color=color,
-                    linewidth=1.0,
-                    label=f"CH{channel}",
-                    alpha=0.9,
-                )
+                logger.debug(f"Decimated CH{channel} from {len(waveform.voltage)} to {len(voltage_data)} points for display")
 
-        # Update axis limits
-        self.ax.relim()
-        self.ax.autoscale_view()
+            line.set_data(time_data, voltage_data)
+            self._line_x_state[channel] = (waveform.time, view, visible)
 
-        # Quick canvas update
-        self.canvas.draw_idle()  # Use draw_idle for better performance
-        logger.debug("Fast replot complete")
+    def _update_legend(self, handles: List[Any]):
+        """Rebuild the legend for the given traces and overlay artists.
+
+        Args:
+            handles: Labelled artists to list (must not be empty)
+        """
+        if self._legend is not None:
+            self._legend.remove()
+
+        self._legend = self.ax.legend(handles=handles, loc="upper right", framealpha=0.8, facecolor="#1a1a1a", edgecolor="#444444")
+        for text in self._legend.get_texts():
+            text.set_color("#cccccc")
 
     def _replot(self):
         """Replot all stored waveforms."""
         logger.debug(f"_replot called, have {len(self.waveforms)} waveform(s)")
 
-        # Clear axes
-        self.ax.clear()
+        self._remove_reference_overlay()
 
-        # Reconfigure axes
-        self._configure_axes()
+        self._update_lines()
 
         if not self.waveforms:
             # No data to plot
             logger.debug("No waveforms to plot, showing placeholder text")
-            self.ax.text(
-                0.5,
-                0.5,
-                "No waveform data",
-                horizontalalignment="center",
-                verticalalignment="center",
-                transform=self.ax.transAxes,
-                color="#888888",
-                fontsize=14,
-            )
+            self._placeholder.set_visible(True)
             self.info_label.setText("No data")
         else:
-            # Plot each channel
-            logger.debug(f"Plotting {len(self.waveforms)} channel(s)")
-            for channel, waveform in sorted(self.waveforms.items()):
-                color = self.CHANNEL_COLORS.get(channel, "#FFFFFF")
-                label = f"CH{channel}"
-
-                # Convert time to appropriate units
-                time_data, time_unit = self._convert_time_units(waveform.time)
-
-                # Downsample if necessary for display performance
-                time_data, voltage_data = self._downsample_for_display(time_data, waveform.voltage)
-
-                if len(voltage_data) < len(waveform.voltage):
-                    logger.info(f"Downsampled CH{channel} from {len(waveform.voltage)} to {len(voltage_data)} points for display")
-
-                logger.debug(
-                    f"Plotting CH{channel}: {len(time_data)} points, time range: {time_data[0]:.3e} to {time_data[-1]:.3e} {time_unit}, voltage range: {voltage_data.min():.3f} to {voltage_data.max():.3f} V"
-                )
-
-                # Plot waveform
-                self.ax.plot(time_data, voltage_data, color=color, linewidth=1.0, label=label, alpha=0.9)
-
-            # Update x-axis label with appropriate time unit
-            self.ax.set_xlabel(f"Time ({time_unit})", color="#cccccc", fontsize=10)
-
-            # Add legend
-            legend = self.ax.legend(loc="upper right", framealpha=0.8, facecolor="#1a1a1a", edgecolor="#444444")
-            for text in legend.get_texts():
-                text.set_color("#cccccc")
+            logger.debug(f"Plotted {len(self.waveforms)} channel(s)")
+            self._placeholder.set_visible(False)
 
             # Update info label
             num_channels = len(self.waveforms)
@@ -346,13 +627,26 @@ class WaveformDisplay(QWidget):
         # Plot reference waveform overlay if loaded
         self._plot_reference_overlay()
 
+        # Rebuild the legend (text layout is expensive) only when its entries
+        # change; with nothing to list it is just hidden until entries return
+        labelled_artists = [line for line in self._lines.values() if line.get_visible()] + self._overlay_artists
+        handles = [artist for artist in labelled_artists if not artist.get_label().startswith("_")]
+        legend_entries = tuple(artist.get_label() for artist in handles)
+        if handles and legend_entries != self._legend_entries:
+            self._update_legend(handles)
+            self._legend_entries = legend_entries
+        if self._legend is not None:
+            self._legend.set_visible(bool(handles))
+        self._last_channel_set = frozenset(self.waveforms)
+
         # Render measurement markers
         for marker in self.measurement_markers:
             if marker.visible:
                 marker.render()
 
-        # Apply grid setting
-        self.ax.grid(self.show_grid, alpha=0.3, color="#444444", linestyle="--", linewidth=0.5)
+        # Update axis limits
+        self.ax.relim(visible_only=True)
+        self.ax.autoscale_view()
 
         # Redraw canvas efficiently - use draw_idle() to defer rendering
         # This prevents blocking the GUI thread and allows Qt to optimize repaints
@@ -361,80 +655,108 @@ class WaveformDisplay(QWidget):
 
         logger.debug("Canvas redraw scheduled")
 
-    def _downsample_for_display(self, time, voltage, max_points=500000):
-        """Downsample waveform data for display performance.
+    def _visible_slice(self, time: np.ndarray) -> slice:
+        """Select the samples inside the current x-axis limits.
+
+        One sample beyond each edge is kept so the trace reaches the axes
+        border. A slice (not an index array) keeps the per-frame min/max pass
+        a single read of the visible samples, without copying them first.
+
+        Args:
+            time: Time array in seconds (monotonic)
+
+        Returns:
+            Slice of the samples to display
+        """
+        x_min, x_max = sorted(self.ax.get_xlim())
+        start = max(int(np.searchsorted(time, x_min)) - 1, 0)
+        stop = min(int(np.searchsorted(time, x_max, side="right")) + 1, len(time))
+        return slice(start, max(start, stop))
+
+    @staticmethod
+    def _with_endpoints(full: np.ndarray, part: np.ndarray, visible: slice) -> np.ndarray:
+        """Add the record's first and last samples around a trimmed trace.
+
+        Keeps the data limits (and therefore autoscale) covering the whole
+        record while only the visible range is drawn in detail.
+
+        Args:
+            full: Complete time or voltage array
+            part: Decimated data of the visible slice
+            visible: Slice that produced ``part``
+
+        Returns:
+            ``part`` unchanged if nothing was trimmed, otherwise a padded copy
+        """
+        if visible.start == 0 and visible.stop == len(full):
+            return part
+
+        return np.concatenate((full[:1], part, full[-1:]))
 
-        Uses min-max decimation to preserve peaks and valleys in the signal.
-        This prevents GUI blocking when plotting millions of points.
+    def _decimate_minmax(self, time: np.ndarray, voltage: np.ndarray, n_pixels: int) -> tuple:
+        """Reduce a waveform to its min/max envelope, two points per pixel column.
+
+        Each column keeps the minimum and maximum voltage of its samples, so
+        peaks and glitches stay visible while Agg only rasterizes ~2x the
+        axes width in vertices.
 
         Args:
             time: Time array
             voltage: Voltage array
-            max_points: Maximum number of points to display (default 500000)
+            n_pixels: Number of columns (axes width in pixels)
 
         Returns:
-            Tuple of (downsampled_time, downsampled_voltage)
+            Tuple of (decimated_time, decimated_voltage). When decimated these
+            are the shared envelope buffers, valid until the next call.
         """
-        n_samples = len(voltage)
-
-        # No downsampling needed if already small enough
-        if n_samples <= max_points:
+        bins = self._decimation_bins(len(voltage), n_pixels)
+        if bins is None:
             return time, voltage
 
-        # Calculate downsampling factor
-        factor = int(np.ceil(n_samples / max_points))
-        logger.debug(f"Downsampling with factor {factor} ({n_samples} -> ~{n_samples // factor} points)")
-
-        # Use min-max decimation: for each block, keep both min and max values
-        # This preserves signal peaks and valleys
-        n_blocks = n_samples // factor
-        downsampled_time = np.zeros(n_blocks * 2)
-        downsampled_voltage = np.zeros(n_blocks * 2)
-
-        for i in range(n_blocks):
-            start_idx = i * factor
-            end_idx = min(start_idx + factor, n_samples)
-            block_voltage = voltage[start_idx:end_idx]
-            block_time = time[start_idx:end_idx]
-
-            # Find min and max in this block
-            min_idx = np.argmin(block_voltage)
-            max_idx = np.argmax(block_voltage)
-
-            # Store min and max (in time order to avoid artifacts)
-            if min_idx < max_idx:
-                downsampled_time[i * 2] = block_time[min_idx]
-                downsampled_voltage[i * 2] = block_voltage[min_idx]
-                downsampled_time[i * 2 + 1] = block_time[max_idx]
-                downsampled_voltage[i * 2 + 1] = block_voltage[max_idx]
-            else:
-                downsampled_time[i * 2] = block_time[max_idx]
-                downsampled_voltage[i * 2] = block_voltage[max_idx]
-                downsampled_time[i * 2 + 1] = block_time[min_idx]
-                downsampled_voltage[i * 2 + 1] = block_voltage[min_idx]
+        if self._dec_buf_x.shape != (2 * n_pixels,) or self._dec_buf_x.dtype != time.dtype:
+            self._dec_buf_x = np.empty(2 * n_pixels, dtype=time.dtype)
+        decimated_time = self._dec_buf_x
+        np.take(time, bins, out=decimated_time[0::2])
+        decimated_time[1::2] = decimated_time[0::2]
+        return decimated_time, self._decimate_voltage(voltage, n_pixels)
+
+    def _decimate_voltage(self, voltage: np.ndarray, n_pixels: int) -> np.ndarray:
+        """Voltage half of _decimate_minmax, for frames whose time axis is unchanged.
+
+        Args:
+            voltage: Voltage array
+            n_pixels: Number of columns (axes width in pixels)
+
+        Returns:
+            Interleaved min/max voltages (the shared envelope buffer), or
+            ``voltage`` if no decimation is needed
+        """
+        bins = self._decimation_bins(len(voltage), n_pixels)
+        if bins is None:
+            return voltage
 
-        return downsampled_time, downsampled_voltage
+        if self._dec_buf_y.shape != (2 * n_pixels,) or self._dec_buf_y.dtype != voltage.dtype:
+            self._dec_buf_y = np.empty(2 * n_pixels, dtype=voltage.dtype)
+        decimated_voltage = self._dec_buf_y
+        np.minimum.reduceat(voltage, bins, out=decimated_voltage[0::2])
+        np.maximum.reduceat(voltage, bins, out=decimated_voltage[1::2])
+        return decimated_voltage
 
-    def _convert_time_units(self, time: np.ndarray) -> tuple:
-        """Convert time array to appropriate units.
+    @staticmethod
+    def _decimation_bins(n_samples: int, n_pixels: int) -> Optional[np.ndarray]:
+        """Start index of each pixel column's samples.
 
         Args:
-            time: Time array in seconds
+            n_samples: Number of samples
+            n_pixels: Number of columns
 
         Returns:
-            Tuple of (converted_time, unit_string)
+            Bin start indices, or None if there are at most two samples per column
         """
-        # Determine appropriate time unit
-        max_time = np.max(np.abs(time))
-
-        if max_time < 1e-6:  # Less than 1 microsecond
-            return time * 1e9, "ns"
-        elif max_time < 1e-3:  # Less than 1 millisecond
-            return time * 1e6, "µs"
-        elif max_time < 1:  # Less than 1 second
-            return time * 1e3, "ms"
-        else:
-            return time, "s"
+        if n_pixels <= 0 or n_samples <= 2 * n_pixels:
+            return None
+
+        return np.linspace(0, n_samples, n_pixels + 1, dtype=np.intp)[:-1]
 
     def _on_grid_toggle(self, state):
         """Handle grid toggle.
@@ -444,14 +766,16 @@ class WaveformDisplay(QWidget):
         """
         self.show_grid = bool(state)
         self.ax.grid(self.show_grid, alpha=0.3, color="#444444", linestyle="--", linewidth=0.5)
-        self.canvas.draw_idle()
+        self._invalidate_background()
+        self._schedule_replot(self.DIRTY_COSMETIC)
         logger.debug(f"Grid {'enabled' if self.show_grid else 'disabled'}")
 
     def _on_autoscale(self):
         """Handle autoscale button click."""
         self.ax.autoscale(enable=True, axis="both", tight=False)
-        self.ax.relim()
+        self.ax.relim(visible_only=True)
         self.ax.autoscale_view()
+        self._invalidate_background()
         self.canvas.draw_idle()
         logger.debug("Autoscale applied")
 
@@ -474,11 +798,81 @@ class WaveformDisplay(QWidget):
         )
 
         if filename:
-            try:
-                self.figure.savefig(filename, dpi=150, facecolor=self.figure.get_facecolor())
-                logger.info(f"Exported waveform to {filename}")
-            except Exception as e:
-                logger.error(f"Failed to export waveform: {e}")
+            self.export_image(filename)
+
+    def export_image(self, filename: str):
+        """Save the current figure to an image file in the background.
+
+        The figure is snapshotted (pickled) on the GUI thread and rendered by
+        a thread pool worker with a non-interactive canvas, so large PDF/SVG
+        exports don't freeze the display. The export button stays disabled
+        until the file is written.
+
+        Args:
+            filename: Output path; the format follows the extension (png, pdf, svg)
+        """
+        if self._export_task is not None:
+            logger.warning("Export already in progress")
+            return
+
+        # Don't export a frame that is still waiting for its redraw
+        if self._redraw_timer.isActive():
+            self._do_replot()
+
+        try:
+            figure_state = pickle.dumps(self.figure)
+        except Exception as e:
+            logger.error(f"Failed to export waveform: {e}")
+            return
+
+        facecolor = self.figure.get_facecolor()
+        task = BackgroundTask(lambda: self._save_figure(figure_state, filename, facecolor))
+        task.setAutoDelete(False)
+        task.signals.finished.connect(self._on_export_finished)
+        task.signals.error_occurred.connect(self._on_export_error)
+
+        self._export_task = task
+        self.export_btn.setEnabled(False)
+        self.info_label.setText(f"Exporting to {filename}...")
+        QThreadPool.globalInstance().start(task)
+
+    @staticmethod
+    def _save_figure(figure_state: bytes, filename: str, facecolor) -> str:
+        """Render a pickled figure to a file (runs on a worker thread).
+
+        Args:
+            figure_state: Pickled Figure snapshot
+            filename: Output path
+            facecolor: Figure background color
+
+        Returns:
+            The output path
+        """
+        figure = pickle.loads(figure_state)
+        figure.savefig(filename, dpi=150, facecolor=facecolor)
+        return filename
+
+    def _on_export_finished(self, filename: str):
+        """Handle a completed background export.
+
+        Args:
+            filename: Path that was written
+        """
+        self._export_task = None
+        self.export_btn.setEnabled(True)
+        self.info_label.setText(f"Exported to {filename}")
+        logger.info(f"Exported waveform to {filename}")
+
+    def _on_export_error(self, error_message: str):
+        """Handle a failed background export.
+
+        Args:
+            error_message: Error description
+        """
+        self._export_task = None
+        self.export_btn.setEnabled(True)
+        self.info_label.setText("Export failed")
+        logger.error(f"Failed to export waveform: {error_message}")
 
     def set_theme(self, dark: bool = True):
         """Set display theme.
@@ -512,21 +906,24 @@ class WaveformDisplay(QWidget):
         self.ax.set_title("Waveform Display", color=text_color)
         self.ax.grid(self.show_grid, alpha=0.3, color=grid_color)
 
-        self.canvas.draw_idle()
+        self._invalidate_background()
+        self._schedule_replot(self.DIRTY_STYLE)
         logger.info(f"Theme set to {'dark' if dark else 'light'}")
 
     def toggle_grid(self):
         """Toggle grid display (callable from external sources like keyboard shortcuts)."""
         self.show_grid = not self.show_grid
         self.ax.grid(self.show_grid, alpha=0.3, color="#444444", linestyle="--", linewidth=0.5)
-        self.canvas.draw_idle()
+        self._invalidate_background()
+        self._schedule_replot(self.DIRTY_COSMETIC)
         logger.info(f"Grid {'enabled' if self.show_grid else 'disabled'}")
 
     def reset_zoom(self):
         """Reset zoom to default view (callable from external sources)."""
         self.ax.autoscale(enable=True, axis="both", tight=False)
-        self.ax.relim()
+        self.ax.relim(visible_only=True)
         self.ax.autoscale_view()
+        self._invalidate_background()
         self.canvas.draw_idle()
         logger.info("Zoom reset")
 
@@ -887,6 +1284,7 @@ class WaveformDisplay(QWidget):
         """
         self.reference_data = reference_data
         self.show_reference = True
+        self._ref_interp_cache = None
         self._replot()
         logger.info("Reference waveform set")
 
@@ -895,6 +1293,7 @@ class WaveformDisplay(QWidget):
         self.reference_data = None
         self.show_reference = False
         self.show_difference = False
+        self._ref_interp_cache = None
         self._replot()
         logger.info("Reference waveform cleared")
 
@@ -929,51 +1328,36 @@ class WaveformDisplay(QWidget):
             ref_time = self.reference_data["time"]
             ref_voltage = self.reference_data["voltage"]
 
-            # Convert time to appropriate units (same as live waveforms)
-            time_data, time_unit = self._convert_time_units(ref_time)
-
             if self.show_difference and len(self.waveforms) > 0:
                 # Show difference between first waveform and reference
                 first_waveform = next(iter(self.waveforms.values()))
 
                 # Interpolate reference to match live waveform time base
                 if len(first_waveform.time) != len(ref_time):
-                    ref_voltage_interp = np.interp(first_waveform.time, ref_time, ref_voltage)
-                    live_time_data, _ = self._convert_time_units(first_waveform.time)
-                    difference = first_waveform.voltage - ref_voltage_interp
-
-                    # Plot difference
-                    self.ax.plot(
-                        live_time_data,
-                        difference,
-                        color="#FF1493",
-                        linewidth=1.5,
-                        label="Difference",
-                        linestyle="-",
-                        alpha=0.8,
-                    )
+                    difference = first_waveform.voltage - self._reference_on_grid(first_waveform.time)
                 else:
-                    live_time_data, _ = self._convert_time_units(first_waveform.time)
                     difference = first_waveform.voltage - ref_voltage
 
-                    # Plot difference
-                    self.ax.plot(
-                        live_time_data,
-                        difference,
-                        color="#FF1493",
-                        linewidth=1.5,
-                        label="Difference",
-                        linestyle="-",
-                        alpha=0.8,
-                    )
+                # Plot difference
+                (self.reference_line,) = self.ax.plot(
+                    first_waveform.time,
+                    difference,
+                    color="#FF1493",
+                    linewidth=1.5,
+                    label="Difference",
+                    linestyle="-",
+                    alpha=0.8,
+                )
+
+                self._overlay_artists.append(self.reference_line)
 
                 # Add zero reference line
-                self.ax.axhline(y=0, color="#888888", linestyle=":", linewidth=1, alpha=0.5)
+                self._overlay_artists.append(self.ax.axhline(y=0, color="#888888", linestyle=":", linewidth=1, alpha=0.5))
 
             else:
                 # Show reference as overlay
-                self.ax.plot(
-                    time_data,
+                (self.reference_line,) = self.ax.plot(
+                    ref_time,
                     ref_voltage,
                     color="#FFA500",
                     linewidth=1.5,
@@ -981,15 +1365,37 @@ class WaveformDisplay(QWidget):
                     linestyle="--",
                     alpha=0.7,
                 )
-
-            # Update legend
-            legend = self.ax.legend(loc="upper right", framealpha=0.8, facecolor="#1a1a1a", edgecolor="#444444")
-            for text in legend.get_texts():
-                text.set_color("#cccccc")
+                self._overlay_artists.append(self.reference_line)
 
         except Exception as e:
             logger.error(f"Failed to plot reference overlay: {e}")
 
+    def _reference_on_grid(self, time: np.ndarray) -> np.ndarray:
+        """Interpolate the reference voltage onto a live waveform's time base.
+
+        Cached per time grid, so replots in difference mode only interpolate
+        again after the timebase or the reference changes.
+
+        Args:
+            time: Time array of the live waveform
+
+        Returns:
+            Reference voltage at each time in ``time``
+        """
+        signature = (len(time), float(time[0]), float(time[-1]))
+        if self._ref_interp_cache is None or self._ref_interp_cache[0] != signature:
+            interp = np.interp(time, self.reference_data["time"], self.reference_data["voltage"])
+            self._ref_interp_cache = (signature, interp)
+
+        return self._ref_interp_cache[1]
+
+    def _remove_reference_overlay(self):
+        """Remove reference/difference overlay artists from the axes."""
+        for artist in self._overlay_artists:
+            artist.remove()
+        self._overlay_artists.clear()
+        self.reference_line = None
+
     def get_reference_data(self):
         """Get current reference data.
 
@@ -1064,29 +1470,22 @@ class WaveformDisplay(QWidget):
         Returns:
             Dictionary mapping marker IDs to results
         """
+        # One C-level attrgetter call per marker instead of six attribute lookups
         return {
-            marker.marker_id: {
-                "type": marker.measurement_type,
-                "channel": marker.channel,
-                "result": marker.result,
-                "unit": marker.unit,
-                "enabled": marker.enabled,
-            }
-            for marker in self.measurement_markers
+            marker_id: {"type": mtype, "channel": channel, "result": result, "unit": unit, "enabled": enabled}
+            for marker_id, mtype, channel, result, unit, enabled in map(_MARKER_FIELDS, self.measurement_markers)
         }
 
     def update_all_markers(self) -> None:
         """Update all enabled markers with current waveform data."""
-        if not self.current_waveforms:
+        # Index waveforms by channel once; reversed so the first match wins as before
+        by_channel = {w.channel: w for w in reversed(self.current_waveforms)}
+        if not by_channel:
             return
 
         for marker in self.measurement_markers:
-            if marker.enabled:
-                # Find waveform for marker's channel
-                waveform = next((w for w in self.current_waveforms if w.channel == marker.channel), None)
-
-                if waveform:
-                    marker.update_measurement(waveform)
+            if marker.enabled and (waveform := by_channel.get(marker.channel)) is not None:
+                marker.update_measurement(waveform)
 
         # Redraw markers with updated values
         self._render_all_markers()
@@ -26,24 +26,45 @@ Architecture:
 Example:
     >>> display = WaveformDisplayPG()
     >>> display.plot_multiple_waveforms([waveform1, waveform2])
+    >>> display.update_waveforms([waveform1, waveform2])  # live view frames
     >>> display.toggle_grid()
     >>> display.autoscale()
 """
 
+import bisect
 import logging
-from typing import Any, Dict, List, Optional
+import operator
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 import numpy as np
 import pyqtgraph as pg
-from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QColor
-from PyQt6.QtWidgets import QCheckBox, QFileDialog, QHBoxLayout, QLabel, QPushButton, QVBoxLayout, QWidget
+import pyqtgraph.exporters
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal
+from PyQt6.QtGui import QColor, QOpenGLContext
+from PyQt6.QtWidgets import QCheckBox, QFileDialog, QGraphicsItem, QHBoxLayout, QLabel, QPushButton, QVBoxLayout, QWidget
 
 from scpi_control.gui.utils.validators import WaveformValidator
 from scpi_control.waveform import WaveformData
 
 logger = logging.getLogger(__name__)
 
+# Marker attributes reported by get_marker_measurements(), in result order
+_MARKER_FIELDS = operator.attrgetter("marker_id", "measurement_type", "channel", "result", "unit", "enabled")
+
+
+def _opengl_available() -> bool:
+    """Check whether an OpenGL viewport can be used on this system.
+
+    Returns:
+        True if QtOpenGLWidgets is installed and an OpenGL context can be created
+    """
+    try:
+        from PyQt6.QtOpenGLWidgets import QOpenGLWidget  # noqa: F401
+    except ImportError:
+        return False
+
+    return QOpenGLContext().create()
+
 
 class WaveformDisplayPG(QWidget):
     """High-performance waveform display using PyQtGraph.
@@ -58,6 +79,11 @@ class WaveformDisplayPG(QWidget):
     - Export to image
     """
 
+    # Emitted once a refresh has pushed live frames to the curves, with the
+    # number of update_waveforms() frames it covered. Until then the curves
+    # still reference the previous frame's arrays.
+    frames_presented = pyqtSignal(int)
+
     # Modern vibrant channel colors
     CHANNEL_COLORS = {
         1: (255, 220, 50),  # Bright Yellow (CH1 - most used)
@@ -66,15 +92,27 @@ class WaveformDisplayPG(QWidget):
         4: (50, 255, 100),  # Bright Green (CH4)
     }
 
-    def __init__(self, parent=None):
+    # Trace widths: wider than 1 px pushes QPainter onto its slow wide-line
+    # path, so live view stays at 1 px and exported images get the bolder look
+    LIVE_PEN_WIDTH = 1
+    EXPORT_PEN_WIDTH = 2
+
+    def __init__(self, parent=None, use_opengl: bool = True):
         """Initialize PyQtGraph waveform display widget.
 
         Args:
             parent: Parent widget
+            use_opengl: Draw curves through OpenGL if a context can be created
+                (falls back to the raster engine otherwise)
         """
         super().__init__(parent)
 
+        self.use_opengl = use_opengl
+        self.using_opengl = False  # Set by _init_ui once the viewport is known
+
         self.waveforms: Dict[int, WaveformData] = {}
+        self._total_samples = 0  # Sum of len(waveform) over self.waveforms
+        self._sorted_channels: List[int] = []  # Keys of self.waveforms in drawing order
         self.current_waveforms: List[WaveformData] = []
         self.show_grid = True
 
@@ -100,6 +138,28 @@ class WaveformDisplayPG(QWidget):
         self.reference_item = None
         self.show_reference = False
         self.show_difference = False
+        # Reference voltage resampled onto a live time grid, keyed by the grid's
+        # (length, first, last) - valid until the reference changes
+        self._ref_interp_cache: Optional[Tuple[Tuple[int, float, float], np.ndarray]] = None
+
+        # Coalesced refresh: data changes only record which channels are stale;
+        # the single-shot timer pushes them to the curves once per interval
+        self._refresh_channels: Optional[set] = set()  # None means all channels
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(0)
+        self._refresh_timer.timeout.connect(self._do_update_plot)
+        self._pending_frames = 0  # update_waveforms() frames not yet presented
+
+        # (channels, total samples) shown in info_label, None after other text
+        self._info_signature = None
+
+        # Pens are built once - plot items and export reuse them
+        self._channel_pens = {channel: pg.mkPen(color=color, width=self.LIVE_PEN_WIDTH) for channel, color in self.CHANNEL_COLORS.items()}
+        self._export_pens = {channel: pg.mkPen(color=color, width=self.EXPORT_PEN_WIDTH) for channel, color in self.CHANNEL_COLORS.items()}
+        self._default_pen = pg.mkPen(color=(255, 255, 255), width=self.LIVE_PEN_WIDTH)
+        self._ref_pen = pg.mkPen(color=(255, 165, 0), width=1.5, style=Qt.PenStyle.DashLine)
+        self._diff_pen = pg.mkPen(color=(255, 20, 147), width=1.5, style=Qt.PenStyle.SolidLine)
 
         self._init_ui()
         logger.info("PyQtGraph waveform display widget initialized")
@@ -110,13 +170,29 @@ class WaveformDisplayPG(QWidget):
         layout.setContentsMargins(0, 0, 0, 0)
 
         # Create PyQtGraph plot widget with modern styling
-        pg.setConfigOptions(antialias=True, useOpenGL=False, enableExperimental=False)  # Smooth lines  # Disable OpenGL for compatibility
+        # Antialiased wide lines are QPainter's slow path - keep them off for live rates
+        # and never split curves into per-segment QPainter line draws
+        pg.setConfigOptions(antialias=False, segmentedLineMode="off")
         self.plot_widget = pg.PlotWidget()
+
+        # An OpenGL viewport lets curves upload their vertices and draw them as a
+        # GL line strip instead of rasterizing on the CPU. Only this widget's
+        # viewport is switched, and only after a context was created
+        # successfully, so systems without working OpenGL keep the raster path.
+        if self.use_opengl and _opengl_available():
+            self.plot_widget.useOpenGL(True)
+            self.using_opengl = True
+            logger.info("Using OpenGL viewport for waveform display")
         self.plot_widget.setBackground("#0d1117")  # Modern dark background (GitHub dark theme)
 
         # Get plot item
         self.plot_item = self.plot_widget.getPlotItem()
 
+        # Let pyqtgraph reduce each curve to a peak envelope at the view's pixel
+        # width and skip samples outside the visible range (when zoomed in)
+        self.plot_item.setDownsampling(auto=True, mode="peak")
+        self.plot_item.setClipToView(True)
+
         # Configure axes
         self._configure_axes()
 
@@ -127,9 +203,10 @@ class WaveformDisplayPG(QWidget):
         layout.addWidget(self.plot_widget, stretch=1)
         layout.addWidget(control_panel)
 
-        # Connect mouse events
-        self.plot_widget.scene().sigMouseClicked.connect(self._on_mouse_press)
-        self.plot_widget.scene().sigMouseMoved.connect(self._on_mouse_move)
+        # Mouse events are only connected while a cursor or marker mode is
+        # active (see _update_mouse_tracking), so plain viewing doesn't pay a
+        # Python callback per mouse move
+        self._mouse_tracking = False
 
     def _configure_axes(self):
         """Configure plot axes with modern styling."""
@@ -213,17 +290,19 @@ class WaveformDisplayPG(QWidget):
         """
         if clear_others:
             self.waveforms.clear()
+            self._total_samples = 0
+            self._sorted_channels.clear()
             for item in self.plot_items.values():
                 self.plot_item.removeItem(item)
             self.plot_items.clear()
 
         # Store waveform
-        self.waveforms[waveform.channel] = waveform
+        self._store_waveform(waveform)
 
         # Update plot
-        self._update_plot()
+        self._schedule_update()
 
-        logger.info(f"Plotted waveform from channel {waveform.channel}")
+        logger.debug("Plotted waveform from channel %s", waveform.channel)
 
     def plot_multiple_waveforms(self, waveforms: List[WaveformData], fast_update: bool = False):
         """Plot multiple waveforms.
@@ -232,9 +311,7 @@ class WaveformDisplayPG(QWidget):
             waveforms: List of WaveformData objects to plot
             fast_update: If True, use fast update for live view (PyQtGraph is always fast)
         """
-        logger.info(f"plot_multiple_waveforms called with {len(waveforms)} waveform(s)")
-
-        self.waveforms.clear()
+        logger.debug("plot_multiple_waveforms called with %d waveform(s)", len(waveforms))
 
         # Validate all waveforms before plotting
         valid_waveforms, invalid_info = WaveformValidator.validate_multiple(waveforms)
@@ -244,11 +321,15 @@ class WaveformDisplayPG(QWidget):
             for channel, issues in invalid_info:
                 logger.warning(f"Invalid waveform CH{channel}: {'; '.join(issues)}")
 
-        # Add valid waveforms to display
+        # Drop channels missing from this set, then add/replace the valid ones
+        # (existing curves are kept and only receive new data)
+        channels = {waveform.channel for waveform in valid_waveforms}
+        self._drop_channels_except(channels)
+        debug = logger.isEnabledFor(logging.DEBUG)
         for waveform in valid_waveforms:
-            summary = WaveformValidator.get_summary(waveform)
-            logger.info(f"Adding valid waveform: {summary}")
-            self.waveforms[waveform.channel] = waveform
+            if debug:
+                logger.debug("Adding valid waveform: %s", WaveformValidator.get_summary(waveform))
+            self._store_waveform(waveform)
 
         # Store current waveforms for saving (only valid ones)
         self.current_waveforms = valid_waveforms
@@ -257,12 +338,41 @@ class WaveformDisplayPG(QWidget):
         if not valid_waveforms and waveforms:
             error_msg = f"All {len(waveforms)} waveform(s) invalid - see console for details"
             logger.error(error_msg)
-            self.info_label.setText("Invalid data - check logs")
+            self._set_info_text("Invalid data - check logs")
             return
 
-        self._update_plot()
+        self._schedule_update(channels=channels)
+
+        logger.debug("Plotted %d valid waveform(s) successfully", len(valid_waveforms))
+
+    def update_waveforms(self, waveforms: List[WaveformData]):
+        """Incrementally update the display with a live view frame.
+
+        The waveforms are expected to be validated already (LiveViewWorker
+        does this). Existing curves only receive new data via setData();
+        curves for channels missing from the frame are removed.
+
+        Args:
+            waveforms: List of WaveformData objects to display
+        """
+        self._drop_channels_except({waveform.channel for waveform in waveforms})
+        for waveform in waveforms:
+            self._store_waveform(waveform)
+        self.current_waveforms = list(waveforms)
+
+        self._pending_frames += 1
+        self._schedule_update()
 
-        logger.info(f"Plotted {len(valid_waveforms)} valid waveform(s) successfully")
+    def _drop_channels_except(self, channels: set):
+        """Remove the waveforms and curves of all channels not in ``channels``.
+
+        Args:
+            channels: Channels to keep
+        """
+        for channel in [ch for ch in self.waveforms if ch not in channels]:
+            self._remove_waveform(channel)
+        for channel in [ch for ch in self.plot_items if ch not in channels]:
+            self.plot_item.removeItem(self.plot_items.pop(channel))
 
     def update_waveform(self, waveform: WaveformData):
         """Update existing waveform or add new one.
@@ -270,8 +380,31 @@ class WaveformDisplayPG(QWidget):
         Args:
             waveform: WaveformData object to update/add
         """
+        self._store_waveform(waveform)
+        self._schedule_update(channels=[waveform.channel])
+
+    def _store_waveform(self, waveform: WaveformData):
+        """Add or replace a channel's waveform, keeping the sample total and channel order current.
+
+        Args:
+            waveform: Waveform to store
+        """
+        previous = self.waveforms.get(waveform.channel)
+        if previous is not None:
+            self._total_samples -= len(previous)
+        else:
+            bisect.insort(self._sorted_channels, waveform.channel)
         self.waveforms[waveform.channel] = waveform
-        self._update_plot()
+        self._total_samples += len(waveform)
+
+    def _remove_waveform(self, channel: int):
+        """Remove a channel's waveform, keeping the sample total and channel order current.
+
+        Args:
+            channel: Channel number (must be in self.waveforms)
+        """
+        self._total_samples -= len(self.waveforms.pop(channel))
+        self._sorted_channels.remove(channel)
 
     def clear_channel(self, channel: int):
         """Clear waveform for a specific channel.
@@ -280,37 +413,82 @@ class WaveformDisplayPG(QWidget):
             channel: Channel number to clear (1-4)
         """
         if channel in self.waveforms:
-            del self.waveforms[channel]
+            self._remove_waveform(channel)
 
             if channel in self.plot_items:
                 self.plot_item.removeItem(self.plot_items[channel])
                 del self.plot_items[channel]
 
-            self._update_plot()
+            # Remaining curves are unchanged - only the info label needs updating
+            self._update_plot(channels=())
             logger.info(f"Cleared channel {channel}")
 
     def clear_all(self):
         """Clear all waveforms."""
         self.waveforms.clear()
+        self._total_samples = 0
+        self._sorted_channels.clear()
 
         for item in self.plot_items.values():
             self.plot_item.removeItem(item)
         self.plot_items.clear()
 
-        self.info_label.setText("No data")
+        self._set_info_text("No data")
         logger.info("Cleared all waveforms")
 
-    def _update_plot(self):
-        """Update plot with current waveforms (very fast with PyQtGraph)."""
-        logger.info(f"PyQtGraph _update_plot called, have {len(self.waveforms)} waveform(s)")
+    def set_max_fps(self, fps: float):
+        """Limit how often new data is pushed to the curves.
+
+        Updates arriving faster than this are merged into one redraw.
+
+        Args:
+            fps: Maximum refresh rate (0 or less removes the limit)
+        """
+        self._refresh_timer.setInterval(int(1000 / fps) if fps > 0 else 0)
+
+    def _schedule_update(self, channels: Optional[Iterable[int]] = None):
+        """Mark channels stale and start the refresh timer if it isn't running.
+
+        Args:
+            channels: Channels whose data changed (None refreshes all of them)
+        """
+        if channels is None or self._refresh_channels is None:
+            self._refresh_channels = None
+        else:
+            self._refresh_channels.update(channels)
 
+        if not self._refresh_timer.isActive():
+            self._refresh_timer.start()
+
+    def _do_update_plot(self):
+        """Run the scheduled refresh (also flushes a pending one immediately)."""
+        self._refresh_timer.stop()
+        channels = self._refresh_channels
+        self._refresh_channels = set()
+        self._update_plot(channels=channels)
+
+        if self._pending_frames:
+            frames, self._pending_frames = self._pending_frames, 0
+            self.frames_presented.emit(frames)
+
+    def _update_plot(self, channels: Optional[Iterable[int]] = None):
+        """Update plot with current waveforms (very fast with PyQtGraph).
+
+        Args:
+            channels: Channels whose data changed (None refreshes all of them)
+        """
         if not self.waveforms:
             logger.warning("No waveforms to plot")
-            self.info_label.setText("No data")
+            self._set_info_text("No data")
             return
 
-        # Update or create plot items for each channel
-        for channel, waveform in sorted(self.waveforms.items()):
+        if channels is None:
+            changed = [(channel, self.waveforms[channel]) for channel in self._sorted_channels]
+        else:
+            changed = [(channel, self.waveforms[channel]) for channel in channels if channel in self.waveforms]
+
+        # Update or create plot items for each changed channel
+        for channel, waveform in changed:
             # Additional runtime validation check
             if waveform is None:
                 logger.error(f"CH{channel}: waveform is None in _update_plot")
@@ -320,101 +498,57 @@ class WaveformDisplayPG(QWidget):
                 logger.error(f"CH{channel}: empty voltage array in _update_plot")
                 continue
 
-            # Log voltage range for diagnostics
-            valid_voltages = waveform.voltage[~np.isnan(waveform.voltage)]
-            if len(valid_voltages) > 0:
-                v_range = f"[{valid_voltages.min():.3f}V to {valid_voltages.max():.3f}V]"
-            else:
-                v_range = "[all NaN]"
-
-            color = self.CHANNEL_COLORS.get(channel, (255, 255, 255))
-            logger.info(f"  Updating CH{channel}: {len(waveform.voltage)} points, range {v_range}, color={color}")
-
-            # Downsample if necessary for display performance
-            time_data, voltage_data = self._downsample_for_display(waveform.time, waveform.voltage)
-
-            if len(voltage_data) < len(waveform.voltage):
-                logger.info(f"    Downsampled CH{channel} from {len(waveform.voltage)} to {len(voltage_data)} points for display")
-
+            # Full-resolution data - the plot item decimates it for the current view
+            time, voltage = self._plot_arrays(waveform)
             if channel in self.plot_items:
-                # Update existing plot item (VERY FAST)
-                logger.debug(f"    Updating existing plot item for CH{channel}")
-                self.plot_items[channel].setData(time_data, voltage_data)
+                # Update existing plot item (VERY FAST). Validated waveforms are
+                # finite, so skip pyqtgraph's per-frame NaN/inf scan
+                self.plot_items[channel].setData(time, voltage, skipFiniteCheck=True)
             else:
                 # Create new plot item with modern styling
-                logger.info(f"    Creating NEW plot item for CH{channel}")
-                pen = pg.mkPen(color=color, width=2.0, style=pg.QtCore.Qt.PenStyle.SolidLine)  # Thicker lines for better visibility
-                plot_item = self.plot_item.plot(time_data, voltage_data, pen=pen, name=f"CH{channel}", antialias=True, skipFiniteCheck=True)  # Smooth lines  # Performance optimization
+                logger.debug("Creating plot item for CH%s", channel)
+                pen = self._channel_pens.get(channel, self._default_pen)
+                plot_item = self.plot_item.plot(time, voltage, pen=pen, name=f"CH{channel}", antialias=False, skipFiniteCheck=True)  # Performance optimization
+                # Cache the rasterized curve so cursor/marker overlay changes don't
+                # redraw it (a cache pixmap would bypass the OpenGL curve path)
+                if not self.using_opengl:
+                    plot_item.curve.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
                 self.plot_items[channel] = plot_item
-                logger.info(f"    Plot item created successfully")
 
-        # Update info label with helpful information
+        # Update info label with helpful information (only when it would change)
         num_channels = len(self.waveforms)
-        total_samples = sum(len(w) for w in self.waveforms.values())
-
-        # Check if any waveform was downsampled
-        downsampled = any(len(w.voltage) > 500000 for w in self.waveforms.values())
-        downsample_note = " (display downsampled)" if downsampled else ""
-
-        # Format sample count with thousands separator
-        samples_str = f"{total_samples:,}"
-        self.info_label.setText(f"{num_channels} channel(s) | {samples_str} samples{downsample_note}")
-
-        logger.info(f"PyQtGraph plot update complete - displayed {num_channels} channels")
-
-    def _downsample_for_display(self, time, voltage, max_points=500000):
-        """Downsample waveform data for display performance.
-
-        Uses min-max decimation to preserve peaks and valleys in the signal.
-        This prevents GUI blocking when plotting millions of points.
+        total_samples = self._total_samples
+        signature = (num_channels, total_samples)
+        if signature != self._info_signature:
+            # Format sample count with thousands separator
+            self.info_label.setText(f"{num_channels} channel(s) | {total_samples:,} samples")
+            self._info_signature = signature
+
+    @staticmethod
+    def _plot_arrays(waveform: WaveformData) -> Tuple[np.ndarray, np.ndarray]:
+        """Return the waveform's arrays in the layout handed to setData().
+
+        Voltages become contiguous float32 (what LiveViewWorker already
+        delivers, so live frames pass through without a copy), which halves
+        the memory the peak downsampler reads per frame. Time stays float64:
+        float32 cannot resolve nanosecond steps at millisecond offsets.
 
         Args:
-            time: Time array
-            voltage: Voltage array
-            max_points: Maximum number of points to display (default 500000)
+            waveform: Waveform to plot
 
         Returns:
-            Tuple of (downsampled_time, downsampled_voltage)
+            Tuple of (time, voltage) arrays
         """
-        n_samples = len(voltage)
-
-        # No downsampling needed if already small enough
-        if n_samples <= max_points:
-            return time, voltage
-
-        # Calculate downsampling factor
-        factor = int(np.ceil(n_samples / max_points))
-        logger.debug(f"Downsampling with factor {factor} ({n_samples} -> ~{n_samples // factor} points)")
-
-        # Use min-max decimation: for each block, keep both min and max values
-        # This preserves signal peaks and valleys
-        n_blocks = n_samples // factor
-        downsampled_time = np.zeros(n_blocks * 2)
-        downsampled_voltage = np.zeros(n_blocks * 2)
-
-        for i in range(n_blocks):
-            start_idx = i * factor
-            end_idx = min(start_idx + factor, n_samples)
-            block_voltage = voltage[start_idx:end_idx]
-            block_time = time[start_idx:end_idx]
-
-            # Find min and max in this block
-            min_idx = np.argmin(block_voltage)
-            max_idx = np.argmax(block_voltage)
-
-            # Store min and max (in time order to avoid artifacts)
-            if min_idx < max_idx:
-                downsampled_time[i * 2] = block_time[min_idx]
-                downsampled_voltage[i * 2] = block_voltage[min_idx]
-                downsampled_time[i * 2 + 1] = block_time[max_idx]
-                downsampled_voltage[i * 2 + 1] = block_voltage[max_idx]
-            else:
-                downsampled_time[i * 2] = block_time[max_idx]
-                downsampled_voltage[i * 2] = block_voltage[max_idx]
-                downsampled_time[i * 2 + 1] = block_time[min_idx]
-                downsampled_voltage[i * 2 + 1] = block_voltage[min_idx]
+        return np.ascontiguousarray(waveform.time), np.ascontiguousarray(waveform.voltage, dtype=np.float32)
 
-        return downsampled_time, downsampled_voltage
+    def _set_info_text(self, text: str):
+        """Show a status message in the info label instead of the sample summary.
+
+        Args:
+            text: Message to show
+        """
+        self.info_label.setText(text)
+        self._info_signature = None
 
     def _on_grid_toggle(self, state):
         """Handle grid toggle.
@@ -451,12 +585,25 @@ class WaveformDisplayPG(QWidget):
         )
 
         if filename:
+            # Thicker traces for better visibility in the exported image
+            self._set_trace_pens(self._export_pens)
             try:
                 exporter = pg.exporters.ImageExporter(self.plot_item)
                 exporter.export(filename)
                 logger.info(f"Exported waveform to {filename}")
             except Exception as e:
                 logger.error(f"Failed to export waveform: {e}")
+            finally:
+                self._set_trace_pens(self._channel_pens)
+
+    def _set_trace_pens(self, pens: Dict[int, Any]):
+        """Apply a set of pens to the channel traces.
+
+        Args:
+            pens: Pen per channel (channels without one get the default pen)
+        """
+        for channel, item in self.plot_items.items():
+            item.setPen(pens.get(channel, self._default_pen))
 
     def toggle_grid(self):
         """Toggle grid display."""
@@ -484,6 +631,23 @@ class WaveformDisplayPG(QWidget):
         if self.cursor_mode == "off":
             self._clear_all_cursors()
 
+        self._update_mouse_tracking()
+
+    def _update_mouse_tracking(self):
+        """Connect the scene's mouse signals only while cursors or markers need them."""
+        tracking = self.cursor_mode != "off" or self.marker_mode != "off"
+        if tracking == self._mouse_tracking:
+            return
+
+        scene = self.plot_widget.scene()
+        if tracking:
+            scene.sigMouseClicked.connect(self._on_mouse_press)
+            scene.sigMouseMoved.connect(self._on_mouse_move)
+        else:
+            scene.sigMouseClicked.disconnect(self._on_mouse_press)
+            scene.sigMouseMoved.disconnect(self._on_mouse_move)
+        self._mouse_tracking = tracking
+
     def _clear_all_cursors(self):
         """Clear all cursor lines."""
         for key in self.cursor_lines:
@@ -562,34 +726,30 @@ class WaveformDisplayPG(QWidget):
                 marker.set_selected(False)
             self.selected_marker = None
 
+        self._update_mouse_tracking()
+
     def get_marker_measurements(self) -> Dict:
         """Get all measurement results from markers.
 
         Returns:
             Dictionary mapping marker IDs to results
         """
+        # One C-level attrgetter call per marker instead of six attribute lookups
         return {
-            marker.marker_id: {
-                "type": marker.measurement_type,
-                "channel": marker.channel,
-                "result": marker.result,
-                "unit": marker.unit,
-                "enabled": marker.enabled,
-            }
-            for marker in self.measurement_markers
+            marker_id: {"type": mtype, "channel": channel, "result": result, "unit": unit, "enabled": enabled}
+            for marker_id, mtype, channel, result, unit, enabled in map(_MARKER_FIELDS, self.measurement_markers)
         }
 
     def update_all_markers(self) -> None:
         """Update all enabled markers with current waveform data."""
-        if not self.current_waveforms:
+        # Index waveforms by channel once; reversed so the first match wins as before
+        by_channel = {w.channel: w for w in reversed(self.current_waveforms)}
+        if not by_channel:
             return
 
         for marker in self.measurement_markers:
-            if marker.enabled:
-                waveform = next((w for w in self.current_waveforms if w.channel == marker.channel), None)
-
-                if waveform:
-                    marker.update_measurement(waveform)
+            if marker.enabled and (waveform := by_channel.get(marker.channel)) is not None:
+                marker.update_measurement(waveform)
 
     # Mouse event handlers (simplified for now)
 
@@ -621,6 +781,7 @@ class WaveformDisplayPG(QWidget):
         """
         self.reference_data = reference_data
         self.show_reference = True
+        self._ref_interp_cache = None
         self._plot_reference_overlay()
         logger.info("Reference waveform set")
 
@@ -629,6 +790,7 @@ class WaveformDisplayPG(QWidget):
         self.reference_data = None
         self.show_reference = False
         self.show_difference = False
+        self._ref_interp_cache = None
 
         if self.reference_item:
             self.plot_item.removeItem(self.reference_item)
@@ -673,8 +835,7 @@ class WaveformDisplayPG(QWidget):
                 first_waveform = next(iter(self.waveforms.values()))
 
                 if len(first_waveform.time) != len(ref_time):
-                    ref_voltage_interp = np.interp(first_waveform.time, ref_time, ref_voltage)
-                    difference = first_waveform.voltage - ref_voltage_interp
+                    difference = first_waveform.voltage - self._reference_on_grid(first_waveform.time)
                 else:
                     difference = first_waveform.voltage - ref_voltage
 
@@ -682,19 +843,37 @@ class WaveformDisplayPG(QWidget):
                 if self.reference_item:
                     self.plot_item.removeItem(self.reference_item)
 
-                pen = pg.mkPen(color=(255, 20, 147), width=1.5, style=Qt.PenStyle.SolidLine)
-                self.reference_item = self.plot_item.plot(first_waveform.time, difference, pen=pen, name="Difference")
+                self.reference_item = self.plot_item.plot(first_waveform.time, difference, pen=self._diff_pen, name="Difference")
             else:
                 # Show reference as overlay
                 if self.reference_item:
                     self.plot_item.removeItem(self.reference_item)
 
-                pen = pg.mkPen(color=(255, 165, 0), width=1.5, style=Qt.PenStyle.DashLine)
-                self.reference_item = self.plot_item.plot(ref_time, ref_voltage, pen=pen, name="Reference")
+                self.reference_item = self.plot_item.plot(ref_time, ref_voltage, pen=self._ref_pen, name="Reference")
 
         except Exception as e:
             logger.error(f"Failed to plot reference overlay: {e}")
 
+    def _reference_on_grid(self, time: np.ndarray) -> np.ndarray:
+        """Interpolate the reference voltage onto a live waveform's time base.
+
+        Live frames keep the same time grid until the timebase changes, so the
+        result is cached and only recomputed when the grid's length or span
+        differs from the last call.
+
+        Args:
+            time: Time array of the live waveform
+
+        Returns:
+            Reference voltage at each time in ``time``
+        """
+        signature = (len(time), float(time[0]), float(time[-1]))
+        if self._ref_interp_cache is None or self._ref_interp_cache[0] != signature:
+            interp = np.interp(time, self.reference_data["time"], self.reference_data["voltage"])
+            self._ref_interp_cache = (signature, interp)
+
+        return self._ref_interp_cache[1]
+
     def get_reference_data(self):
         """Get current reference data.
 
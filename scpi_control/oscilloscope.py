@@ -5,7 +5,11 @@ SDS2000X Plus, and SDS5000X.
 """
 
 import logging
-from typing import Any, Dict, List, Optional
+import re
+from functools import cached_property
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+import numpy as np
 
 from scpi_control import exceptions
 from scpi_control.analysis import FFTAnalyzer
@@ -21,6 +25,9 @@ from scpi_control.waveform import Waveform, WaveformData
 
 logger = logging.getLogger(__name__)
 
+# *IDN? reply "manufacturer,model,serial,firmware"; missing trailing fields are None
+_IDN_PATTERN = re.compile(r"([^,]*)(?:,([^,]*))?(?:,([^,]*))?(?:,([^,]*))?")
+
 
 class Oscilloscope:
     """Main class for controlling Siglent oscilloscopes.
@@ -82,29 +89,44 @@ class Oscilloscope:
 
         # Channels will be created dynamically based on model capability
         # After connection, channels will be available as self.channel1, self.channel2, etc.
+        # _channels maps channel number to the same objects for loops over all channels
+        self._channels: Dict[int, Channel] = {}
 
-        # Initialize trigger control
-        self.trigger = Trigger(self)
-
-        # Initialize waveform acquisition
-        self.waveform = Waveform(self)
-
-        # Initialize measurement control
-        self.measurement = Measurement(self)
-
-        # Initialize screen capture
-        self.screen_capture = ScreenCapture(self)
+        # Trigger, waveform, measurement, screen capture and FFT helpers are
+        # created on first access (see the cached properties below)
 
         # Initialize math channels (available after connection)
         self.math1: Optional[MathChannel] = None
         self.math2: Optional[MathChannel] = None
 
-        # Initialize FFT analyzer
-        self.fft_analyzer = FFTAnalyzer()
-
         # Vector display (lazy-loaded, requires 'fun' extras)
         self._vector_display = None
 
+    @cached_property
+    def trigger(self) -> Trigger:
+        """Trigger control (created on first access)."""
+        return Trigger(self)
+
+    @cached_property
+    def waveform(self) -> Waveform:
+        """Waveform acquisition (created on first access)."""
+        return Waveform(self)
+
+    @cached_property
+    def measurement(self) -> Measurement:
+        """Measurement control (created on first access)."""
+        return Measurement(self)
+
+    @cached_property
+    def screen_capture(self) -> ScreenCapture:
+        """Screen capture (created on first access)."""
+        return ScreenCapture(self)
+
+    @cached_property
+    def fft_analyzer(self) -> FFTAnalyzer:
+        """FFT analyzer (created on first access)."""
+        return FFTAnalyzer()
+
     @property
     def vector_display(self):
         """Access vector graphics display functionality.
@@ -185,6 +207,7 @@ class Oscilloscope:
         self._scpi_commands = None
 
         # Remove dynamically created channels
+        self._channels = {}
         for i in range(1, 5):  # Check all possible channels
             channel_attr = f"channel{i}"
             if hasattr(self, channel_attr):
@@ -235,6 +258,30 @@ class Oscilloscope:
         logger.debug(f"Response: {response}")
         return response
 
+    def query_many(self, commands: List[str]) -> List[str]:
+        """Send several SCPI queries in one round trip.
+
+        The queries are joined with ``;`` into one compound command, and the
+        reply is split on ``;``. Only use this for queries whose answers
+        never contain a semicolon themselves.
+
+        Args:
+            commands: SCPI query commands
+
+        Returns:
+            One response string per command, in order
+
+        Raises:
+            SiglentConnectionError: If not connected
+            SiglentTimeoutError: If query times out
+            CommandError: If the reply does not contain one answer per command
+        """
+        command = ";".join(commands)
+        replies = self.query(command).split(";")
+        if len(replies) != len(commands):
+            raise exceptions.CommandError(f"Compound query {command!r} returned {len(replies)} replies for {len(commands)} queries")
+        return replies
+
     def read_raw(self, size: Optional[int] = None) -> bytes:
         """Read raw binary data from oscilloscope.
 
@@ -246,6 +293,17 @@ class Oscilloscope:
         """
         return self._connection.read_raw(size)
 
+    def read_raw_into(self, buffer: Union[bytearray, memoryview]) -> int:
+        """Read raw binary data from oscilloscope into a reusable buffer.
+
+        Args:
+            buffer: Writable buffer to fill
+
+        Returns:
+            Number of bytes written to the start of ``buffer``
+        """
+        return self._connection.read_raw_into(buffer)
+
     def identify(self) -> str:
         """Get device identification string.
 
@@ -329,6 +387,118 @@ class Oscilloscope:
         """
         return self.waveform.acquire(channel)
 
+    def get_waveform_into(self, channel: int, out: Optional[np.ndarray]) -> WaveformData:
+        """Acquire waveform data from a channel into a preallocated voltage buffer.
+
+        Convenience method that calls waveform.acquire_into(). Used by
+        continuous acquisition loops to avoid allocating a new voltage array
+        every frame.
+
+        Args:
+            channel: Channel number (1-4)
+            out: Voltage buffer to reuse (None or wrong size allocates a new one)
+
+        Returns:
+            WaveformData object whose voltage array is ``out`` when it could be reused
+        """
+        return self.waveform.acquire_into(channel, out)
+
+    def get_waveforms(self, channels: List[int], out: Optional[Dict[int, np.ndarray]] = None, on_error: Optional[Callable[[int, Exception], None]] = None) -> List[WaveformData]:
+        """Acquire waveform data from several channels.
+
+        Convenience method that calls waveform.acquire_many(), which reads all
+        channel settings in one compound query before downloading each
+        channel's data.
+
+        Args:
+            channels: Channel numbers (1-4)
+            out: Optional per-channel voltage buffers to reuse
+            on_error: Optional ``on_error(channel, exception)`` callback; failing
+                channels are then reported and skipped instead of raising
+
+        Returns:
+            List of WaveformData objects in ``channels`` order
+
+        Example:
+            >>> waveforms = scope.get_waveforms(scope.get_enabled_channels())
+        """
+        return self.waveform.acquire_many(channels, out=out, on_error=on_error)
+
+    def get_waveforms_stacked(self, channels: List[int]) -> Tuple[np.ndarray, np.ndarray]:
+        """Acquire several channels into one contiguous 2-D voltage array.
+
+        Each channel is converted directly into its row of a single
+        preallocated array, so multi-channel consumers get one buffer instead
+        of a list of per-channel arrays.
+
+        Args:
+            channels: Channel numbers to acquire, in row order
+
+        Returns:
+            Tuple of (time, voltage) where time has shape (N,) and voltage has
+            shape (len(channels), N); row i holds channels[i]
+
+        Raises:
+            InvalidParameterError: If no channels are given
+            CommandError: If the channels return different record lengths
+
+        Example:
+            >>> time, voltage = scope.get_waveforms_stacked(scope.get_enabled_channels())
+            >>> voltage.shape
+            (2, 1400000)
+        """
+        if not channels:
+            raise exceptions.InvalidParameterError("At least one channel is required")
+
+        first = self.waveform.acquire(channels[0])
+        voltage = np.empty((len(channels), len(first.voltage)))
+        voltage[0] = first.voltage
+
+        for row, channel in enumerate(channels[1:], start=1):
+            row_buffer = voltage[row]
+            waveform = self.waveform.acquire_into(channel, row_buffer)
+            if waveform.voltage is not row_buffer:
+                raise exceptions.CommandError(f"Channel {channel} returned {len(waveform.voltage)} samples, expected {voltage.shape[1]} (same as channel {channels[0]})")
+
+        return first.time, voltage
+
+    def get_enabled_channels(self) -> List[int]:
+        """Get the numbers of all channels currently displayed on the scope.
+
+        All channels are probed with a single compound query
+        (``C1:TRA?;C2:TRA?;...``), so the check costs one round trip instead
+        of one per channel. Falls back to per-channel queries if the reply
+        does not contain one answer per channel. Channels whose state cannot
+        be queried are treated as disabled.
+
+        Returns:
+            List of enabled channel numbers (empty if not connected)
+
+        Example:
+            >>> scope.get_enabled_channels()
+            [1, 3]
+        """
+        channels = list(self._channels)
+        if not channels:
+            return []
+
+        try:
+            replies = self.query_many([f"C{ch_num}:TRA?" for ch_num in channels])
+            # Reply format per channel: "C1:TRA ON" or "C1:TRA OFF"
+            return [ch_num for ch_num, reply in zip(channels, replies) if "ON" in reply.upper()]
+        except exceptions.SiglentError as e:
+            logger.debug(f"Compound channel state query failed: {e}")
+
+        # Fall back to one query per channel
+        enabled = []
+        for ch_num, channel in self._channels.items():
+            try:
+                if channel.enabled:
+                    enabled.append(ch_num)
+            except Exception as e:
+                logger.warning(f"Could not check channel {ch_num} status: {e}")
+        return enabled
+
     @property
     def device_info(self) -> Optional[Dict[str, str]]:
         """Get parsed device information.
@@ -348,12 +518,12 @@ class Oscilloscope:
         Returns:
             Dictionary with manufacturer, model, serial, firmware
         """
-        parts = idn.split(",")
+        manufacturer, model, serial, firmware = _IDN_PATTERN.match(idn).groups(default="")
         return {
-            "manufacturer": parts[0].strip() if len(parts) > 0 else "",
-            "model": parts[1].strip() if len(parts) > 1 else "",
-            "serial": parts[2].strip() if len(parts) > 2 else "",
-            "firmware": parts[3].strip() if len(parts) > 3 else "",
+            "manufacturer": manufacturer.strip(),
+            "model": model.strip(),
+            "serial": serial.strip(),
+            "firmware": firmware.strip(),
         }
 
     def _create_channels(self) -> None:
@@ -368,9 +538,11 @@ class Oscilloscope:
         num_channels = self.model_capability.num_channels
         logger.info(f"Creating {num_channels} channel(s)")
 
+        self._channels = {}
         for i in range(1, num_channels + 1):
             channel = Channel(self, i)
             setattr(self, f"channel{i}", channel)
+            self._channels[i] = channel
             logger.debug(f"Created channel{i}")
 
     def _create_math_channels(self) -> None:
@@ -413,8 +585,7 @@ class Oscilloscope:
             >>> scope.connect()
             >>> ch1 = scope.get_channel(1)
         """
-        channel_attr = f"channel{channel_num}"
-        return getattr(self, channel_attr, None)
+        return self._channels.get(channel_num)
 
     def _get_command(self, command_name: str, **kwargs) -> str:
         """Get SCPI command string for this model.
@@ -7,11 +7,17 @@ company branding, and AI-generated insights.
 
 from __future__ import annotations
 
+import hashlib
 import io
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
+from functools import lru_cache
+from itertools import repeat
 from pathlib import Path
-from typing import Callable, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
 
 try:
     from reportlab.lib import colors
@@ -26,12 +32,7 @@ try:
 except ImportError:
     REPORTLAB_AVAILABLE = False
 
-import matplotlib
-import matplotlib.pyplot as plt
-
-matplotlib.use("Agg")  # Use non-interactive backend
 import numpy as np
-from PIL import Image
 
 from scpi_control.report_generator.generators.base import BaseReportGenerator
 from scpi_control.report_generator.models.plot_style import PlotStyle
@@ -39,10 +40,247 @@ from scpi_control.report_generator.models.report_data import MeasurementResult,
 from scpi_control.report_generator.models.report_options import ReportOptions
 from scpi_control.report_generator.utils.waveform_analyzer import WaveformAnalyzer
 
+if TYPE_CHECKING:
+    from matplotlib.figure import Figure
+
+# Unicode characters commonly produced by LLMs that may not render in PDF fonts
+_UNICODE_NORMALIZE = str.maketrans(
+    {
+        # Dashes and hyphens
+        "\u2013": "-",  # en-dash
+        "\u2014": "-",  # em-dash
+        "\u2212": "-",  # minus sign
+        "\u00ad": None,  # soft hyphen (remove)
+        # Quotes
+        "\u2018": "'",  # left single quote
+        "\u2019": "'",  # right single quote
+        "\u201a": "'",  # single low-9 quote
+        "\u201c": '"',  # left double quote
+        "\u201d": '"',  # right double quote
+        "\u201e": '"',  # double low-9 quote
+        # Bullets and symbols
+        "\u2022": "*",  # bullet
+        "\u2023": "*",  # triangular bullet
+        "\u2043": "*",  # hyphen bullet
+        "\u25e6": "*",  # white bullet
+        "\u2219": "*",  # bullet operator
+        # Ellipsis
+        "\u2026": "...",  # horizontal ellipsis
+        # Spaces
+        "\u00a0": " ",  # non-breaking space
+        "\u2009": " ",  # thin space
+        "\u200a": " ",  # hair space
+        # Mathematical symbols
+        "\u00d7": "x",  # multiplication sign
+        "\u00f7": "/",  # division sign
+        "\u2264": "<=",  # less than or equal
+        "\u2265": ">=",  # greater than or equal
+        "\u2260": "!=",  # not equal
+        # Degrees and other symbols
+        "\u00b0": " deg",  # degree symbol
+        "\u2103": " C",  # degree celsius
+        "\u2109": " F",  # degree fahrenheit
+    }
+)
+
+# Characters that make _markdown_to_reportlab() do more than convert line breaks
+_MARKUP_CHARS = frozenset("*_`<>&") | frozenset(map(chr, _UNICODE_NORMALIZE))
+
+# Measurement status colors (parsed once rather than per table row)
+_PASS_COLOR = colors.HexColor("#2ca02c") if REPORTLAB_AVAILABLE else None
+_FAIL_COLOR = colors.HexColor("#d62728") if REPORTLAB_AVAILABLE else None
+
+# XML special characters escaped for ReportLab paragraph markup
+_XML_ESCAPE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;"})
+
+# Markdown patterns handled by PDFReportGenerator._markdown_to_reportlab()
+# (one alternative per markup; the group number identifies which matched)
+_MARKDOWN_RE = re.compile(
+    r"`(.+?)`"  # 1: code
+    r"|\*\*(.+?)\*\*(?!\*)"  # 2: bold (***x*** closes on the last two, leaving *x* inside)
+    r"|__(.+?)__(?!_)"  # 3: bold
+    r"|(?<!\*)\*(?!\*)(.+?)(?<!\*)\*(?!\*)"  # 4: italic
+    r"|(?<!_)_(?!_)(.+?)(?<!_)_(?!_)"  # 5: italic
+)
+_MARKDOWN_TAGS = (
+    None,
+    ('<font face="Courier">', "</font>"),
+    ("<b>", "</b>"),
+    ("<b>", "</b>"),
+    ("<i>", "</i>"),
+    ("<i>", "</i>"),
+)
+
+
+def _markdown_span(match: re.Match) -> str:
+    """Convert one _MARKDOWN_RE match to ReportLab tags, recursing into bold/italic content."""
+    group = match.lastindex
+    content = match.group(group)
+    if group > 1:
+        content = _MARKDOWN_RE.sub(_markdown_span, content)
+    open_tag, close_tag = _MARKDOWN_TAGS[group]
+    return f"{open_tag}{content}{close_tag}"
+
+
+def _format_criteria(criteria_min: Optional[float], criteria_max: Optional[float]) -> str:
+    """Format measurement pass criteria for the measurements table."""
+    if criteria_min is None and criteria_max is None:
+        return "N/A"
+    if criteria_max is None:
+        return f"min: {criteria_min:.6g}"
+    if criteria_min is None:
+        return f"max: {criteria_max:.6g}"
+    return f"min: {criteria_min:.6g}\nmax: {criteria_max:.6g}"
+
+
+@lru_cache(maxsize=1)
+def _build_styles():
+    """
+    Build the report paragraph styles.
+
+    getSampleStyleSheet() constructs every sample style from scratch, so the
+    populated stylesheet is built once and shared by all generators.
+
+    Returns:
+        StyleSheet1 with the sample styles plus the report's custom styles
+    """
+    styles = getSampleStyleSheet()
+
+    # Title style
+    styles.add(
+        ParagraphStyle(
+            name="ReportTitle",
+            parent=styles["Heading1"],
+            fontSize=24,
+            textColor=colors.HexColor("#1f77b4"),
+            spaceAfter=30,
+            alignment=TA_CENTER,
+        )
+    )
+
+    # Section heading
+    styles.add(
+        ParagraphStyle(
+            name="SectionHeading",
+            parent=styles["Heading2"],
+            fontSize=16,
+            textColor=colors.HexColor("#1f77b4"),
+            spaceAfter=12,
+            spaceBefore=20,
+        )
+    )
+
+    # Subsection heading
+    styles.add(
+        ParagraphStyle(
+            name="SubsectionHeading",
+            parent=styles["Heading3"],
+            fontSize=14,
+            textColor=colors.HexColor("#2ca02c"),
+            spaceAfter=10,
+            spaceBefore=15,
+        )
+    )
+
+    # Waveform heading (for individual waveforms)
+    # Only add if it doesn't exist
+    if "Heading4" not in styles:
+        styles.add(
+            ParagraphStyle(
+                name="Heading4",
+                parent=styles["Heading3"],
+                fontSize=12,
+                textColor=colors.HexColor("#ff7f0e"),
+                spaceAfter=6,
+                spaceBefore=10,
+            )
+        )
+
+    # Result PASS style
+    styles.add(
+        ParagraphStyle(
+            name="ResultPass",
+            parent=styles["Normal"],
+            fontSize=18,
+            textColor=colors.HexColor("#2ca02c"),
+            alignment=TA_CENTER,
+            spaceAfter=20,
+        )
+    )
+
+    # Result FAIL style
+    styles.add(
+        ParagraphStyle(
+            name="ResultFail",
+            parent=styles["Normal"],
+            fontSize=18,
+            textColor=colors.HexColor("#d62728"),
+            alignment=TA_CENTER,
+            spaceAfter=20,
+        )
+    )
+
+    return styles
+
 
 class PDFReportGenerator(BaseReportGenerator):
     """Generator for PDF format reports."""
 
+    # Optional metadata table rows: (label, ReportMetadata attribute), shown when set
+    _METADATA_FIELDS = (
+        ("Equipment:", "equipment_model"),
+        ("Equipment ID:", "equipment_id"),
+        ("Test Procedure:", "test_procedure"),
+        ("Project:", "project_name"),
+        ("Customer:", "customer"),
+        ("Temperature:", "temperature"),
+        ("Humidity:", "humidity"),
+        ("Location:", "location"),
+    )
+
+    # Statistics table rows: (ReportOptions flag, ((stat key, label), ...))
+    _STATISTIC_FIELDS = (
+        (
+            "include_frequency_stats",
+            (("frequency", "Frequency:"), ("period", "Period:")),
+        ),
+        (
+            "include_amplitude_stats",
+            (
+                ("vmax", "Vmax:"),
+                ("vmin", "Vmin:"),
+                ("vpp", "Vpp:"),
+                ("vmean", "Vmean:"),
+                ("vrms", "Vrms:"),
+                ("vamp", "Vamp:"),
+                ("dc_offset", "DC Offset:"),
+            ),
+        ),
+        (
+            "include_timing_stats",
+            (("rise_time", "Rise Time:"), ("fall_time", "Fall Time:"), ("pulse_width", "Pulse Width:"), ("duty_cycle", "Duty Cycle:")),
+        ),
+        (
+            "include_quality_stats",
+            (
+                ("noise_level", "Noise Level:"),
+                ("snr", "SNR:"),
+                ("thd", "THD:"),
+                ("overshoot", "Overshoot:"),
+                ("undershoot", "Undershoot:"),
+                ("jitter", "Jitter:"),
+            ),
+        ),
+        (
+            "include_plateau_stability",
+            (("plateau_stability", "Plateau Stability:"), ("plateau_high_noise", "High Plateau Noise:"), ("plateau_low_noise", "Low Plateau Noise:")),
+        ),
+    )
+
+    # Raster resolution of embedded plots
+    PLOT_DPI = 100
+    PLOT_JPEG_QUALITY = 85
+
     def __init__(
         self,
         page_size=None,
@@ -52,6 +290,7 @@ class PDFReportGenerator(BaseReportGenerator):
         plot_style: PlotStyle = None,
         report_options: ReportOptions = None,
         progress_callback: Optional[Callable[[int, str], None]] = None,
+        parallel_plots: bool = False,
     ):
         """
         Initialize PDF generator.
@@ -64,6 +303,9 @@ class PDFReportGenerator(BaseReportGenerator):
             plot_style: Plot style configuration for matplotlib plots
             report_options: Report options for statistics and other settings
             progress_callback: Optional callback function(progress_percent, status_message)
+            parallel_plots: Render waveform plots in a process pool before building
+                the document. Worth it for reports with many waveforms; the worker
+                start-up cost outweighs the gain for small reports.
         """
         if not REPORTLAB_AVAILABLE:
             raise ImportError("reportlab is required for PDF generation. " "Install with: pip install reportlab")
@@ -79,86 +321,31 @@ class PDFReportGenerator(BaseReportGenerator):
         self.plot_style = plot_style or PlotStyle()
         self.report_options = report_options or ReportOptions()
         self.progress_callback = progress_callback
+        self.parallel_plots = parallel_plots
 
-        # Set up styles
-        self.styles = getSampleStyleSheet()
-        self._setup_custom_styles()
-
-    def _setup_custom_styles(self):
-        """Set up custom paragraph styles."""
-        # Title style
-        self.styles.add(
-            ParagraphStyle(
-                name="ReportTitle",
-                parent=self.styles["Heading1"],
-                fontSize=24,
-                textColor=colors.HexColor("#1f77b4"),
-                spaceAfter=30,
-                alignment=TA_CENTER,
-            )
-        )
+        # WaveformAnalyzer results keyed by (id(voltage_data), include_plateau_stability).
+        # The array is kept alongside the stats so a recycled id() can never match.
+        self._stats_cache: Dict[Tuple[int, bool], Tuple[np.ndarray, Dict[str, Any]]] = {}
 
-        # Section heading
-        self.styles.add(
-            ParagraphStyle(
-                name="SectionHeading",
-                parent=self.styles["Heading2"],
-                fontSize=16,
-                textColor=colors.HexColor("#1f77b4"),
-                spaceAfter=12,
-                spaceBefore=20,
-            )
-        )
+        # os.path.isfile() results for logo/section images, so a path used
+        # more than once in a report is only stat()ed once
+        self._is_file_cache: Dict[str, bool] = {}
 
-        # Subsection heading
-        self.styles.add(
-            ParagraphStyle(
-                name="SubsectionHeading",
-                parent=self.styles["Heading3"],
-                fontSize=14,
-                textColor=colors.HexColor("#2ca02c"),
-                spaceAfter=10,
-                spaceBefore=15,
-            )
-        )
+        # Decimated plot envelopes, keyed and validated like _stats_cache
+        self._envelope_cache: Dict[int, Tuple[np.ndarray, Tuple[np.ndarray, np.ndarray]]] = {}
 
-        # Waveform heading (for individual waveforms)
-        # Only add if it doesn't exist
-        if "Heading4" not in self.styles:
-            self.styles.add(
-                ParagraphStyle(
-                    name="Heading4",
-                    parent=self.styles["Heading3"],
-                    fontSize=12,
-                    textColor=colors.HexColor("#ff7f0e"),
-                    spaceAfter=6,
-                    spaceBefore=10,
-                )
-            )
+        # Shared figure and savefig scratch buffer reused by every plot
+        self._fig: Optional[Figure] = None
+        self._ax = None
+        self._fig_style: Optional[str] = None
+        self._savefig_buf = io.BytesIO()
 
-        # Result PASS style
-        self.styles.add(
-            ParagraphStyle(
-                name="ResultPass",
-                parent=self.styles["Normal"],
-                fontSize=18,
-                textColor=colors.HexColor("#2ca02c"),
-                alignment=TA_CENTER,
-                spaceAfter=20,
-            )
-        )
+        # Rendered waveform plot JPEGs keyed by a digest of the plotted data and
+        # style, so a trace repeated across sections is rasterized once
+        self._plot_cache: Dict[bytes, bytes] = {}
 
-        # Result FAIL style
-        self.styles.add(
-            ParagraphStyle(
-                name="ResultFail",
-                parent=self.styles["Normal"],
-                fontSize=18,
-                textColor=colors.HexColor("#d62728"),
-                alignment=TA_CENTER,
-                spaceAfter=20,
-            )
-        )
+        # Set up styles (shared by all generators; treat as read-only)
+        self.styles = _build_styles()
 
     def get_file_extension(self) -> str:
         """Get file extension."""
@@ -194,81 +381,18 @@ class PDFReportGenerator(BaseReportGenerator):
         if not text:
             return ""
 
-        # Normalize unicode characters that might cause rendering issues
-        # These are commonly used by LLMs but may not render properly in PDFs
-
-        # Dashes and hyphens
-        text = text.replace("\u2013", "-")  # en-dash
-        text = text.replace("\u2014", "-")  # em-dash
-        text = text.replace("\u2212", "-")  # minus sign
-        text = text.replace("\u00ad", "")  # soft hyphen (remove)
+        # Fast path: plain text needs nothing but line breaks
+        if _MARKUP_CHARS.isdisjoint(text):
+            return text.replace("\n", "<br/>")
 
-        # Quotes
-        text = text.replace("\u2018", "'")  # left single quote
-        text = text.replace("\u2019", "'")  # right single quote
-        text = text.replace("\u201a", "'")  # single low-9 quote
-        text = text.replace("\u201c", '"')  # left double quote
-        text = text.replace("\u201d", '"')  # right double quote
-        text = text.replace("\u201e", '"')  # double low-9 quote
-
-        # Bullets and symbols
-        text = text.replace("\u2022", "*")  # bullet
-        text = text.replace("\u2023", "*")  # triangular bullet
-        text = text.replace("\u2043", "*")  # hyphen bullet
-        text = text.replace("\u25e6", "*")  # white bullet
-        text = text.replace("\u2219", "*")  # bullet operator
-
-        # Ellipsis
-        text = text.replace("\u2026", "...")  # horizontal ellipsis
-
-        # Spaces
-        text = text.replace("\u00a0", " ")  # non-breaking space
-        text = text.replace("\u2009", " ")  # thin space
-        text = text.replace("\u200a", " ")  # hair space
-
-        # Mathematical symbols
-        text = text.replace("\u00d7", "x")  # multiplication sign
-        text = text.replace("\u00f7", "/")  # division sign
-        text = text.replace("\u2264", "<=")  # less than or equal
-        text = text.replace("\u2265", ">=")  # greater than or equal
-        text = text.replace("\u2260", "!=")  # not equal
-
-        # Degrees and other symbols
-        text = text.replace("\u00b0", " deg")  # degree symbol
-        text = text.replace("\u2103", " C")  # degree celsius
-        text = text.replace("\u2109", " F")  # degree fahrenheit
-
-        # Store markdown patterns before escaping
-        # We'll process them in order to avoid conflicts
-
-        # First, protect code blocks (they shouldn't be processed)
-        code_blocks = {}
-
-        def save_code(match):
-            key = f"__CODE_{len(code_blocks)}__"
-            code_blocks[key] = match.group(1)
-            return key
-
-        text = re.sub(r"`(.+?)`", save_code, text)
-
-        # Escape XML characters (but not in our saved code blocks)
-        text = text.replace("&", "&amp;")
-        text = text.replace("<", "&lt;")
-        text = text.replace(">", "&gt;")
-
-        # Convert markdown bold (**text** or __text__)
-        text = re.sub(r"\*\*(.+?)\*\*", r"<b>\1</b>", text)
-        text = re.sub(r"__(.+?)__", r"<b>\1</b>", text)
-
-        # Convert markdown italic (*text* or _text_)
-        text = re.sub(r"(?<!\*)\*(?!\*)(.+?)(?<!\*)\*(?!\*)", r"<i>\1</i>", text)
-        text = re.sub(r"(?<!_)_(?!_)(.+?)(?<!_)_(?!_)", r"<i>\1</i>", text)
+        # Normalize unicode characters that might cause rendering issues
+        # (one translate pass instead of a replace() scan per character)
+        text = text.translate(_UNICODE_NORMALIZE)
 
-        # Restore code blocks with proper formatting
-        for key, code in code_blocks.items():
-            # Escape the code content too
-            code = code.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
-            text = text.replace(key, f'<font face="Courier">{code}</font>')
+        # Escape XML characters, then convert code, bold and italic markup in a
+        # single left-to-right scan (code span content is left unformatted)
+        text = text.translate(_XML_ESCAPE)
+        text = _MARKDOWN_RE.sub(_markdown_span, text)
 
         # Convert line breaks
         text = text.replace("\n", "<br/>")
@@ -295,7 +419,10 @@ class PDFReportGenerator(BaseReportGenerator):
 
             self._report_progress(0, "Starting PDF generation")
 
-            # Create PDF document
+            # Create PDF document. ReportLab assembles the whole file in memory
+            # and writes it with a single write() when the build finishes, so
+            # passing the path (rather than a pre-opened buffered file) costs
+            # nothing and leaves no empty file behind if the build fails.
             doc = SimpleDocTemplate(
                 str(output_path),
                 pagesize=self.page_size,
@@ -307,6 +434,12 @@ class PDFReportGenerator(BaseReportGenerator):
 
             self._report_progress(5, "Building document structure")
 
+            if self.report_options.include_statistics_table:
+                self._prime_stats_cache(report)
+
+            if self.include_plots and self.parallel_plots:
+                self._prerender_waveform_plots(report)
+
             # Calculate progress steps
             # 5% - setup
             # 10% - header/metadata
@@ -386,14 +519,38 @@ class PDFReportGenerator(BaseReportGenerator):
             traceback.print_exc()
             return False
 
+        finally:
+            # Don't pin waveform arrays (or stale stats and plots) between reports
+            self._stats_cache.clear()
+            self._is_file_cache.clear()
+            self._envelope_cache.clear()
+            self._plot_cache.clear()
+
+    def _is_file(self, path) -> bool:
+        """
+        Check whether an image path points to an existing file.
+
+        Args:
+            path: str or PathLike image path
+
+        Returns:
+            True if the path is an existing regular file
+        """
+        path = os.fspath(path)
+        result = self._is_file_cache.get(path)
+        if result is None:
+            result = self._is_file_cache[path] = os.path.isfile(path)
+        return result
+
     def _generate_header(self, report: TestReport) -> List:
         """Generate report header."""
         story = []
 
         # Company logo if available
-        if report.metadata.company_logo_path and Path(report.metadata.company_logo_path).exists():
+        logo_path = report.metadata.company_logo_path
+        if logo_path and self._is_file(logo_path):
             try:
-                logo = RLImage(str(report.metadata.company_logo_path), width=2 * inch, height=1 * inch)
+                logo = RLImage(os.fspath(logo_path), width=2 * inch, height=1 * inch)
                 logo.hAlign = "CENTER"
                 story.append(logo)
                 story.append(Spacer(1, 0.2 * inch))
@@ -421,22 +578,7 @@ class PDFReportGenerator(BaseReportGenerator):
             ["Test Date:", meta.test_date.strftime("%Y-%m-%d %H:%M:%S")],
         ]
 
-        if meta.equipment_model:
-            data.append(["Equipment:", meta.equipment_model])
-        if meta.equipment_id:
-            data.append(["Equipment ID:", meta.equipment_id])
-        if meta.test_procedure:
-            data.append(["Test Procedure:", meta.test_procedure])
-        if meta.project_name:
-            data.append(["Project:", meta.project_name])
-        if meta.customer:
-            data.append(["Customer:", meta.customer])
-        if meta.temperature:
-            data.append(["Temperature:", meta.temperature])
-        if meta.humidity:
-            data.append(["Humidity:", meta.humidity])
-        if meta.location:
-            data.append(["Location:", meta.location])
+        data += [[label, value] for label, attr in self._METADATA_FIELDS if (value := getattr(meta, attr))]
 
         table = Table(data, colWidths=[2 * inch, 4.5 * inch])
         table.setStyle(
@@ -518,10 +660,10 @@ class PDFReportGenerator(BaseReportGenerator):
 
         story.append(Paragraph("Key Findings", self.styles["SectionHeading"]))
 
-        for finding in report.key_findings:
-            # Convert markdown to ReportLab XML
-            finding_text = self._markdown_to_reportlab(finding)
-            story.append(Paragraph(f"• {finding_text}", self.styles["Normal"]))
+        # One paragraph with line breaks lays out like one per item (Normal has
+        # no paragraph spacing) but costs a single ReportLab XML parse
+        findings = "<br/>".join(f"• {self._markdown_to_reportlab(finding)}" for finding in report.key_findings)
+        story.append(Paragraph(findings, self.styles["Normal"]))
 
         story.append(Spacer(1, 0.2 * inch))
 
@@ -594,9 +736,9 @@ class PDFReportGenerator(BaseReportGenerator):
         if section.images:
             story.append(Paragraph("Images", self.styles["SubsectionHeading"]))
             for img_path in section.images:
-                if Path(img_path).exists():
+                if self._is_file(img_path):
                     try:
-                        img = RLImage(str(img_path), width=self.plot_width, height=self.plot_height)
+                        img = RLImage(os.fspath(img_path), width=self.plot_width, height=self.plot_height)
                         story.append(img)
                         story.append(Spacer(1, 0.1 * inch))
                     except Exception:
@@ -638,8 +780,7 @@ class PDFReportGenerator(BaseReportGenerator):
             story.append(KeepTogether(keep_together_elements))
 
         # Info table (can be on next page if needed)
-        v_min = np.min(waveform.voltage_data)
-        v_max = np.max(waveform.voltage_data)
+        v_min, v_max = self._voltage_extrema(waveform)
         v_pp = v_max - v_min
 
         data = [
@@ -875,55 +1016,105 @@ class PDFReportGenerator(BaseReportGenerator):
             ReportLab Image object, or None if generation fails
         """
         try:
-            from io import BytesIO
-
-            import matplotlib.pyplot as plt
-
             # Extract region data
             t, v = waveform.get_region_data(region)
 
             if len(t) == 0:
                 return None
 
-            # Apply plot style
-            if self.plot_style.matplotlib_style != "default":
-                plt.style.use(self.plot_style.matplotlib_style)
+            with _plot_style_context(self.plot_style):
+                ax = self._plot_axes((6, 3))
 
-            fig, ax = plt.subplots(figsize=(6, 3))
+                # Plot the region
+                ax.plot(t * 1e3, v, color=region.highlight_color or self.plot_style.waveform_color, linewidth=self.plot_style.waveform_linewidth)
 
-            # Plot the region
-            ax.plot(t * 1e3, v, color=region.highlight_color or self.plot_style.waveform_color, linewidth=self.plot_style.waveform_linewidth)
+                # Add reference line for ideal value
+                if region.ideal_value is not None:
+                    ax.axhline(y=region.ideal_value, color="red", linestyle="--", linewidth=1, label=f"Ideal: {region.ideal_value:.4f}V", alpha=0.6)
+                    ax.legend(fontsize=8)
 
-            # Add reference line for ideal value
-            if region.ideal_value is not None:
-                ax.axhline(y=region.ideal_value, color="red", linestyle="--", linewidth=1, label=f"Ideal: {region.ideal_value:.4f}V", alpha=0.6)
-                ax.legend(fontsize=8)
+                # Labels
+                ax.set_xlabel("Time (ms)", fontsize=self.plot_style.label_fontsize)
+                ax.set_ylabel("Voltage (V)", fontsize=self.plot_style.label_fontsize)
+                ax.set_title(f"{region.label} - Zoomed View", fontsize=self.plot_style.title_fontsize)
 
-            # Apply style to axes
-            self.plot_style.apply_to_axes(ax)
+                ax.grid(True, alpha=0.3)
 
-            # Labels
-            ax.set_xlabel("Time (ms)", fontsize=self.plot_style.label_fontsize)
-            ax.set_ylabel("Voltage (V)", fontsize=self.plot_style.label_fontsize)
-            ax.set_title(f"{region.label} - Zoomed View", fontsize=self.plot_style.title_fontsize)
+                return self._render_plot(width=5 * inch, height=2.5 * inch)
 
-            ax.grid(True, alpha=0.3)
+        except Exception as e:
+            print(f"Error generating region plot: {e}")
+            return None
 
-            plt.tight_layout()
+    def _analyze_waveform(self, waveform: WaveformData) -> Dict[str, Any]:
+        """
+        Run WaveformAnalyzer on a waveform, reusing earlier results.
 
-            # Convert to image
-            buf = BytesIO()
-            plt.savefig(buf, format="png", dpi=150, bbox_inches="tight")
-            buf.seek(0)
-            plt.close(fig)
+        Args:
+            waveform: Waveform data to analyze
 
-            # Create ReportLab image
-            img = RLImage(buf, width=5 * inch, height=2.5 * inch)
-            return img
+        Returns:
+            Dictionary of calculated statistics
+        """
+        include_plateau = self.report_options.include_plateau_stability
+        key = (id(waveform.voltage_data), include_plateau)
+        cached = self._stats_cache.get(key)
+        if cached is not None and cached[0] is waveform.voltage_data:
+            return cached[1]
 
-        except Exception as e:
-            print(f"Error generating region plot: {e}")
-            return None
+        stats = WaveformAnalyzer.analyze(waveform, include_plateau_stability=include_plateau)
+        self._stats_cache[key] = (waveform.voltage_data, stats)
+        return stats
+
+    def _prime_stats_cache(self, report: TestReport) -> None:
+        """
+        Analyze all section waveforms up front with one batched call.
+
+        Channels of the same record length share a single FFT; the results
+        land in the stats cache used by _analyze_waveform().
+
+        Args:
+            report: Test report
+        """
+        include_plateau = self.report_options.include_plateau_stability
+        pending = {}
+        for section in report.sections:
+            for waveform in section.waveforms:
+                key = (id(waveform.voltage_data), include_plateau)
+                if key not in self._stats_cache:
+                    pending.setdefault(key, waveform)
+        if len(pending) < 2:
+            return
+
+        all_stats = WaveformAnalyzer.analyze_batch(list(pending.values()), include_plateau_stability=include_plateau)
+        for key, waveform, stats in zip(pending, pending.values(), all_stats):
+            self._stats_cache[key] = (waveform.voltage_data, stats)
+
+    def _voltage_extrema(self, waveform: WaveformData) -> Tuple[float, float]:
+        """
+        Get the minimum and maximum voltage of a waveform.
+
+        When the statistics table is enabled the analyzer has to scan the
+        record anyway, so its vmin/vmax are reused. Otherwise, with plots
+        enabled, the extrema come from the plot's min/max envelope, which
+        already holds every column's minimum and maximum. Either way no extra
+        pass over the full voltage array is made.
+
+        Args:
+            waveform: Waveform data
+
+        Returns:
+            Tuple of (v_min, v_max)
+        """
+        if self.report_options.include_statistics_table:
+            stats = self._analyze_waveform(waveform)
+            return stats["vmin"], stats["vmax"]
+
+        if self.include_plots:
+            _, envelope = self._plot_envelope(waveform)
+            return np.min(envelope), np.max(envelope)
+
+        return np.min(waveform.voltage_data), np.max(waveform.voltage_data)
 
     def _generate_statistics_table(self, waveform: WaveformData) -> Optional[Table]:
         """
@@ -939,7 +1130,7 @@ class PDFReportGenerator(BaseReportGenerator):
             return None
 
         # Calculate all statistics using WaveformAnalyzer
-        stats = WaveformAnalyzer.analyze(waveform, include_plateau_stability=self.report_options.include_plateau_stability)
+        stats = self._analyze_waveform(waveform)
 
         # Build table data based on enabled categories
         data = [["Statistic", "Value"]]  # Header
@@ -952,64 +1143,10 @@ class PDFReportGenerator(BaseReportGenerator):
                 signal_type_str = f"{signal_type_str} ({confidence_str})"
             data.append(["Signal Type:", signal_type_str])
 
-        # Frequency and Period
-        if self.report_options.include_frequency_stats:
-            if stats.get("frequency") is not None:
-                data.append(["Frequency:", WaveformAnalyzer.format_stat_value("frequency", stats["frequency"])])
-            if stats.get("period") is not None:
-                data.append(["Period:", WaveformAnalyzer.format_stat_value("period", stats["period"])])
-
-        # Amplitude Measurements
-        if self.report_options.include_amplitude_stats:
-            if stats.get("vmax") is not None:
-                data.append(["Vmax:", WaveformAnalyzer.format_stat_value("vmax", stats["vmax"])])
-            if stats.get("vmin") is not None:
-                data.append(["Vmin:", WaveformAnalyzer.format_stat_value("vmin", stats["vmin"])])
-            if stats.get("vpp") is not None:
-                data.append(["Vpp:", WaveformAnalyzer.format_stat_value("vpp", stats["vpp"])])
-            if stats.get("vmean") is not None:
-                data.append(["Vmean:", WaveformAnalyzer.format_stat_value("vmean", stats["vmean"])])
-            if stats.get("vrms") is not None:
-                data.append(["Vrms:", WaveformAnalyzer.format_stat_value("vrms", stats["vrms"])])
-            if stats.get("vamp") is not None:
-                data.append(["Vamp:", WaveformAnalyzer.format_stat_value("vamp", stats["vamp"])])
-            if stats.get("dc_offset") is not None:
-                data.append(["DC Offset:", WaveformAnalyzer.format_stat_value("dc_offset", stats["dc_offset"])])
-
-        # Timing Measurements
-        if self.report_options.include_timing_stats:
-            if stats.get("rise_time") is not None:
-                data.append(["Rise Time:", WaveformAnalyzer.format_stat_value("rise_time", stats["rise_time"])])
-            if stats.get("fall_time") is not None:
-                data.append(["Fall Time:", WaveformAnalyzer.format_stat_value("fall_time", stats["fall_time"])])
-            if stats.get("pulse_width") is not None:
-                data.append(["Pulse Width:", WaveformAnalyzer.format_stat_value("pulse_width", stats["pulse_width"])])
-            if stats.get("duty_cycle") is not None:
-                data.append(["Duty Cycle:", WaveformAnalyzer.format_stat_value("duty_cycle", stats["duty_cycle"])])
-
-        # Signal Quality Metrics
-        if self.report_options.include_quality_stats:
-            if stats.get("noise_level") is not None:
-                data.append(["Noise Level:", WaveformAnalyzer.format_stat_value("noise_level", stats["noise_level"])])
-            if stats.get("snr") is not None:
-                data.append(["SNR:", WaveformAnalyzer.format_stat_value("snr", stats["snr"])])
-            if stats.get("thd") is not None:
-                data.append(["THD:", WaveformAnalyzer.format_stat_value("thd", stats["thd"])])
-            if stats.get("overshoot") is not None:
-                data.append(["Overshoot:", WaveformAnalyzer.format_stat_value("overshoot", stats["overshoot"])])
-            if stats.get("undershoot") is not None:
-                data.append(["Undershoot:", WaveformAnalyzer.format_stat_value("undershoot", stats["undershoot"])])
-            if stats.get("jitter") is not None:
-                data.append(["Jitter:", WaveformAnalyzer.format_stat_value("jitter", stats["jitter"])])
-
-        # Plateau Stability (if enabled and calculated)
-        if self.report_options.include_plateau_stability:
-            if stats.get("plateau_stability") is not None:
-                data.append(["Plateau Stability:", WaveformAnalyzer.format_stat_value("plateau_stability", stats["plateau_stability"])])
-            if stats.get("plateau_high_noise") is not None:
-                data.append(["High Plateau Noise:", WaveformAnalyzer.format_stat_value("plateau_high_noise", stats["plateau_high_noise"])])
-            if stats.get("plateau_low_noise") is not None:
-                data.append(["Low Plateau Noise:", WaveformAnalyzer.format_stat_value("plateau_low_noise", stats["plateau_low_noise"])])
+        # Statistic rows of each enabled category, skipping ones not calculated
+        for option, fields in self._STATISTIC_FIELDS:
+            if getattr(self.report_options, option):
+                data += [[label, WaveformAnalyzer.format_stat_value(key, value)] for key, label in fields if (value := stats.get(key)) is not None]
 
         # If only header row exists, don't create table
         if len(data) <= 1:
@@ -1050,30 +1187,18 @@ class PDFReportGenerator(BaseReportGenerator):
 
     def _generate_measurements_table(self, measurements: List[MeasurementResult]) -> Table:
         """Generate measurements table."""
-        data = [["Measurement", "Value", "Status", "Criteria"]]
-
-        for meas in measurements:
-            name = meas.name
-            if meas.channel:
-                name += f" ({meas.channel})"
+        statuses = ["PASS" if m.passed is True else "FAIL" if m.passed is False else "N/A" for m in measurements]
 
-            value = meas.format_value()
-
-            if meas.passed is True:
-                status = "PASS"
-            elif meas.passed is False:
-                status = "FAIL"
-            else:
-                status = "N/A"
-
-            criteria_parts = []
-            if meas.criteria_min is not None:
-                criteria_parts.append(f"min: {meas.criteria_min:.6g}")
-            if meas.criteria_max is not None:
-                criteria_parts.append(f"max: {meas.criteria_max:.6g}")
-            criteria = "\n".join(criteria_parts) if criteria_parts else "N/A"
-
-            data.append([name, value, status, criteria])
+        data = [["Measurement", "Value", "Status", "Criteria"]]
+        data += [
+            [
+                f"{m.name} ({m.channel})" if m.channel else m.name,
+                m.format_value(),
+                status,
+                _format_criteria(m.criteria_min, m.criteria_max),
+            ]
+            for m, status in zip(measurements, statuses)
+        ]
 
         table = Table(data, colWidths=[2 * inch, 1.5 * inch, 1 * inch, 2 * inch])
 
@@ -1093,47 +1218,219 @@ class PDFReportGenerator(BaseReportGenerator):
         ]
 
         # Color code pass/fail rows
-        for i, meas in enumerate(measurements, start=1):
-            if meas.passed is True:
-                style_commands.append(("TEXTCOLOR", (2, i), (2, i), colors.HexColor("#2ca02c")))
-            elif meas.passed is False:
-                style_commands.append(("TEXTCOLOR", (2, i), (2, i), colors.HexColor("#d62728")))
+        style_commands += [("TEXTCOLOR", (2, i), (2, i), _PASS_COLOR if status == "PASS" else _FAIL_COLOR) for i, status in enumerate(statuses, start=1) if status != "N/A"]
 
         table.setStyle(TableStyle(style_commands))
 
         return table
 
-    def _generate_waveform_plot(self, waveform: WaveformData) -> Optional[RLImage]:
-        """Generate waveform plot as image with custom style."""
+    def _plot_axes(self, figsize: Tuple[float, float]):
+        """
+        Get the shared plot axes, cleared and sized for a new plot.
+
+        Building a matplotlib Figure is far more expensive than clearing one,
+        so a single Agg figure is reused for every plot in the report and only
+        rebuilt when the matplotlib style preset changes. Must be called inside
+        _plot_style_context().
+
+        Args:
+            figsize: Figure size in inches (width, height)
+
+        Returns:
+            Matplotlib axes ready for plotting
+        """
+        style = self.plot_style.matplotlib_style
+        if self._fig is None or style != self._fig_style:
+            self._fig = _new_plot_figure()
+            self._ax = self._fig.axes[0]
+            self._fig_style = style
+        else:
+            self._ax.clear()
+
+        self._fig.set_size_inches(figsize)
+        return self._ax
+
+    @staticmethod
+    def _decimate_minmax(time: np.ndarray, voltage: np.ndarray, n_columns: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Reduce a long record to its min/max envelope, two points per column.
+
+        Each output pixel column keeps the minimum and maximum voltage of its
+        samples, so peaks and glitches stay visible while Agg only rasterizes
+        about twice the image width in vertices.
+
+        Args:
+            time: Time array
+            voltage: Voltage array
+            n_columns: Number of pixel columns in the rendered plot
+
+        Returns:
+            Tuple of (time, voltage), unchanged for records of at most four
+            samples per column
+        """
+        if n_columns <= 0 or len(voltage) <= 4 * n_columns:
+            return time, voltage
+
+        bins = np.linspace(0, len(voltage), n_columns + 1, dtype=np.intp)[:-1]
+
+        decimated_time = np.repeat(time[bins], 2)
+        decimated_voltage = np.empty(2 * n_columns, dtype=voltage.dtype)
+        np.minimum.reduceat(voltage, bins, out=decimated_voltage[0::2])
+        np.maximum.reduceat(voltage, bins, out=decimated_voltage[1::2])
+        return decimated_time, decimated_voltage
+
+    def _render_plot(self, width: float, height: float) -> RLImage:
+        """
+        Render the shared figure to a ReportLab image.
+
+        Args:
+            width: Image width on the page (points)
+            height: Image height on the page (points)
+
+        Returns:
+            ReportLab Image object
+        """
+        return RLImage(io.BytesIO(self._figure_jpeg(self._fig, self._savefig_buf)), width=width, height=height)
+
+    @classmethod
+    def _figure_jpeg(cls, fig: Figure, buf: io.BytesIO) -> bytes:
+        """
+        Encode a figure as JPEG bytes.
+
+        Args:
+            fig: Figure to render
+            buf: Scratch buffer reused across calls; it is rewound and
+                truncated here, and the returned bytes are a copy
+
+        Returns:
+            JPEG image data
+        """
+        # Laid out to fill the figure, so no bbox_inches="tight" second render pass
+        fig.tight_layout()
+
+        # JPEG streams are embedded in the PDF as-is (DCTDecode), whereas a PNG
+        # would be decoded back to pixels and recompressed by ReportLab
+        buf.seek(0)
+        buf.truncate()
+        fig.savefig(buf, format="jpeg", dpi=cls.PLOT_DPI, pil_kwargs={"quality": cls.PLOT_JPEG_QUALITY})
+        return buf.getvalue()
+
+    @classmethod
+    def _draw_waveform_plot(cls, ax, time: np.ndarray, voltage: np.ndarray, color: str, label: str, plot_style: PlotStyle) -> None:
+        """
+        Draw a waveform onto cleared axes.
+
+        Shared by the in-process renderer and the parallel plot workers.
+
+        Args:
+            ax: Matplotlib axes sized for the plot
+            time: Time array (seconds)
+            voltage: Voltage array
+            color: Trace color
+            label: Plot title
+            plot_style: Plot style configuration
+        """
+        # Long records are reduced to their min/max envelope before scaling to µs
+        n_columns = int(ax.figure.get_figwidth() * cls.PLOT_DPI)
+        time_data, voltage_data = cls._decimate_minmax(time, voltage, n_columns)
+
+        # Use plot style colors and settings
+        ax.plot(time_data * 1e6, voltage_data, color=color, linewidth=plot_style.waveform_linewidth)
+
+        # Set labels with custom font sizes
+        ax.set_xlabel("Time (µs)", fontsize=plot_style.label_fontsize)
+        ax.set_ylabel("Voltage (V)", fontsize=plot_style.label_fontsize)
+        ax.set_title(label, fontsize=plot_style.title_fontsize, fontweight="bold")
+
+    def _prerender_waveform_plots(self, report: TestReport) -> None:
+        """
+        Render every section waveform plot in a process pool.
+
+        The JPEGs are stored in the plot cache and picked up by
+        _generate_waveform_plot(). On any failure plots are rendered serially
+        as usual.
+
+        Args:
+            report: Test report
+        """
+        # Workers get only the decimated plot data; identical traces are rendered once
+        jobs = dict(self._waveform_plot_job(waveform) for section in report.sections for waveform in section.waveforms)
+        if len(jobs) < 2:
+            return
+
+        self._report_progress(6, f"Rendering {len(jobs)} plots in parallel")
+        figsize = (self.plot_width / inch, self.plot_height / inch)
+
         try:
-            # Apply matplotlib style preset
-            if self.plot_style.matplotlib_style != "default":
-                plt.style.use(self.plot_style.matplotlib_style)
+            with ProcessPoolExecutor() as pool:
+                images = list(pool.map(_render_waveform_jpeg, jobs.values(), repeat(self.plot_style), repeat(figsize)))
+        except Exception as e:
+            print(f"Parallel plot rendering failed, rendering serially: {e}")
+            return
+
+        self._plot_cache.update(zip(jobs, images))
+
+    def _plot_envelope(self, waveform: WaveformData) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get a waveform's decimated plot data, computing it once per report.
+
+        Args:
+            waveform: Waveform data
 
-            fig, ax = plt.subplots(figsize=(self.plot_width / inch, self.plot_height / inch))
+        Returns:
+            Tuple of (time, voltage) as drawn in the waveform plot
+        """
+        cached = self._envelope_cache.get(id(waveform.voltage_data))
+        if cached is not None and cached[0] is waveform.voltage_data:
+            return cached[1]
 
-            # Use plot style colors and settings
-            ax.plot(waveform.time_data * 1e6, waveform.voltage_data, color=waveform.color or self.plot_style.waveform_color, linewidth=self.plot_style.waveform_linewidth)
+        n_columns = int(self.plot_width / inch * self.PLOT_DPI)
+        envelope = self._decimate_minmax(waveform.time_data, waveform.voltage_data, n_columns)
+        self._envelope_cache[id(waveform.voltage_data)] = (waveform.voltage_data, envelope)
+        return envelope
 
-            # Apply style to axes
-            self.plot_style.apply_to_axes(ax)
+    def _waveform_plot_job(self, waveform: WaveformData) -> Tuple[bytes, Tuple[np.ndarray, np.ndarray, str, str]]:
+        """
+        Prepare a waveform for plotting and compute its plot cache key.
 
-            # Set labels with custom font sizes
-            ax.set_xlabel("Time (µs)", fontsize=self.plot_style.label_fontsize)
-            ax.set_ylabel("Voltage (V)", fontsize=self.plot_style.label_fontsize)
-            ax.set_title(waveform.label, fontsize=self.plot_style.title_fontsize, fontweight="bold")
+        The key digests the decimated data rather than the raw record: the
+        envelope is all that reaches the image, and hashing it is cheap even
+        for multi-megasample captures.
 
-            plt.tight_layout()
+        Args:
+            waveform: Waveform data
 
-            # Save to buffer
-            buf = io.BytesIO()
-            plt.savefig(buf, format="png", dpi=150, bbox_inches="tight")
-            plt.close(fig)
-            buf.seek(0)
+        Returns:
+            Tuple of (cache key, (time, voltage, color, label))
+        """
+        time_data, voltage_data = self._plot_envelope(waveform)
+        color = waveform.color or self.plot_style.waveform_color
+
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(np.ascontiguousarray(time_data))
+        digest.update(np.ascontiguousarray(voltage_data))
+        digest.update(repr((time_data.dtype.str, voltage_data.dtype.str, color, waveform.label, self.plot_width, self.plot_height, self.plot_style)).encode())
+        return digest.digest(), (time_data, voltage_data, color, waveform.label)
 
-            # Create ReportLab image
-            img = RLImage(buf, width=self.plot_width, height=self.plot_height)
-            return img
+    def close(self) -> None:
+        """Release the shared plotting figure."""
+        self._fig = None
+        self._ax = None
+        self._fig_style = None
+
+    def _generate_waveform_plot(self, waveform: WaveformData) -> Optional[RLImage]:
+        """Generate waveform plot as image with custom style."""
+        try:
+            key, (time_data, voltage_data, color, label) = self._waveform_plot_job(waveform)
+
+            image = self._plot_cache.get(key)
+            if image is None:
+                with _plot_style_context(self.plot_style):
+                    ax = self._plot_axes((self.plot_width / inch, self.plot_height / inch))
+                    self._draw_waveform_plot(ax, time_data, voltage_data, color, label, self.plot_style)
+                    image = self._plot_cache[key] = self._figure_jpeg(self._fig, self._savefig_buf)
+
+            return RLImage(io.BytesIO(image), width=self.plot_width, height=self.plot_height)
 
         except Exception as e:
             print(f"Failed to generate waveform plot: {e}")
@@ -1142,34 +1439,22 @@ class PDFReportGenerator(BaseReportGenerator):
     def _generate_fft_plot(self, frequency: np.ndarray, magnitude: np.ndarray) -> Optional[RLImage]:
         """Generate FFT plot as image with custom style."""
         try:
-            # Apply matplotlib style preset
-            if self.plot_style.matplotlib_style != "default":
-                plt.style.use(self.plot_style.matplotlib_style)
-
-            fig, ax = plt.subplots(figsize=(self.plot_width / inch, self.plot_height / inch))
+            with _plot_style_context(self.plot_style):
+                ax = self._plot_axes((self.plot_width / inch, self.plot_height / inch))
 
-            # Use plot style colors and settings
-            ax.plot(frequency / 1e6, magnitude, color=self.plot_style.fft_color, linewidth=self.plot_style.waveform_linewidth)
+                # Reduce long spectra to their min/max envelope (peaks survive) before scaling to MHz
+                n_columns = int(self.plot_width / inch * self.PLOT_DPI)
+                frequency, magnitude = self._decimate_minmax(frequency, magnitude, n_columns)
 
-            # Apply style to axes
-            self.plot_style.apply_to_axes(ax)
+                # Use plot style colors and settings
+                ax.plot(frequency * 1e-6, magnitude, color=self.plot_style.fft_color, linewidth=self.plot_style.waveform_linewidth)
 
-            # Set labels with custom font sizes
-            ax.set_xlabel("Frequency (MHz)", fontsize=self.plot_style.label_fontsize)
-            ax.set_ylabel("Magnitude (dB)", fontsize=self.plot_style.label_fontsize)
-            ax.set_title("FFT Analysis", fontsize=self.plot_style.title_fontsize, fontweight="bold")
+                # Set labels with custom font sizes
+                ax.set_xlabel("Frequency (MHz)", fontsize=self.plot_style.label_fontsize)
+                ax.set_ylabel("Magnitude (dB)", fontsize=self.plot_style.label_fontsize)
+                ax.set_title("FFT Analysis", fontsize=self.plot_style.title_fontsize, fontweight="bold")
 
-            plt.tight_layout()
-
-            # Save to buffer
-            buf = io.BytesIO()
-            plt.savefig(buf, format="png", dpi=150, bbox_inches="tight")
-            plt.close(fig)
-            buf.seek(0)
-
-            # Create ReportLab image
-            img = RLImage(buf, width=self.plot_width, height=self.plot_height)
-            return img
+                return self._render_plot(width=self.plot_width, height=self.plot_height)
 
         except Exception as e:
             print(f"Failed to generate FFT plot: {e}")
@@ -1181,10 +1466,9 @@ class PDFReportGenerator(BaseReportGenerator):
 
         story.append(Paragraph("Recommendations", self.styles["SectionHeading"]))
 
-        for i, rec in enumerate(report.recommendations, 1):
-            # Convert markdown to ReportLab XML
-            rec_text = self._markdown_to_reportlab(rec)
-            story.append(Paragraph(f"{i}. {rec_text}", self.styles["Normal"]))
+        # Single paragraph, as in _generate_key_findings()
+        recommendations = "<br/>".join(f"{i}. {self._markdown_to_reportlab(rec)}" for i, rec in enumerate(report.recommendations, 1))
+        story.append(Paragraph(recommendations, self.styles["Normal"]))
 
         story.append(Spacer(1, 0.2 * inch))
 
@@ -1203,3 +1487,75 @@ class PDFReportGenerator(BaseReportGenerator):
         story.append(Paragraph(footer_text, self.styles["Normal"]))
 
         return story
+
+
+@contextmanager
+def _plot_style_context(plot_style: PlotStyle):
+    """
+    Apply a PlotStyle through rcParams while a plot is built and rendered.
+
+    Cleared axes pick up grid, background and font sizes from rcParams, and
+    tick labels are created at draw time, so the context has to span both.
+    The matplotlib style preset is applied the same way, so neither leaks
+    into the process-wide rcParams.
+
+    Args:
+        plot_style: Plot style configuration
+    """
+    import matplotlib.style
+
+    styles = [] if plot_style.matplotlib_style == "default" else [plot_style.matplotlib_style]
+    with matplotlib.style.context([*styles, plot_style.rc_params()]):
+        yield
+
+
+def _new_plot_figure() -> Figure:
+    """
+    Create a single-axes figure with an Agg canvas.
+
+    matplotlib is imported here rather than at module level, so this module
+    doesn't load it until the first plot is drawn. The figure bypasses
+    pyplot, so no global backend has to be selected. Call it inside
+    _plot_style_context() so the figure and axes pick up the plot style.
+
+    Returns:
+        New figure with one subplot
+    """
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    fig = Figure()
+    FigureCanvasAgg(fig)
+    fig.add_subplot()
+    return fig
+
+
+# Per-process figure for _render_waveform_jpeg() pool workers
+_worker_figure: Optional[Figure] = None
+_worker_buffer = io.BytesIO()
+
+
+def _render_waveform_jpeg(job: Tuple[np.ndarray, np.ndarray, str, str], plot_style: PlotStyle, figsize: Tuple[float, float]) -> bytes:
+    """
+    Render one waveform plot to JPEG bytes in a pool worker.
+
+    Args:
+        job: Tuple of (time, voltage, color, label)
+        plot_style: Plot style configuration
+        figsize: Figure size in inches (width, height)
+
+    Returns:
+        JPEG image data
+    """
+    global _worker_figure
+
+    with _plot_style_context(plot_style):
+        if _worker_figure is None:
+            _worker_figure = _new_plot_figure()
+        else:
+            _worker_figure.axes[0].clear()
+
+        _worker_figure.set_size_inches(figsize)
+        time, voltage, color, label = job
+        PDFReportGenerator._draw_waveform_plot(_worker_figure.axes[0], time, voltage, color, label, plot_style)
+        return PDFReportGenerator._figure_jpeg(_worker_figure, _worker_buffer)
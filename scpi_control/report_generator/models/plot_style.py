@@ -59,6 +59,28 @@ class PlotStyle:
         # Apply tick font size
         ax.tick_params(labelsize=self.tick_fontsize)
 
+    def rc_params(self) -> Dict[str, Any]:
+        """
+        Express this style as matplotlib rcParams.
+
+        Inside ``matplotlib.rc_context(style.rc_params())`` newly created or
+        cleared axes already match what apply_to_axes() would set, without
+        running its setters on every plot.
+
+        Returns:
+            Dictionary of rcParams overrides
+        """
+        return {
+            "axes.grid": self.grid_enabled,
+            "grid.alpha": self.grid_alpha,
+            "grid.color": self.grid_color,
+            "axes.facecolor": self.background_color,
+            "axes.titlesize": self.title_fontsize,
+            "axes.labelsize": self.label_fontsize,
+            "xtick.labelsize": self.tick_fontsize,
+            "ytick.labelsize": self.tick_fontsize,
+        }
+
     def to_dict(self) -> Dict[str, Any]:
         """
         Convert to dictionary.
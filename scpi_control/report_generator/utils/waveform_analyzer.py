@@ -5,14 +5,24 @@ Automatically computes frequency, amplitude, timing, and quality metrics
 from oscilloscope waveform data.
 """
 
-from typing import Dict, Optional, Tuple
+import os
+import threading
+from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
 from scipy import signal as scipy_signal
-from scipy.fft import fft, fftfreq
+from scipy.fft import fft, fftfreq, next_fast_len, rfft, rfftfreq
 
 from scpi_control.report_generator.models.report_data import WaveformData, WaveformRegion
 
+# Try to import pyFFTW for reusable FFT plans
+try:
+    import pyfftw
+
+    PYFFTW_AVAILABLE = True
+except ImportError:
+    PYFFTW_AVAILABLE = False
+
 
 class SignalType:
     """Signal type constants."""
@@ -31,6 +41,40 @@ class SignalType:
 class WaveformAnalyzer:
     """Analyzes waveform data to extract signal statistics."""
 
+    # FFTW rfft plans keyed by (record length, dtype). Acquisitions usually
+    # repeat the same record length, so only the first transform pays for
+    # planning. Plans own their input/output arrays, hence the lock.
+    _PLAN_CACHE: Dict[Tuple[int, np.dtype], Any] = {}
+    _PLAN_CACHE_SIZE = 8
+    _PLAN_LOCK = threading.Lock()
+
+    @classmethod
+    def clear_plan_cache(cls) -> None:
+        """Drop all cached FFT plans."""
+        with cls._PLAN_LOCK:
+            cls._PLAN_CACHE.clear()
+
+    @classmethod
+    def _rfft(cls, v: np.ndarray, n_fft: int) -> np.ndarray:
+        """
+        One-sided FFT of a real signal, zero-padded to n_fft samples.
+
+        Uses a cached pyFFTW plan when pyFFTW is installed; otherwise
+        scipy.fft, whose pocketfft backend keeps its own small plan cache.
+        """
+        if not PYFFTW_AVAILABLE or v.dtype not in (np.float32, np.float64):
+            return rfft(v, n=n_fft)
+
+        key = (len(v), v.dtype)
+        with cls._PLAN_LOCK:
+            plan = cls._PLAN_CACHE.get(key)
+            if plan is None:
+                if len(cls._PLAN_CACHE) >= cls._PLAN_CACHE_SIZE:
+                    cls._PLAN_CACHE.clear()
+                plan = cls._PLAN_CACHE[key] = pyfftw.builders.rfft(pyfftw.empty_aligned(len(v), dtype=v.dtype), n=n_fft, threads=os.cpu_count() or 1)
+            # The plan's output array is reused by the next call
+            return plan(v).copy()
+
     @staticmethod
     def analyze(waveform: WaveformData, include_plateau_stability: bool = False) -> Dict[str, Optional[float]]:
         """
@@ -42,6 +86,57 @@ class WaveformAnalyzer:
         Returns:
             Dictionary of calculated statistics
         """
+        return WaveformAnalyzer._analyze(waveform, include_plateau_stability)
+
+    @staticmethod
+    def analyze_batch(waveforms: List[WaveformData], include_plateau_stability: bool = False) -> List[Dict[str, Optional[float]]]:
+        """
+        Analyze several waveforms, e.g. all channels of one acquisition.
+
+        Equivalent to calling analyze() on each waveform, but same-length
+        records share a single 2-D FFT for the frequency statistics.
+
+        Args:
+            waveforms: Waveforms to analyze
+
+        Returns:
+            List of statistics dictionaries, in the order of waveforms
+        """
+        frequency_stats = WaveformAnalyzer._batch_frequency_stats(waveforms)
+        return [WaveformAnalyzer._analyze(waveform, include_plateau_stability, freq) for waveform, freq in zip(waveforms, frequency_stats)]
+
+    @staticmethod
+    def _batch_frequency_stats(waveforms: List[WaveformData]) -> List[Optional[Dict[str, Optional[float]]]]:
+        """
+        Calculate frequency stats for groups of same-length waveforms at once.
+
+        Returns:
+            List aligned with waveforms; None where the waveform was not batched
+        """
+        results: List[Optional[Dict[str, Optional[float]]]] = [None] * len(waveforms)
+
+        groups: Dict[int, List[int]] = {}
+        for i, waveform in enumerate(waveforms):
+            groups.setdefault(len(waveform.voltage_data), []).append(i)
+
+        for n, indices in groups.items():
+            if len(indices) < 2 or n < 2:
+                continue
+            try:
+                # Channels on axis 0 keep each row contiguous; float32 input stays float32
+                V = np.stack([waveforms[i].voltage_data for i in indices])
+                n_fft = next_fast_len(n, real=True)
+                YF = rfft(V, n=n_fft, axis=1, workers=-1)
+                for i, yf in zip(indices, YF):
+                    results[i] = WaveformAnalyzer._peak_frequency_stats(yf, n_fft, waveforms[i].sample_rate)
+            except Exception as e:
+                print(f"Error calculating batched frequency: {e}")
+
+        return results
+
+    @staticmethod
+    def _analyze(waveform: WaveformData, include_plateau_stability: bool = False, frequency_stats: Optional[Dict[str, Optional[float]]] = None) -> Dict[str, Optional[float]]:
+        """Body of analyze(), optionally with precomputed frequency stats."""
         stats = {}
 
         # Signal type detection
@@ -51,15 +146,18 @@ class WaveformAnalyzer:
 
         # Amplitude measurements
         stats.update(WaveformAnalyzer.calculate_amplitude_stats(waveform))
+        extrema = (stats["vmin"], stats["vmax"])
 
         # Frequency and period
-        stats.update(WaveformAnalyzer.calculate_frequency_stats(waveform))
+        if frequency_stats is None:
+            frequency_stats = WaveformAnalyzer.calculate_frequency_stats(waveform)
+        stats.update(frequency_stats)
 
         # Timing measurements
-        stats.update(WaveformAnalyzer.calculate_timing_stats(waveform))
+        stats.update(WaveformAnalyzer.calculate_timing_stats(waveform, extrema))
 
         # Signal quality metrics
-        stats.update(WaveformAnalyzer.calculate_quality_stats(waveform))
+        stats.update(WaveformAnalyzer.calculate_quality_stats(waveform, extrema))
 
         # Calculate THD for periodic signals
         if signal_type in [SignalType.SINE, SignalType.SQUARE, SignalType.TRIANGLE, SignalType.SAWTOOTH]:
@@ -84,7 +182,10 @@ class WaveformAnalyzer:
         vmin = np.min(v)
         vpp = vmax - vmin
         vmean = np.mean(v)
-        vrms = np.sqrt(np.mean(v**2))
+        # Sum of squares in one pass without a v**2 temporary; BLAS dot is
+        # exact enough for float64, float32 accumulates in float64 instead
+        sumsq = np.dot(v, v) if v.dtype == np.float64 else np.einsum("i,i->", v, v, dtype=np.float64)
+        vrms = np.sqrt(sumsq / len(v))
         vamp = (vmax + vmin) / 2  # Amplitude (middle of range)
 
         return {
@@ -104,32 +205,12 @@ class WaveformAnalyzer:
             v = waveform.voltage_data
             sample_rate = waveform.sample_rate
 
-            # Compute FFT
-            n = len(v)
-            yf = fft(v)
-            xf = fftfreq(n, 1 / sample_rate)
-
-            # Get positive frequencies only
-            pos_mask = xf > 0
-            xf_pos = xf[pos_mask]
-            yf_pos = np.abs(yf[pos_mask])
+            # Compute the one-sided FFT of the real signal, zero-padded to a
+            # length pocketfft factors cheaply (prime lengths are pathological)
+            n_fft = next_fast_len(len(v), real=True)
+            yf = WaveformAnalyzer._rfft(v, n_fft)
 
-            # Find peak frequency (excluding DC component)
-            if len(yf_pos) > 1:
-                # Skip first bin (DC)
-                peak_idx = np.argmax(yf_pos[1:]) + 1
-                frequency = xf_pos[peak_idx]
-                period = 1 / frequency if frequency > 0 else None
-
-                return {
-                    "frequency": frequency,
-                    "period": period,
-                }
-            else:
-                return {
-                    "frequency": None,
-                    "period": None,
-                }
+            return WaveformAnalyzer._peak_frequency_stats(yf, n_fft, sample_rate)
 
         except Exception as e:
             print(f"Error calculating frequency: {e}")
@@ -139,15 +220,51 @@ class WaveformAnalyzer:
             }
 
     @staticmethod
-    def calculate_timing_stats(waveform: WaveformData) -> Dict[str, Optional[float]]:
-        """Calculate timing measurements (rise time, fall time, pulse width, duty cycle)."""
+    def _peak_frequency_stats(yf: np.ndarray, n_fft: int, sample_rate: float) -> Dict[str, Optional[float]]:
+        """
+        Find frequency and period from a one-sided spectrum.
+
+        Args:
+            yf: rfft output of a length-n_fft transform
+            n_fft: Transform length
+            sample_rate: Sample rate of the transformed signal
+
+        Returns:
+            Dictionary with frequency and period of the strongest non-DC bin
+        """
+        # Find peak frequency (excluding DC component)
+        if len(yf) > 1:
+            # Skip first bin (DC); squared magnitude has the same argmax
+            spectrum = yf[1:]
+            peak_idx = np.argmax(spectrum.real**2 + spectrum.imag**2) + 1
+            frequency = rfftfreq(n_fft, 1 / sample_rate)[peak_idx]
+            period = 1 / frequency if frequency > 0 else None
+
+            return {
+                "frequency": frequency,
+                "period": period,
+            }
+        else:
+            return {
+                "frequency": None,
+                "period": None,
+            }
+
+    @staticmethod
+    def calculate_timing_stats(waveform: WaveformData, extrema: Optional[Tuple[float, float]] = None) -> Dict[str, Optional[float]]:
+        """
+        Calculate timing measurements (rise time, fall time, pulse width, duty cycle).
+
+        Args:
+            waveform: Waveform data
+            extrema: Precomputed (vmin, vmax), e.g. from calculate_amplitude_stats()
+        """
         try:
             v = waveform.voltage_data
             t = waveform.time_data
             dt = np.mean(np.diff(t))  # Average time step
 
-            vmax = np.max(v)
-            vmin = np.min(v)
+            vmin, vmax = extrema if extrema is not None else (np.min(v), np.max(v))
             vrange = vmax - vmin
 
             # Thresholds for timing measurements
@@ -156,10 +273,13 @@ class WaveformAnalyzer:
             v_50 = vmin + 0.5 * vrange  # 50%
 
             # Find edges (zero crossings of derivative)
-            dv = np.diff(v)
             rising_edges = np.where((v[:-1] < v_50) & (v[1:] >= v_50))[0]
             falling_edges = np.where((v[:-1] > v_50) & (v[1:] <= v_50))[0]
 
+            # 10% and 90% crossings are searched on these masks in C
+            below_low = v <= v_low
+            above_high = v >= v_high
+
             rise_time = None
             fall_time = None
             pulse_width = None
@@ -167,27 +287,15 @@ class WaveformAnalyzer:
 
             # Calculate rise time (first rising edge)
             if len(rising_edges) > 0:
-                edge_idx = rising_edges[0]
                 # Find 10% and 90% points around this edge
-                start_idx = edge_idx
-                while start_idx > 0 and v[start_idx] > v_low:
-                    start_idx -= 1
-                end_idx = edge_idx
-                while end_idx < len(v) - 1 and v[end_idx] < v_high:
-                    end_idx += 1
+                start_idx, end_idx = WaveformAnalyzer._edge_bounds(rising_edges[0], below_low, above_high)
 
                 if end_idx > start_idx:
                     rise_time = (end_idx - start_idx) * dt
 
             # Calculate fall time (first falling edge)
             if len(falling_edges) > 0:
-                edge_idx = falling_edges[0]
-                start_idx = edge_idx
-                while start_idx > 0 and v[start_idx] < v_high:
-                    start_idx -= 1
-                end_idx = edge_idx
-                while end_idx < len(v) - 1 and v[end_idx] > v_low:
-                    end_idx += 1
+                start_idx, end_idx = WaveformAnalyzer._edge_bounds(falling_edges[0], above_high, below_low)
 
                 if end_idx > start_idx:
                     fall_time = (end_idx - start_idx) * dt
@@ -221,28 +329,61 @@ class WaveformAnalyzer:
             }
 
     @staticmethod
-    def calculate_quality_stats(waveform: WaveformData) -> Dict[str, Optional[float]]:
-        """Calculate signal quality metrics (SNR, noise, overshoot, undershoot, jitter)."""
+    def _edge_bounds(edge_idx: int, start_mask: np.ndarray, end_mask: np.ndarray) -> Tuple[int, int]:
+        """
+        Find where a transition through edge_idx starts and ends.
+
+        Args:
+            edge_idx: Sample index of the 50% crossing
+            start_mask: True where the signal is still at the starting level
+            end_mask: True where the signal has reached the final level
+
+        Returns:
+            Tuple of (last start_mask index at or before edge_idx, first
+            end_mask index at or after it), clamped to the record bounds
+        """
+        # argmax on a bool array stops at the first True
+        before = start_mask[edge_idx::-1]
+        offset = int(np.argmax(before))
+        start_idx = edge_idx - offset if before[offset] else 0
+
+        after = end_mask[edge_idx:]
+        offset = int(np.argmax(after))
+        end_idx = edge_idx + offset if after[offset] else len(end_mask) - 1
+
+        return start_idx, end_idx
+
+    @staticmethod
+    def calculate_quality_stats(waveform: WaveformData, extrema: Optional[Tuple[float, float]] = None) -> Dict[str, Optional[float]]:
+        """
+        Calculate signal quality metrics (SNR, noise, overshoot, undershoot, jitter).
+
+        Args:
+            waveform: Waveform data
+            extrema: Precomputed (vmin, vmax), e.g. from calculate_amplitude_stats()
+        """
         try:
             v = waveform.voltage_data
 
             # Estimate noise level (high-frequency component)
-            # Use standard deviation of detrended signal
-            v_detrended = v - np.mean(v)
-            noise_level = np.std(v_detrended)
+            # Standard deviation about the mean; std() detrends internally
+            noise_level = v.std()
 
             # Signal to Noise Ratio (SNR)
-            vmax = np.max(v)
-            vmin = np.min(v)
+            vmin, vmax = extrema if extrema is not None else (np.min(v), np.max(v))
             signal_amplitude = (vmax - vmin) / 2
             snr = 20 * np.log10(signal_amplitude / noise_level) if noise_level > 0 else None
 
             # Overshoot and undershoot (percentage above/below steady-state levels)
             # This is approximate - we'll use top 10% and bottom 10% as steady state
-            v_sorted = np.sort(v)
-            n = len(v_sorted)
-            v_high_steady = np.mean(v_sorted[int(0.85 * n) : int(0.95 * n)])  # High steady state
-            v_low_steady = np.mean(v_sorted[int(0.05 * n) : int(0.15 * n)])  # Low steady state
+            # Only the 5/15/85/95% order statistics are needed, so partition
+            # around them (O(N) introselect) instead of sorting the record;
+            # each band then holds exactly the samples of the sorted slice
+            n = len(v)
+            p05, p15, p85, p95 = int(0.05 * n), int(0.15 * n), int(0.85 * n), int(0.95 * n)
+            v_part = np.partition(v, [p05, p15, p85, p95])
+            v_high_steady = np.mean(v_part[p85:p95])  # High steady state
+            v_low_steady = np.mean(v_part[p05:p15])  # Low steady state
 
             overshoot = ((vmax - v_high_steady) / (v_high_steady - v_low_steady)) * 100 if v_high_steady != v_low_steady else 0
             undershoot = ((v_low_steady - vmin) / (v_high_steady - v_low_steady)) * 100 if v_high_steady != v_low_steady else 0
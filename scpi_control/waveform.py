@@ -1,10 +1,11 @@
 """Waveform acquisition and data processing for Siglent oscilloscopes."""
 
 import logging
+import math
 import re
 import struct
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple, Union
 
 import numpy as np
 
@@ -26,6 +27,11 @@ WAVEFORM_CODE_CENTER = 0  # Center code value for signed integer ADC data
 class WaveformData:
     """Container for waveform data and metadata.
 
+    The GUI displays draw voltages as float32 (live view acquires into
+    float32 buffers, so those frames are used without conversion) and keep
+    time as float64 for nanosecond resolution on long records. Exported and
+    saved data always use the arrays as stored here.
+
     Attributes:
         time: Time values in seconds (numpy array)
         voltage: Voltage values in volts (numpy array)
@@ -89,6 +95,9 @@ class Waveform:
     converting to voltage/time arrays.
     """
 
+    # Rows formatted per write when saving CSV; bounds the temporary text
+    CSV_CHUNK_ROWS = 65536
+
     def __init__(self, oscilloscope: "Oscilloscope"):
         """Initialize waveform acquisition.
 
@@ -97,6 +106,10 @@ class Waveform:
         """
         self._scope = oscilloscope
 
+        # Last generated time axis, reused while record length and sample rate are unchanged
+        self._time_axis: Optional[np.ndarray] = None
+        self._time_axis_key: Optional[Tuple[int, float]] = None
+
     def acquire(self, channel: int, format: str = "BYTE") -> WaveformData:
         """Acquire waveform data from a channel.
 
@@ -111,17 +124,132 @@ class Waveform:
             InvalidParameterError: If channel number is invalid
             CommandError: If acquisition fails
         """
+        return self._acquire(channel, format)
+
+    def acquire_into(self, channel: int, out: Optional[np.ndarray], format: str = "BYTE") -> WaveformData:
+        """Acquire waveform data from a channel into a preallocated voltage buffer.
+
+        Intended for continuous acquisition loops that recycle buffers between
+        frames. ``out`` is reused when it is a float32 or float64 array matching
+        the record length; otherwise a new array of the same dtype is allocated. The returned waveform's
+        ``voltage`` is the array actually used, so callers can keep it for the
+        next acquisition. Its ``time`` is a read-only array shared by every
+        buffered acquisition with the same record length and sample rate.
+
+        Args:
+            channel: Channel number (1-4)
+            out: Preallocated voltage buffer, or None to allocate
+            format: Data format - 'BYTE' or 'WORD' (default: 'BYTE')
+
+        Returns:
+            WaveformData object whose voltage array may be ``out``
+
+        Raises:
+            InvalidParameterError: If channel number is invalid
+            CommandError: If acquisition fails
+        """
+        return self._acquire(channel, format, out)
+
+    def acquire_many(
+        self,
+        channels: List[int],
+        format: str = "BYTE",
+        out: Optional[Dict[int, np.ndarray]] = None,
+        on_error: Optional[Callable[[int, Exception], None]] = None,
+    ) -> List[WaveformData]:
+        """Acquire waveform data from several channels.
+
+        The timebase, sample rate and every channel's scale and offset are read
+        with one compound query instead of four queries per channel. Waveform
+        data blocks are then read channel by channel.
+
+        Args:
+            channels: Channel numbers (1-4), in acquisition order
+            format: Data format - 'BYTE' or 'WORD' (default: 'BYTE')
+            out: Optional per-channel voltage buffers to reuse (see acquire_into())
+            on_error: Optional callback ``on_error(channel, exception)``. When
+                given, a channel whose download fails is reported through it
+                and skipped, and the remaining channels are still acquired
+
+        Returns:
+            List of WaveformData objects in ``channels`` order (without the
+            failed channels when ``on_error`` is given)
+
+        Raises:
+            InvalidParameterError: If a channel number is invalid
+            CommandError: If acquisition fails
+        """
+        for channel in channels:
+            if not 1 <= channel <= 4:
+                raise exceptions.InvalidParameterError(f"Invalid channel number: {channel}. Must be 1-4.")
+
+        settings = self._get_settings(channels)
+        out = out or {}
+        waveforms = []
+        for channel in channels:
+            try:
+                waveforms.append(self._acquire(channel, format, out.get(channel), settings.get(channel)))
+            except Exception as e:
+                if on_error is None:
+                    raise
+                on_error(channel, e)
+        return waveforms
+
+    def _get_settings(self, channels: List[int]) -> Dict[int, Tuple[float, float, float, float]]:
+        """Read acquisition settings for several channels in one compound query.
+
+        Args:
+            channels: Channel numbers
+
+        Returns:
+            Dictionary mapping channel number to (voltage_scale, voltage_offset,
+            timebase, sample_rate). Empty if the scope did not answer every
+            part of the compound query, in which case callers fall back to
+            per-channel queries.
+        """
+        commands = ["TDIV?", "SARA?"]
+        for channel in channels:
+            commands += [f"C{channel}:VDIV?", f"C{channel}:OFST?"]
+        command = ";".join(commands)
+
+        try:
+            replies = self._scope.query_many(commands)
+        except exceptions.CommandError as e:
+            logger.debug(f"Compound settings query failed: {e}")
+            return {}
+
+        timebase = self._parse_value_with_units(replies[0], ("S",), "timebase", command=command)
+        sample_rate = self._parse_value_with_units(replies[1], ("SA/S", "SPS"), "sample rate", command=command)
+
+        settings = {}
+        for i, channel in enumerate(channels):
+            voltage_scale = self._parse_value_with_units(replies[2 + 2 * i], ("V",), "voltage scale", command=command)
+            voltage_offset = self._parse_value_with_units(replies[3 + 2 * i], ("V",), "voltage offset", command=command)
+            settings[channel] = (voltage_scale, voltage_offset, timebase, sample_rate)
+        return settings
+
+    def _acquire(
+        self,
+        channel: int,
+        format: str = "BYTE",
+        out: Optional[np.ndarray] = None,
+        settings: Optional[Tuple[float, float, float, float]] = None,
+    ) -> WaveformData:
+        """Shared implementation of acquire(), acquire_into() and acquire_many()."""
         if not 1 <= channel <= 4:
             raise exceptions.InvalidParameterError(f"Invalid channel number: {channel}. Must be 1-4.")
 
         logger.info(f"Acquiring waveform from channel {channel}")
 
-        # Get channel configuration
+        # Get channel configuration (unless already read by acquire_many())
         ch = f"C{channel}"
-        voltage_scale = self._get_voltage_scale(ch)
-        voltage_offset = self._get_voltage_offset(ch)
-        timebase = self._get_timebase()
-        sample_rate = self._get_sample_rate()
+        if settings is not None:
+            voltage_scale, voltage_offset, timebase, sample_rate = settings
+        else:
+            voltage_scale = self._get_voltage_scale(ch)
+            voltage_offset = self._get_voltage_offset(ch)
+            timebase = self._get_timebase()
+            sample_rate = self._get_sample_rate()
 
         # Request waveform data
         waveform_command = f"{ch}:WF? DAT2"  # DAT2 is binary format
@@ -137,10 +265,13 @@ class Waveform:
         # Convert to voltage using scale and offset
         # Formula: Voltage = (code - code_offset) * code_scale + voltage_offset
         # For 8-bit data: typically code_offset = 127 (or 128), code_scale = voltage_scale / 25
-        voltage = self._convert_to_voltage(voltage_data, voltage_scale, voltage_offset)
+        voltage = self._convert_to_voltage(voltage_data, voltage_scale, voltage_offset, out=out)
 
-        # Generate time axis
+        # Generate time axis. Buffered (acquire_into/live view) acquisitions
+        # share the cached read-only axis; everyone else gets their own array
         time = self._generate_time_axis(record_length, sample_rate, timebase)
+        if out is None:
+            time = time.copy()
 
         logger.info(f"Acquired {record_length} samples from channel {channel}")
 
@@ -296,7 +427,7 @@ class Waveform:
 
         return data
 
-    def _convert_to_voltage(self, codes: np.ndarray, voltage_scale: float, voltage_offset: float) -> np.ndarray:
+    def _convert_to_voltage(self, codes: np.ndarray, voltage_scale: float, voltage_offset: float, out: Optional[np.ndarray] = None) -> np.ndarray:
         """Convert raw ADC codes to voltage values.
 
         Uses conversion formula from Siglent SCPI programming manual:
@@ -309,9 +440,13 @@ class Waveform:
             codes: Raw ADC code values (signed int8 or int16)
             voltage_scale: Voltage scale in volts/division
             voltage_offset: Voltage offset in volts
+            out: Optional float32/float64 buffer to write into (replaced by a new
+                array of the same dtype if its shape does not match)
 
         Returns:
-            Voltage array in volts
+            Voltage array in volts. Without ``out`` this is float32 for 8-bit
+            codes, whose steps are far coarser than float32 resolution, and
+            float64 for 16-bit codes.
         """
         # Select conversion constants based on ADC resolution
         if codes.dtype == np.int8:
@@ -319,11 +454,18 @@ class Waveform:
         else:  # 16-bit data
             code_per_div = WAVEFORM_CODE_PER_DIV_16BIT
 
-        # Convert codes to voltage using Siglent formula
-        # Since we use signed integers, center code is 0
-        voltage = (codes.astype(np.float64) - WAVEFORM_CODE_CENTER) * (voltage_scale / code_per_div) - voltage_offset
+        if out is None or out.dtype not in (np.float32, np.float64):
+            out = np.empty(codes.shape, dtype=np.float32 if codes.dtype == np.int8 else np.float64)
+        elif out.shape != codes.shape:
+            out = np.empty(codes.shape, dtype=out.dtype)
 
-        return voltage
+        # Convert codes to voltage using Siglent formula, folded into
+        # code * k - (center * k + offset): two in-place passes, no temporaries
+        # Since we use signed integers, center code is 0
+        k = voltage_scale / code_per_div
+        np.multiply(codes, k, out=out, dtype=out.dtype)
+        out -= WAVEFORM_CODE_CENTER * k + voltage_offset
+        return out
 
     def _generate_time_axis(self, num_samples: int, sample_rate: float, timebase: float) -> np.ndarray:
         """Generate time axis for waveform.
@@ -334,8 +476,13 @@ class Waveform:
             timebase: Timebase in s/div
 
         Returns:
-            Time array in seconds
+            Time array in seconds (read-only and cached; copy it before handing
+            it to callers that did not ask for a shared axis)
         """
+        key = (num_samples, sample_rate)
+        if self._time_axis is not None and self._time_axis_key == key:
+            return self._time_axis
+
         # Calculate time interval
         dt = 1.0 / sample_rate
 
@@ -345,7 +492,10 @@ class Waveform:
         trigger_position = total_time / 2  # Assume trigger at center
 
         time = np.arange(num_samples) * dt - trigger_position
+        time.setflags(write=False)
 
+        self._time_axis = time
+        self._time_axis_key = key
         return time
 
     def _parse_value_with_units(
@@ -493,7 +643,6 @@ class Waveform:
             include_metadata: Whether to include metadata header
             metadata: Optional additional metadata
         """
-        import csv
         from datetime import datetime
 
         with open(filename, "w", newline="") as f:
@@ -512,14 +661,41 @@ class Waveform:
 
                 f.write("#\n")
 
-            # Write data
-            writer = csv.writer(f)
-            writer.writerow(["Time (s)", "Voltage (V)"])
-            for t, v in zip(waveform.time, waveform.voltage):
-                writer.writerow([t, v])
+            # Write data. Each chunk is formatted by a single %-operation, so
+            # the per-sample work happens in C rather than a Python row loop;
+            # values get enough significant digits to read back bit-exact
+            time = np.asarray(waveform.time)
+            voltage = np.asarray(waveform.voltage)
+            row_fmt = f"{self._csv_float_format(time)},{self._csv_float_format(voltage)}\r\n"
+            f.write("Time (s),Voltage (V)\r\n")
+            n = min(len(time), len(voltage))
+            rows = np.empty((min(n, self.CSV_CHUNK_ROWS), 2))
+            for start in range(0, n, self.CSV_CHUNK_ROWS):
+                stop = min(start + self.CSV_CHUNK_ROWS, n)
+                chunk = rows[: stop - start]
+                chunk[:, 0] = time[start:stop]
+                chunk[:, 1] = voltage[start:stop]
+                f.write((row_fmt * len(chunk)) % tuple(chunk.ravel().tolist()))
 
         logger.info(f"Waveform saved to {filename} (CSV format, metadata={'included' if include_metadata else 'excluded'})")
 
+    @staticmethod
+    def _csv_float_format(values: np.ndarray) -> str:
+        """Get a %-format whose output parses back to exactly the same values.
+
+        Like the ``repr()`` that csv.writer used, the text round-trips
+        losslessly: a p-bit significand needs ceil(1 + p * log10(2)) digits.
+
+        Args:
+            values: Array to be written
+
+        Returns:
+            Format string such as ``%.17g`` (float64) or ``%.9g`` (float32)
+        """
+        dtype = values.dtype if values.dtype.kind == "f" else np.dtype(np.float64)
+        digits = math.ceil(1 + (np.finfo(dtype).nmant + 1) * math.log10(2))
+        return f"%.{digits}g"
+
     def _save_npy(self, waveform: WaveformData, filename: str, metadata: Optional[dict] = None) -> None:
         """Save waveform as NumPy compressed archive.
 
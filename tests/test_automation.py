@@ -45,6 +45,16 @@ def test_capture_single_uses_channel_enabled_and_waveform_acquire(monkeypatch, c
     assert collector.scope._connection.writes[:3] == ["TRIG_MODE SINGLE", "ARM", "C1:WF? DAT2"]
 
 
+def test_capture_single_probes_channel_states_once(monkeypatch, collector):
+    fake_time = FakeTime()
+    monkeypatch.setattr("scpi_control.automation.time", fake_time)
+
+    collector.capture_single([1, 2])
+
+    tra_queries = [q for q in collector.scope._connection.queries if "TRA?" in q]
+    assert len(tra_queries) == 1
+
+
 def test_batch_capture_applies_timebase_and_scale(monkeypatch, collector):
     fake_time = FakeTime()
     monkeypatch.setattr("scpi_control.automation.time", fake_time)
@@ -50,6 +50,662 @@ def test_waveform_display_creation(qapp):
     assert hasattr(display, "cursor_mode")
 
 
+def test_waveform_display_updates_lines_in_place(qapp):
+    """Test that replotting reuses one line per channel instead of clearing the axes."""
+    import numpy as np
+
+    from scpi_control.gui.widgets.waveform_display import WaveformDisplay
+    from scpi_control.waveform import WaveformData
+
+    def make_waveform(channel, offset):
+        time = np.linspace(0, 1e-3, 100)
+        return WaveformData(time=time, voltage=np.sin(time * 1e4) + offset, channel=channel)
+
+    display = WaveformDisplay()
+    display.plot_multiple_waveforms([make_waveform(1, 0.0), make_waveform(2, 1.0)])
+    display._do_replot()
+    line = display._lines[1]
+    legend = display.ax.get_legend()
+
+    display.plot_multiple_waveforms([make_waveform(1, 2.0), make_waveform(2, 1.0)])
+    display._do_replot()
+    assert display._lines[1] is line
+    assert display.ax.get_legend() is legend
+    np.testing.assert_allclose(line.get_ydata()[0], 2.0)
+
+    # Turning a channel off only hides its line; turning it back on reuses it
+    line2 = display._lines[2]
+    display.clear_channel(2)
+    assert not line2.get_visible()
+    assert [text.get_text() for text in display.ax.get_legend().get_texts()] == ["CH1"]
+
+    display.plot_waveform(make_waveform(2, 1.0))
+    display._do_replot()
+    assert display._lines[2] is line2
+    assert line2.get_visible()
+
+    # With no channels the legend is hidden, then shown again without a rebuild
+    display.clear_channel(1)
+    display.clear_channel(2)
+    legend = display.ax.get_legend()
+    assert not legend.get_visible()
+    display.plot_waveform(make_waveform(2, 1.0))
+    display._do_replot()
+    assert display.ax.get_legend() is legend
+    assert legend.get_visible()
+
+    display.clear_all()
+    assert not display.ax.get_lines()
+    assert display.ax.get_legend() is None
+
+
+def test_waveform_display_blits_live_frames(qapp):
+    """Test that live frames reuse the cached background until the view changes."""
+    import numpy as np
+
+    from scpi_control.gui.widgets.waveform_display import WaveformDisplay
+    from scpi_control.waveform import WaveformData
+
+    time = np.linspace(0, 1e-3, 100)
+    display = WaveformDisplay()
+    display.update_waveforms([WaveformData(time=time, voltage=np.sin(time * 1e4), channel=1)])
+    display._do_replot()
+    display.update_waveforms([WaveformData(time=time, voltage=np.sin(time * 1e4), channel=1)])
+    display._do_replot()
+    background = display._background
+    assert background is not None
+
+    display.update_waveforms([WaveformData(time=time, voltage=0.9 * np.sin(time * 1e4), channel=1)])
+    display._do_replot()
+    assert display._background is background
+
+    display.reset_zoom()
+    assert display._background is None
+
+
+def test_waveform_display_coalesces_redraws(qapp, monkeypatch):
+    """Test that a burst of waveform updates triggers a single redraw."""
+    import numpy as np
+
+    from scpi_control.gui.widgets.waveform_display import WaveformDisplay
+    from scpi_control.waveform import WaveformData
+
+    display = WaveformDisplay()
+    replots = []
+    monkeypatch.setattr(display, "_replot", lambda: replots.append("full"))
+    monkeypatch.setattr(display, "_fast_replot", lambda: replots.append("fast"))
+
+    time = np.linspace(0, 1e-3, 100)
+    display.plot_waveform(WaveformData(time=time, voltage=np.zeros(100), channel=1))
+    for _ in range(5):
+        display.update_waveforms([WaveformData(time=time, voltage=np.ones(100), channel=1)])
+
+    assert replots == []
+    assert display._redraw_timer.isActive()
+
+    display._do_replot()
+    assert replots == ["full"]
+
+
+def test_waveform_display_presents_frames_after_redraw(qapp):
+    """Test that live frames are acknowledged by the coalesced redraw, not on arrival."""
+    import numpy as np
+
+    from scpi_control.gui.widgets.waveform_display import WaveformDisplay
+    from scpi_control.waveform import WaveformData
+
+    display = WaveformDisplay()
+    presented = []
+    display.frames_presented.connect(presented.append)
+
+    time = np.linspace(0, 1e-3, 1000)
+    display.update_waveforms([WaveformData(time=time, voltage=np.zeros(1000, dtype=np.float32), channel=1)])
+    display.update_waveforms([WaveformData(time=time, voltage=np.ones(1000, dtype=np.float32), channel=1)])
+
+    assert presented == []
+    display._do_replot()
+    assert presented == [2]
+
+
+def test_waveform_display_decimates_to_pixel_columns(qapp):
+    """Test min/max decimation keeps the envelope and re-decimates when zooming in."""
+    import numpy as np
+
+    from scpi_control.gui.widgets.waveform_display import WaveformDisplay
+    from scpi_control.waveform import WaveformData
+
+    display = WaveformDisplay()
+    time = np.arange(100_000) * 1e-6
+    voltage = np.sin(time * 100)
+    voltage[12_345] = 5.0  # single-sample glitch
+
+    decimated_time, decimated_voltage = display._decimate_minmax(time, voltage, 500)
+    assert len(decimated_voltage) == 1000
+    assert decimated_voltage.max() == 5.0
+    assert decimated_voltage.min() == voltage.min()
+    assert np.all(np.diff(decimated_time) >= 0)
+
+    # Same axes width - the envelope is written into the same buffers
+    again_time, again_voltage = display._decimate_minmax(time, voltage * 2, 500)
+    assert again_time is decimated_time and again_voltage is decimated_voltage
+    assert again_voltage.max() == 10.0
+
+    display.plot_waveform(WaveformData(time=time, voltage=voltage, channel=1))
+    display._do_replot()
+    line = display._lines[1]
+    assert len(line.get_xdata()) <= 2 * int(display.ax.bbox.width)
+
+    # Zoom in to 200 samples - the full-resolution data comes back
+    display.ax.set_xlim(10e-3, 10.2e-3)
+    assert len(line.get_xdata()) > 200
+
+
+def test_waveform_display_time_ticks_use_engineering_units(qapp):
+    """Test that traces stay in seconds and ticks are labelled in engineering units."""
+    import numpy as np
+
+    from scpi_control.gui.widgets.waveform_display import WaveformDisplay
+    from scpi_control.waveform import WaveformData
+
+    display = WaveformDisplay()
+    time = np.linspace(0, 2e-6, 100)
+    display.plot_waveform(WaveformData(time=time, voltage=np.zeros(100), channel=1))
+    display._do_replot()
+
+    assert display._lines[1].get_xdata()[-1] == time[-1]
+    assert display.ax.xaxis.get_major_formatter()(1.5e-6) == "1.50 µs"
+
+
+def test_waveform_display_stores_float32_voltage(qapp):
+    """Test that displayed voltages are float32 while saved waveforms keep full precision."""
+    import numpy as np
+
+    from scpi_control.gui.widgets.waveform_display import WaveformDisplay
+    from scpi_control.waveform import WaveformData
+
+    display = WaveformDisplay()
+    waveform = WaveformData(time=np.linspace(0, 1e-3, 100), voltage=np.ones(100), channel=1)
+    display.plot_multiple_waveforms([waveform])
+
+    assert display.waveforms[1].voltage.dtype == np.float32
+    assert display.current_waveforms[0] is waveform
+
+
+def test_waveform_display_reuses_time_axes(qapp):
+    """Test that identical time axes from consecutive frames share one cached array."""
+    import numpy as np
+
+    from scpi_control.gui.widgets.waveform_display import WaveformDisplay
+    from scpi_control.waveform import WaveformData
+
+    display = WaveformDisplay()
+    display.update_waveforms([WaveformData(time=np.linspace(0, 1e-3, 100), voltage=np.ones(100), channel=1)])
+    display._do_replot()
+    time = display.waveforms[1].time
+    xdata = display._lines[1].get_xdata(orig=True)
+    assert not time.flags.writeable
+
+    display.update_waveforms([WaveformData(time=np.linspace(0, 1e-3, 100), voltage=np.zeros(100), channel=1)])
+    display._do_replot()
+    assert display.waveforms[1].time is time
+    # Only the y data was replaced
+    assert display._lines[1].get_xdata(orig=True) is xdata
+    assert display._lines[1].get_ydata()[0] == 0.0
+
+    display.clear_all()
+    assert not display._time_cache
+
+
+def test_pyqtgraph_display_decimates_long_records(qapp):
+    """Test that the PyQtGraph display hands long records to a peak-downsampling curve."""
+    import numpy as np
+
+    pytest.importorskip("pyqtgraph")
+    from scpi_control.gui.widgets.waveform_display_pg import WaveformDisplayPG
+    from scpi_control.waveform import WaveformData
+
+    display = WaveformDisplayPG()
+    display.resize(800, 600)
+    display.show()
+    qapp.processEvents()
+
+    time = np.arange(1_000_000) * 1e-9
+    voltage = np.sin(time * 1e7)
+    voltage[12_345] = 5.0  # single-sample glitch
+    display.update_waveforms([WaveformData(time=time, voltage=voltage, channel=1)])
+    qapp.processEvents()
+
+    _, shown = display.plot_items[1].getData()
+    assert len(shown) < len(voltage) // 10
+    assert shown.max() == 5.0
+    display.close()
+
+
+def test_pyqtgraph_display_opengl_fallback(qapp, monkeypatch):
+    """Test that the PyQtGraph display keeps the raster viewport without OpenGL."""
+    pytest.importorskip("pyqtgraph")
+    from PyQt6.QtOpenGLWidgets import QOpenGLWidget
+
+    from scpi_control.gui.widgets import waveform_display_pg
+
+    monkeypatch.setattr(waveform_display_pg, "_opengl_available", lambda: False)
+    display = waveform_display_pg.WaveformDisplayPG()
+    assert not display.using_opengl
+    assert not isinstance(display.plot_widget.viewport(), QOpenGLWidget)
+
+    display = waveform_display_pg.WaveformDisplayPG(use_opengl=False)
+    assert not display.using_opengl
+
+
+def test_pyqtgraph_display_thin_live_pens(qapp, monkeypatch, tmp_path):
+    """Test that live traces use 1 px pens and export temporarily widens them."""
+    import numpy as np
+
+    pytest.importorskip("pyqtgraph")
+    from scpi_control.gui.widgets import waveform_display_pg
+    from scpi_control.waveform import WaveformData
+
+    display = waveform_display_pg.WaveformDisplayPG(use_opengl=False)
+    time = np.linspace(0, 1e-3, 1000)
+    display.update_waveforms([WaveformData(time=time, voltage=np.sin(time * 1e4), channel=1)])
+    display._do_update_plot()
+    curve = display.plot_items[1]
+    assert curve.opts["pen"].widthF() == 1
+    assert curve.curve.opts["segmentedLineMode"] == "off"
+
+    widths = []
+    filename = str(tmp_path / "waveform.png")
+
+    class FakeExporter:
+        def __init__(self, item):
+            pass
+
+        def export(self, name):
+            widths.append(curve.opts["pen"].widthF())
+
+    monkeypatch.setattr(waveform_display_pg.QFileDialog, "getSaveFileName", lambda *args: (filename, ""))
+    monkeypatch.setattr(waveform_display_pg.pg.exporters, "ImageExporter", FakeExporter)
+    display._on_export()
+
+    assert widths == [2]
+    assert curve.opts["pen"].widthF() == 1
+
+
+def test_pyqtgraph_display_info_label_only_on_change(qapp, monkeypatch):
+    """Test that live frames of unchanged size don't rewrite the info label."""
+    import numpy as np
+
+    pytest.importorskip("pyqtgraph")
+    from scpi_control.gui.widgets.waveform_display_pg import WaveformDisplayPG
+    from scpi_control.waveform import WaveformData
+
+    display = WaveformDisplayPG(use_opengl=False)
+    texts = []
+    monkeypatch.setattr(display.info_label, "setText", texts.append)
+
+    time = np.linspace(0, 1e-3, 1000)
+    for _ in range(3):
+        display.update_waveforms([WaveformData(time=time, voltage=np.random.rand(1000), channel=1)])
+        display._do_update_plot()
+    assert texts == ["1 channel(s) | 1,000 samples"]
+
+    display.clear_all()
+    display.update_waveforms([WaveformData(time=time, voltage=np.random.rand(1000), channel=1)])
+    display._do_update_plot()
+    assert texts[-2:] == ["No data", "1 channel(s) | 1,000 samples"]
+
+
+def test_pyqtgraph_display_updates_only_changed_channel(qapp, monkeypatch):
+    """Test that a single-channel update leaves the other curves alone."""
+    import numpy as np
+
+    pytest.importorskip("pyqtgraph")
+    from scpi_control.gui.widgets.waveform_display_pg import WaveformDisplayPG
+    from scpi_control.waveform import WaveformData
+
+    display = WaveformDisplayPG(use_opengl=False)
+    time = np.linspace(0, 1e-3, 1000)
+    display.plot_multiple_waveforms([WaveformData(time=time, voltage=np.sin(time * 1e4), channel=ch) for ch in (1, 2)])
+    display._do_update_plot()
+
+    updated = []
+    for channel, item in display.plot_items.items():
+        monkeypatch.setattr(item, "setData", lambda *args, ch=channel, **kwargs: updated.append(ch))
+
+    display.update_waveform(WaveformData(time=time, voltage=np.ones(1000), channel=2))
+    display._do_update_plot()
+    assert updated == [2]
+
+
+def test_pyqtgraph_display_removes_vanished_channels(qapp):
+    """Test that plotting a new channel set removes curves of channels left out."""
+    import numpy as np
+
+    pytest.importorskip("pyqtgraph")
+    from scpi_control.gui.widgets.waveform_display_pg import WaveformDisplayPG
+    from scpi_control.waveform import WaveformData
+
+    display = WaveformDisplayPG(use_opengl=False)
+    time = np.linspace(0, 1e-3, 1000)
+    display.plot_multiple_waveforms([WaveformData(time=time, voltage=np.sin(time * 1e4), channel=ch) for ch in (1, 2)])
+    display._do_update_plot()
+    curve = display.plot_items[1]
+    assert display._total_samples == 2000
+
+    display.plot_multiple_waveforms([WaveformData(time=time, voltage=np.cos(time * 1e4), channel=1)])
+    display._do_update_plot()
+    assert set(display.plot_items) == {1} and set(display.waveforms) == {1}
+    assert display._total_samples == 1000
+    assert display._sorted_channels == [1]
+    assert display.plot_items[1] is curve
+    assert len(display.plot_item.listDataItems()) == 1
+
+
+def test_pyqtgraph_display_mouse_signals_follow_modes(qapp):
+    """Test that mouse signals are only connected while a cursor or marker mode is on."""
+    pytest.importorskip("pyqtgraph")
+    from scpi_control.gui.widgets.waveform_display_pg import WaveformDisplayPG
+
+    display = WaveformDisplayPG(use_opengl=False)
+    assert not display._mouse_tracking
+
+    display.set_cursor_mode("vertical")
+    display.set_marker_mode("add", "FREQ", 1)
+    assert display._mouse_tracking
+
+    display.set_cursor_mode("off")
+    assert display._mouse_tracking
+    display.set_marker_mode("off")
+    assert not display._mouse_tracking
+
+
+def test_pyqtgraph_display_coalesces_updates(qapp, monkeypatch):
+    """Test that a burst of channel updates is pushed to the curves once."""
+    import numpy as np
+
+    pytest.importorskip("pyqtgraph")
+    from scpi_control.gui.widgets.waveform_display_pg import WaveformDisplayPG
+    from scpi_control.waveform import WaveformData
+
+    display = WaveformDisplayPG(use_opengl=False)
+    refreshes = []
+    monkeypatch.setattr(display, "_update_plot", lambda channels=None: refreshes.append(channels))
+
+    time = np.linspace(0, 1e-3, 1000)
+    for _ in range(5):
+        for channel in (1, 2):
+            display.update_waveform(WaveformData(time=time, voltage=np.ones(1000), channel=channel))
+
+    assert refreshes == []
+    assert display._refresh_timer.isActive()
+    display._do_update_plot()
+    assert refreshes == [{1, 2}]
+
+    display.set_max_fps(50)
+    assert display._refresh_timer.interval() == 20
+
+
+def test_pyqtgraph_display_presents_frames_after_refresh(qapp):
+    """Test that live frames are acknowledged only once the curves hold them."""
+    import numpy as np
+
+    pytest.importorskip("pyqtgraph")
+    from scpi_control.gui.widgets.waveform_display_pg import WaveformDisplayPG
+    from scpi_control.waveform import WaveformData
+
+    display = WaveformDisplayPG(use_opengl=False)
+    presented = []
+    display.frames_presented.connect(presented.append)
+
+    time = np.linspace(0, 1e-3, 1000)
+    for offset in (0.0, 1.0):
+        display.update_waveforms([WaveformData(time=time, voltage=np.full(1000, offset, dtype=np.float32), channel=1)])
+
+    assert presented == []
+    display._do_update_plot()
+    assert presented == [2]
+    np.testing.assert_array_equal(display.plot_items[1].getData()[1], 1.0)
+
+    # Refreshes without new live frames don't acknowledge anything
+    display._do_update_plot()
+    assert presented == [2]
+
+
+def test_pyqtgraph_display_caches_reference_interpolation(qapp, monkeypatch):
+    """Test that difference mode resamples the reference once per time grid."""
+    import numpy as np
+
+    pytest.importorskip("pyqtgraph")
+    from scpi_control.gui.widgets import waveform_display_pg
+    from scpi_control.waveform import WaveformData
+
+    display = waveform_display_pg.WaveformDisplayPG(use_opengl=False)
+    time = np.linspace(0, 1e-3, 1000)
+    display.plot_multiple_waveforms([WaveformData(time=time, voltage=np.sin(time * 1e4), channel=1)])
+    display.set_reference({"time": np.linspace(0, 1e-3, 100), "voltage": np.zeros(100)})
+
+    calls = []
+    real_interp = np.interp
+    monkeypatch.setattr(waveform_display_pg.np, "interp", lambda *args: calls.append(1) or real_interp(*args))
+    display.toggle_difference_mode(True)
+    display.toggle_difference_mode(True)
+    assert len(calls) == 1
+
+    _, difference = display.reference_item.getOriginalDataset()
+    np.testing.assert_allclose(difference, np.sin(time * 1e4))
+
+    display.set_reference({"time": np.linspace(0, 1e-3, 100), "voltage": np.ones(100)})
+    display.toggle_difference_mode(True)
+    assert len(calls) == 2
+
+
+def test_pyqtgraph_display_plot_arrays(qapp):
+    """Test that live float32 voltages reach setData without a copy."""
+    import numpy as np
+
+    pytest.importorskip("pyqtgraph")
+    from scpi_control.gui.widgets.waveform_display_pg import WaveformDisplayPG
+    from scpi_control.waveform import WaveformData
+
+    time = np.linspace(0, 1e-3, 1000)
+    live = WaveformData(time=time, voltage=np.sin(time * 1e4).astype(np.float32), channel=1)
+    plot_time, plot_voltage = WaveformDisplayPG._plot_arrays(live)
+    assert plot_time is time and plot_voltage is live.voltage
+
+    strided = WaveformData(time=time, voltage=np.sin(time * 1e4)[::-1], channel=1)
+    plot_time, plot_voltage = WaveformDisplayPG._plot_arrays(strided)
+    assert plot_time.dtype == np.float64
+    assert plot_voltage.dtype == np.float32 and plot_voltage.flags.c_contiguous
+
+
+def test_marker_measurements_snapshot(qapp):
+    """Test that marker measurements reflect the current marker state."""
+    from types import SimpleNamespace
+
+    from scpi_control.gui.widgets.waveform_display import WaveformDisplay
+
+    display = WaveformDisplay()
+    marker = SimpleNamespace(marker_id="M1", measurement_type="FREQ", channel=2, result=1e3, unit="Hz", enabled=True)
+    display.measurement_markers = [marker]
+    assert display.get_marker_measurements() == {"M1": {"type": "FREQ", "channel": 2, "result": 1e3, "unit": "Hz", "enabled": True}}
+
+    marker.result = 2e3
+    marker.enabled = False
+    assert display.get_marker_measurements()["M1"]["result"] == 2e3
+    assert display.get_marker_measurements()["M1"]["enabled"] is False
+
+
+def test_update_all_markers_matches_channels(qapp):
+    """Test that markers only measure the waveform on their own channel."""
+    from types import SimpleNamespace
+
+    from scpi_control.gui.widgets.waveform_display import WaveformDisplay
+
+    display = WaveformDisplay()
+    measured = []
+    ch1, ch2 = SimpleNamespace(channel=1), SimpleNamespace(channel=2)
+    display.current_waveforms = [ch1, ch2]
+
+    def make_marker(channel, enabled=True):
+        return SimpleNamespace(channel=channel, enabled=enabled, visible=False, update_measurement=lambda w: measured.append((channel, w)))
+
+    display.measurement_markers = [make_marker(2), make_marker(1, enabled=False), make_marker(3)]
+    display.update_all_markers()
+    assert measured == [(2, ch2)]
+
+
+def test_waveform_display_caches_reference_interpolation(qapp, monkeypatch):
+    """Test that matplotlib difference mode resamples the reference once per time grid."""
+    import numpy as np
+
+    from scpi_control.gui.widgets import waveform_display
+    from scpi_control.waveform import WaveformData
+
+    display = waveform_display.WaveformDisplay()
+    time = np.linspace(0, 1e-3, 1000)
+    display.plot_waveform(WaveformData(time=time, voltage=np.sin(time * 1e4), channel=1))
+    display._do_replot()
+    display.set_reference({"time": np.linspace(0, 1e-3, 100), "voltage": np.zeros(100)})
+
+    calls = []
+    real_interp = np.interp
+    monkeypatch.setattr(waveform_display.np, "interp", lambda *args: calls.append(1) or real_interp(*args))
+    display.toggle_difference_mode(True)
+    display.toggle_difference_mode(True)
+    assert len(calls) == 1
+    assert display.reference_line.get_label() == "Difference"
+
+
+def test_waveform_display_redraw_tiers(qapp, monkeypatch):
+    """Test that cosmetic and style changes never trigger a data replot."""
+    import numpy as np
+
+    from scpi_control.gui.widgets.waveform_display import WaveformDisplay
+    from scpi_control.waveform import WaveformData
+
+    display = WaveformDisplay()
+    replots = []
+    monkeypatch.setattr(display, "_replot", lambda: replots.append("full"))
+    monkeypatch.setattr(display, "_fast_replot", lambda: replots.append("fast"))
+
+    display.toggle_grid()
+    display.set_theme(dark=False)
+    display._do_replot()
+    assert replots == []
+
+    time = np.linspace(0, 1e-3, 100)
+    display.update_waveforms([WaveformData(time=time, voltage=np.ones(100), channel=1)])
+    display.toggle_grid()
+    display._do_replot()
+    assert replots == ["fast"]
+
+
+def test_waveform_display_exports_in_background(qapp, tmp_path):
+    """Test that image export runs on the thread pool and re-enables the button."""
+    import numpy as np
+    from PyQt6.QtCore import QThreadPool
+
+    from scpi_control.gui.widgets.waveform_display import WaveformDisplay
+    from scpi_control.waveform import WaveformData
+
+    display = WaveformDisplay()
+    time = np.linspace(0, 1e-3, 100)
+    display.plot_waveform(WaveformData(time=time, voltage=np.sin(time * 1e4), channel=1))
+
+    filename = tmp_path / "waveform.png"
+    display.export_image(str(filename))
+    assert not display.export_btn.isEnabled()
+
+    QThreadPool.globalInstance().waitForDone()
+    qapp.processEvents()
+
+    assert filename.stat().st_size > 0
+    assert display.export_btn.isEnabled()
+
+
+def test_waveform_display_replot_skips_axes_setup(qapp, monkeypatch):
+    """Test that replots never reconfigure the axes or rerun tight_layout."""
+    import numpy as np
+
+    from scpi_control.gui.widgets.waveform_display import WaveformDisplay
+    from scpi_control.waveform import WaveformData
+
+    display = WaveformDisplay()
+    calls = []
+    monkeypatch.setattr(display, "_configure_axes", lambda: calls.append("configure"))
+    monkeypatch.setattr(display.figure, "tight_layout", lambda *args, **kwargs: calls.append("tight_layout"))
+
+    time = np.linspace(0, 1e-3, 100)
+    for channels in ([1], [1, 2], [2]):
+        display.plot_multiple_waveforms([WaveformData(time=time, voltage=np.ones(100), channel=ch) for ch in channels])
+        display._do_replot()
+    display.set_theme(dark=False)
+    display._do_replot()
+
+    assert calls == []
+
+
+def test_live_view_worker_skips_failed_channel(qapp):
+    """Test that one channel failing to download doesn't drop the other channels."""
+    from unittest.mock import Mock
+
+    import numpy as np
+
+    from scpi_control.gui.live_view_worker import LiveViewWorker
+    from scpi_control.waveform import Waveform
+
+    instrument = Mock()
+    instrument.query_many.return_value = ["1.0E-03S", "1.0E+06Sa/s"] + ["1.0E+00V", "0.0E+00V"] * 3
+    block = b"#9000001000" + bytes(np.arange(1000) % 50)
+    instrument.read_raw.side_effect = [block, TimeoutError("CH2 timed out"), block]
+    handler = Waveform(instrument)
+
+    scope = Mock()
+    scope.is_connected = True
+    scope.get_enabled_channels.return_value = [1, 2, 3]
+    scope.get_waveforms.side_effect = lambda channels, out, on_error: handler.acquire_many(channels, out=out, on_error=on_error)
+
+    worker = LiveViewWorker(scope)
+    statuses = []
+    worker.status_update.connect(statuses.append)
+
+    waveforms = worker._acquire_waveforms()
+
+    assert [w.channel for w in waveforms] == [1, 3]
+    assert any("CH2" in status and "timed out" in status for status in statuses)
+
+
+def test_live_view_worker_waits_for_display_without_polling(qapp):
+    """Test that the single-slot hand-off wakes on frame_displayed(), not on a timeout."""
+    import threading
+    from unittest.mock import Mock, PropertyMock
+
+    from scpi_control.gui.live_view_worker import LiveViewWorker
+
+    scope = Mock()
+    worker = LiveViewWorker(scope)
+    worker.wait_for_display = True
+    worker.update_interval = 60000  # the hand-off wait must not run out
+    worker._frames_emitted = 1
+    acquiring = threading.Event()
+
+    def is_connected():
+        worker.running = False
+        worker.update_interval = 0
+        acquiring.set()
+        return False
+
+    type(scope).is_connected = PropertyMock(side_effect=is_connected)
+    thread = threading.Thread(target=worker.run)
+    thread.start()
+
+    assert not acquiring.wait(0.2)
+    worker.frame_displayed()
+    assert acquiring.wait(2)
+    thread.join(2)
+    assert not thread.is_alive()
+
+
 def test_cursor_panel_creation(qapp):
     """Test that CursorPanel can be created."""
     from scpi_control.gui.widgets.cursor_panel import CursorPanel
@@ -99,5 +755,167 @@ def test_protocol_decode_panel_creation(qapp):
     assert hasattr(panel, "export_requested")
 
 
+def test_live_view_releases_buffers_after_display_refresh(qapp):
+    """Test that the worker's previous buffers are released only after the new frame is drawn."""
+    from unittest.mock import Mock
+
+    import numpy as np
+
+    from scpi_control.gui.main_window import MainWindow
+    from scpi_control.waveform import WaveformData
+
+    window = MainWindow()
+    window.live_view_worker = Mock(paused=False)
+
+    time = np.linspace(0, 1e-3, 1000)
+    window._on_waveforms_ready([WaveformData(time=time, voltage=np.zeros(1000, dtype=np.float32), channel=1)])
+    window.live_view_worker.frame_displayed.assert_not_called()
+
+    # Flush the display's coalesced refresh (PyQtGraph or matplotlib backend)
+    display = window.waveform_display
+    flush = getattr(display, "_do_update_plot", None) or display._do_replot
+    flush()
+    window.live_view_worker.frame_displayed.assert_called_once_with()
+
+    window.live_view_worker = None
+    window.close()
+
+
+def test_live_view_worker_dropped_frame_keeps_displayed_buffers(qapp):
+    """Test that dropping a frame releases its own buffers, not those of the frame on screen."""
+    from scpi_control.gui.live_view_worker import LiveViewWorker
+
+    worker = LiveViewWorker(None)
+
+    def emit_frame():
+        worker._frame_buffer_index = None if worker._buffer_index in worker._in_flight else worker._buffer_index
+        worker._in_flight.append(worker._frame_buffer_index)
+        worker._frames_emitted += 1
+        worker._buffer_index ^= 1
+
+    emit_frame()  # frame A in buffer set 0, drawn
+    worker.frame_displayed()
+    emit_frame()  # frame B in buffer set 1, dropped while paused
+    worker.frame_dropped()
+
+    assert list(worker._in_flight) == [0]
+    assert worker._frames_displayed == worker._frames_emitted
+    # The next refill must not touch A's buffers while A is still plotted
+    emit_frame()
+    assert worker._frame_buffer_index is None
+
+
+def test_live_view_drops_frame_while_paused(qapp):
+    """Test that a frame arriving while paused is dropped rather than acknowledged as displayed."""
+    from unittest.mock import Mock
+
+    import numpy as np
+
+    from scpi_control.gui.main_window import MainWindow
+    from scpi_control.waveform import WaveformData
+
+    window = MainWindow()
+    window.live_view_worker = Mock(paused=True)
+    window.waveform_display.update_waveforms = Mock()
+
+    time = np.linspace(0, 1e-3, 1000)
+    window._on_waveforms_ready([WaveformData(time=time, voltage=np.zeros(1000, dtype=np.float32), channel=1)])
+
+    window.live_view_worker.frame_dropped.assert_called_once_with()
+    window.live_view_worker.frame_displayed.assert_not_called()
+    window.waveform_display.update_waveforms.assert_not_called()
+
+    window.live_view_worker = None
+    window.close()
+
+
+def test_requires_scope_reports_errors(qapp, monkeypatch):
+    """Test that scope-dependent slots route SiglentError to the error dock."""
+    from unittest.mock import Mock
+
+    from PyQt6.QtWidgets import QMessageBox
+
+    from scpi_control.exceptions import SiglentError
+    from scpi_control.gui.main_window import MainWindow
+
+    monkeypatch.setattr(QMessageBox, "critical", Mock())
+    monkeypatch.setattr(QMessageBox, "warning", Mock())
+
+    window = MainWindow()
+
+    # No scope connected: silently ignored (the actions are disabled)
+    window._on_run(False)
+    QMessageBox.warning.assert_not_called()
+
+    # Extra signal arguments (triggered(bool)) are dropped; the call runs on the I/O pool
+    window.scope = Mock()
+    window._on_run(False)
+    window._io_pool.waitForDone()
+    qapp.processEvents()
+    window.scope.run.assert_called_once_with()
+
+    # SiglentError is reported instead of propagating
+    window.scope.stop.side_effect = SiglentError("timeout")
+    window._on_stop()
+    window._io_pool.waitForDone()
+    qapp.processEvents()
+    assert window._error_list.count() == 1
+    assert "timeout" in window._error_list.item(0).text()
+    QMessageBox.critical.assert_called_once()
+
+    window.scope = None
+    window.close()
+
+
+def test_scope_actions_follow_connection_state(qapp):
+    """Test that scope-dependent actions are only enabled while connected."""
+    from unittest.mock import Mock
+
+    from scpi_control.gui.main_window import MainWindow
+
+    window = MainWindow()
+    assert not window.act_run.isEnabled()
+    assert not window.act_capture.isEnabled()
+    assert not window.live_view_action.isEnabled()
+    assert window.act_connect.isEnabled()
+
+    window.scope = Mock()
+    window._set_scope_actions_enabled(True)
+    assert window.act_run.isEnabled()
+    assert window.act_capture.isEnabled()
+    assert not window.act_connect.isEnabled()
+
+    # Capture is unavailable while live view owns the connection
+    window.is_live_view = True
+    window._set_scope_actions_enabled(True)
+    assert not window.act_capture.isEnabled()
+
+    window.is_live_view = False
+    window.scope = None
+    window._set_scope_actions_enabled(False)
+    assert not window.act_run.isEnabled()
+    window.close()
+
+
+def test_connect_dialog_validation(qapp):
+    """Test that ConnectDialog only accepts valid IP addresses or hostnames."""
+    from PyQt6.QtWidgets import QDialogButtonBox
+
+    from scpi_control.gui.widgets.connect_dialog import ConnectDialog
+
+    dialog = ConnectDialog("Connect", "Enter IP address:")
+    ok_button = dialog.button_box.button(QDialogButtonBox.StandardButton.Ok)
+
+    dialog.set_recent_hosts(["192.168.1.100", "scope.lab"])
+    assert dialog.host() == "192.168.1.100"
+    assert ok_button.isEnabled()
+
+    dialog.set_recent_hosts([], default="scope.lab")
+    assert ok_button.isEnabled()
+
+    dialog.set_recent_hosts([], default="192.168.1.300")
+    assert not ok_button.isEnabled()
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,150 @@
+"""Tests for the Oscilloscope class using the offline mock connection."""
+
+import numpy as np
+import pytest
+
+from scpi_control.connection.mock import MockConnection
+from scpi_control.exceptions import CommandError, InvalidParameterError
+from scpi_control.oscilloscope import Oscilloscope
+
+
+@pytest.fixture
+def scope():
+    """Create a connected oscilloscope backed by a mock connection."""
+    connection = MockConnection(
+        channel_states={1: True, 2: False, 3: True, 4: False},
+        waveform_payloads={1: bytes([0, 25, 50, 75]), 3: bytes([25, 25, 25, 25])},
+    )
+    with Oscilloscope("mock", connection=connection) as scope:
+        yield scope
+
+
+class TestLazySubsystems:
+    """Test that subsystem helpers are created on first access."""
+
+    def test_subsystems_created_on_first_access(self):
+        """Test that helpers are not built in __init__ and are cached once built."""
+        scope = Oscilloscope("mock", connection=MockConnection())
+        assert "waveform" not in vars(scope)
+
+        waveform = scope.waveform
+        assert scope.waveform is waveform
+        assert scope.trigger is scope.trigger
+
+
+class TestParseIdn:
+    """Test *IDN? reply parsing."""
+
+    @pytest.mark.parametrize(
+        "idn, expected",
+        [
+            ("Siglent Technologies,SDS824X HD,SER123,1.0.0.0", ("Siglent Technologies", "SDS824X HD", "SER123", "1.0.0.0")),
+            (" Siglent , SDS1104X-E ,SER,2.1 ", ("Siglent", "SDS1104X-E", "SER", "2.1")),
+            ("Siglent,SDS2104X Plus", ("Siglent", "SDS2104X Plus", "", "")),
+            ("", ("", "", "", "")),
+        ],
+    )
+    def test_parse_idn(self, idn, expected):
+        """Test that fields are split, stripped and missing ones left empty."""
+        scope = Oscilloscope("mock", connection=MockConnection())
+        info = scope._parse_idn(idn)
+        assert (info["manufacturer"], info["model"], info["serial"], info["firmware"]) == expected
+
+
+class TestQueryMany:
+    """Test batched SCPI queries."""
+
+    def test_query_many_single_round_trip(self, scope):
+        """Test that several queries are sent as one compound command."""
+        scope._connection.queries.clear()
+
+        replies = scope.query_many(["C1:TRA?", "C2:TRA?"])
+
+        assert scope._connection.queries == ["C1:TRA?;C2:TRA?"]
+        assert len(replies) == 2
+        assert "ON" in replies[0].upper() and "OFF" in replies[1].upper()
+
+    def test_query_many_incomplete_reply(self):
+        """Test that a reply missing answers raises CommandError."""
+        connection = MockConnection(custom_responses={"C1:TRA?;C2:TRA?": "C1:TRA ON"})
+        with Oscilloscope("mock", connection=connection) as scope:
+            with pytest.raises(CommandError):
+                scope.query_many(["C1:TRA?", "C2:TRA?"])
+
+
+class TestEnabledChannels:
+    """Test enabled channel discovery."""
+
+    def test_get_enabled_channels(self, scope):
+        """Test that only displayed channels are reported."""
+        assert scope.get_enabled_channels() == [1, 3]
+
+    def test_get_enabled_channels_single_round_trip(self, scope):
+        """Test that all channel states are probed with one compound query."""
+        scope._connection.queries.clear()
+
+        scope.get_enabled_channels()
+
+        assert scope._connection.queries == ["C1:TRA?;C2:TRA?;C3:TRA?;C4:TRA?"]
+
+    def test_get_enabled_channels_falls_back_per_channel(self):
+        """Test fallback to per-channel queries when the compound reply is incomplete."""
+        connection = MockConnection(
+            channel_states={1: False, 2: True, 3: False, 4: False},
+            custom_responses={"C1:TRA?;C2:TRA?;C3:TRA?;C4:TRA?": "C1:TRA OFF"},
+        )
+        with Oscilloscope("mock", connection=connection) as scope:
+            assert scope.get_enabled_channels() == [2]
+
+    def test_get_enabled_channels_disconnected(self):
+        """Test that a disconnected scope reports no channels."""
+        scope = Oscilloscope("mock", connection=MockConnection())
+        assert scope.get_enabled_channels() == []
+
+
+class TestBatchedWaveforms:
+    """Test multi-channel acquisition with batched settings queries."""
+
+    def test_get_waveforms(self, scope):
+        """Test that waveforms are returned in channel order."""
+        waveforms = scope.get_waveforms([1, 3])
+
+        assert [wf.channel for wf in waveforms] == [1, 3]
+        np.testing.assert_allclose(waveforms[0].voltage, [0.0, 1.0, 2.0, 3.0])
+        np.testing.assert_allclose(waveforms[1].voltage, [1.0, 1.0, 1.0, 1.0])
+
+    def test_get_waveforms_single_settings_query(self, scope):
+        """Test that all channel settings are read with one compound query."""
+        scope._connection.queries.clear()
+
+        scope.get_waveforms([1, 3])
+
+        assert scope._connection.queries == ["TDIV?;SARA?;C1:VDIV?;C1:OFST?;C3:VDIV?;C3:OFST?"]
+
+    def test_get_waveforms_reuses_buffers(self, scope):
+        """Test that per-channel buffers are filled in place."""
+        out = {1: np.empty(4), 3: np.empty(4)}
+
+        waveforms = scope.get_waveforms([1, 3], out)
+
+        assert waveforms[0].voltage is out[1]
+        assert waveforms[1].voltage is out[3]
+
+
+class TestStackedWaveforms:
+    """Test multi-channel stacked acquisition."""
+
+    def test_get_waveforms_stacked(self, scope):
+        """Test that channels are stacked into one (C, N) array."""
+        time, voltage = scope.get_waveforms_stacked([1, 3])
+
+        assert voltage.shape == (2, 4)
+        assert voltage.flags.c_contiguous
+        np.testing.assert_allclose(voltage[0], [0.0, 1.0, 2.0, 3.0])
+        np.testing.assert_allclose(voltage[1], [1.0, 1.0, 1.0, 1.0])
+        assert time.shape == (4,)
+
+    def test_get_waveforms_stacked_requires_channels(self, scope):
+        """Test that an empty channel list is rejected."""
+        with pytest.raises(InvalidParameterError):
+            scope.get_waveforms_stacked([])
@@ -0,0 +1,59 @@
+"""Tests for markdown to ReportLab markup conversion in the PDF generator."""
+
+import xml.etree.ElementTree as ET
+
+import pytest
+
+pytest.importorskip("reportlab")
+from scpi_control.report_generator.generators import pdf_generator
+from scpi_control.report_generator.generators.pdf_generator import PDFReportGenerator
+
+
+@pytest.fixture
+def generator():
+    """Create a PDF generator."""
+    return PDFReportGenerator()
+
+
+def assert_well_formed(markup):
+    """Assert that markup parses as XML (as ReportLab's paragraph parser requires)."""
+    ET.fromstring(f"<para>{markup}</para>")
+
+
+class TestMarkdownToReportlab:
+    """Test _markdown_to_reportlab()."""
+
+    def test_code_span_escapes_xml(self, generator):
+        """Test that code spans use Courier and escape XML characters."""
+        assert generator._markdown_to_reportlab("`a<b`") == '<font face="Courier">a&lt;b</font>'
+
+    def test_code_span_keeps_markdown_literal(self, generator):
+        """Test that emphasis markers inside code spans are left untouched."""
+        assert generator._markdown_to_reportlab("`**x**`") == '<font face="Courier">**x**</font>'
+        assert generator._markdown_to_reportlab("use `__init__` here") == 'use <font face="Courier">__init__</font> here'
+
+    def test_nested_italic_in_bold(self, generator):
+        """Test that italic spans inside bold spans are converted too."""
+        assert generator._markdown_to_reportlab("**bold _it_**") == "<b>bold <i>it</i></b>"
+
+    def test_bold_italic(self, generator):
+        """Test that ***x*** becomes well-formed bold italic markup."""
+        result = generator._markdown_to_reportlab("***x***")
+        assert result == "<b><i>x</i></b>"
+        assert_well_formed(result)
+
+    def test_mixed_markup_is_well_formed(self, generator):
+        """Test that mixed markup and special characters produce valid XML."""
+        result = generator._markdown_to_reportlab("*a* & **b** < `c>d` __e__\n_f_")
+        assert result == '<i>a</i> &amp; <b>b</b> &lt; <font face="Courier">c&gt;d</font> <b>e</b><br/><i>f</i>'
+        assert_well_formed(result)
+
+    def test_plain_text_fast_path(self, generator, monkeypatch):
+        """Test that text without markup characters skips the regex conversion."""
+        monkeypatch.setattr(pdf_generator, "_MARKDOWN_RE", None)
+        assert generator._markdown_to_reportlab("plain text\nsecond line") == "plain text<br/>second line"
+
+    def test_empty_text(self, generator):
+        """Test that empty or missing text converts to an empty string."""
+        assert generator._markdown_to_reportlab("") == ""
+        assert generator._markdown_to_reportlab(None) == ""
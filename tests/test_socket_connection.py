@@ -234,6 +234,53 @@ class TestSocketQueryBinary:
             pass
 
 
+class TestSocketReadRawInto:
+    """Test reading binary data into caller-provided buffers."""
+
+    def test_read_raw_into_fills_buffer(self, mock_socket):
+        """Test that chunks are received directly into the buffer."""
+        chunks = [b"abcd", b"efgh"]
+
+        def recv_into(view, nbytes):
+            chunk = chunks.pop(0)
+            view[: len(chunk)] = chunk
+            return len(chunk)
+
+        mock_socket.recv_into.side_effect = recv_into
+
+        conn = SocketConnection("192.168.1.100")
+        conn.connect()
+
+        buffer = bytearray(8)
+        assert conn.read_raw_into(buffer) == 8
+        assert buffer == b"abcdefgh"
+
+    def test_read_raw_into_connection_closed(self, mock_socket):
+        """Test that a short read reports the bytes actually received."""
+        mock_socket.recv_into.side_effect = [0]
+
+        conn = SocketConnection("192.168.1.100")
+        conn.connect()
+
+        assert conn.read_raw_into(bytearray(8)) == 0
+
+    def test_read_raw_sized_uses_read_raw_into(self, mock_socket):
+        """Test that sized reads return bytes built from one buffer."""
+
+        def recv_into(view, nbytes):
+            view[:nbytes] = b"x" * nbytes
+            return nbytes
+
+        mock_socket.recv_into.side_effect = recv_into
+
+        conn = SocketConnection("192.168.1.100")
+        conn.connect()
+
+        data = conn.read_raw(10000)
+        assert isinstance(data, bytes)
+        assert data == b"x" * 10000
+
+
 class TestSocketContextManager:
     """Test using socket connection as context manager."""
 
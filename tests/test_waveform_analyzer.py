@@ -0,0 +1,230 @@
+"""Tests for WaveformAnalyzer timing, quality and batch statistics."""
+
+import warnings
+
+import numpy as np
+import pytest
+
+from scpi_control.report_generator.models.report_data import WaveformData
+from scpi_control.report_generator.utils.waveform_analyzer import WaveformAnalyzer
+
+SAMPLE_RATE = 1e6
+
+
+def make_waveform(v, name="C1"):
+    """Wrap voltage samples in a WaveformData sampled at SAMPLE_RATE."""
+    t = np.arange(len(v)) / SAMPLE_RATE
+    return WaveformData(channel_name=name, time_data=t, voltage_data=v, sample_rate=SAMPLE_RATE, record_length=len(v))
+
+
+def square_wave(n=5000, period=500, duty=0.5, edge=12, noise=0.0, seed=0):
+    """Trapezoidal square/pulse wave with linear edges of the given length."""
+    phase = np.arange(n) % period
+    high = int(period * duty)
+    ramp_up = np.clip(phase / edge, 0, 1)
+    ramp_down = np.clip((phase - high) / edge, 0, 1)
+    v = 3.3 * (ramp_up - ramp_down)
+    if noise:
+        v = v + np.random.default_rng(seed).normal(0, noise, n)
+    return v
+
+
+def reference_edge_times(v, dt):
+    """Rise and fall times as calculated by the original sample-by-sample loops."""
+    vmin, vmax = np.min(v), np.max(v)
+    vrange = vmax - vmin
+    v_low = vmin + 0.1 * vrange
+    v_high = vmin + 0.9 * vrange
+    v_50 = vmin + 0.5 * vrange
+    rising_edges = np.where((v[:-1] < v_50) & (v[1:] >= v_50))[0]
+    falling_edges = np.where((v[:-1] > v_50) & (v[1:] <= v_50))[0]
+
+    rise_time = None
+    if len(rising_edges) > 0:
+        start_idx = end_idx = rising_edges[0]
+        while start_idx > 0 and v[start_idx] > v_low:
+            start_idx -= 1
+        while end_idx < len(v) - 1 and v[end_idx] < v_high:
+            end_idx += 1
+        if end_idx > start_idx:
+            rise_time = (end_idx - start_idx) * dt
+
+    fall_time = None
+    if len(falling_edges) > 0:
+        start_idx = end_idx = falling_edges[0]
+        while start_idx > 0 and v[start_idx] < v_high:
+            start_idx -= 1
+        while end_idx < len(v) - 1 and v[end_idx] > v_low:
+            end_idx += 1
+        if end_idx > start_idx:
+            fall_time = (end_idx - start_idx) * dt
+
+    return rise_time, fall_time
+
+
+def reference_shoot(v):
+    """Overshoot and undershoot as calculated by the original full sort."""
+    vmin, vmax = np.min(v), np.max(v)
+    v_sorted = np.sort(v)
+    n = len(v_sorted)
+    v_high_steady = np.mean(v_sorted[int(0.85 * n) : int(0.95 * n)])
+    v_low_steady = np.mean(v_sorted[int(0.05 * n) : int(0.15 * n)])
+    overshoot = ((vmax - v_high_steady) / (v_high_steady - v_low_steady)) * 100 if v_high_steady != v_low_steady else 0
+    undershoot = ((v_low_steady - vmin) / (v_high_steady - v_low_steady)) * 100 if v_high_steady != v_low_steady else 0
+    return max(0, overshoot), max(0, undershoot)
+
+
+SIGNALS = {
+    "square": square_wave(),
+    "noisy_square": square_wave(noise=0.05),
+    "pulse": square_wave(duty=0.2, edge=5),
+    "noisy_pulse": square_wave(n=4096, period=256, duty=0.1, edge=3, noise=0.02, seed=1),
+    "ringing_pulse": square_wave(duty=0.3) + 0.4 * np.exp(-(np.arange(5000) % 500) / 20.0) * np.sin(np.arange(5000) / 3.0),
+    "truncated_rise": np.concatenate([np.zeros(50), np.linspace(0, 1, 30)]),
+    "truncated_fall": np.concatenate([np.linspace(1, 0, 30), np.zeros(50)]),
+}
+
+
+class TestEdgeBounds:
+    """Test _edge_bounds() at the record boundaries."""
+
+    def test_interior_rising_edge(self):
+        """Test that the bounds are the nearest 10% and 90% samples."""
+        v = np.array([0.0, 0.0, 0.05, 0.3, 0.6, 0.95, 1.0, 1.0])
+        start, end = WaveformAnalyzer._edge_bounds(3, v <= 0.1, v >= 0.9)
+        assert (start, end) == (2, 5)
+
+    def test_no_start_crossing_clamps_to_zero(self):
+        """Test that the start clamps to 0 when no sample before the edge is at the start level."""
+        v = np.array([0.4, 0.45, 0.6, 0.95, 1.0])
+        start, end = WaveformAnalyzer._edge_bounds(1, v <= 0.1, v >= 0.9)
+        assert (start, end) == (0, 3)
+
+    def test_no_end_crossing_clamps_to_last_sample(self):
+        """Test that the end clamps to len - 1 when the signal never reaches the final level."""
+        v = np.array([0.0, 0.05, 0.4, 0.6, 0.7])
+        start, end = WaveformAnalyzer._edge_bounds(2, v <= 0.1, v >= 0.9)
+        assert (start, end) == (1, 4)
+
+    def test_falling_edge(self):
+        """Test a falling edge, where the masks are swapped."""
+        v = np.array([1.0, 0.95, 0.7, 0.4, 0.05, 0.0])
+        start, end = WaveformAnalyzer._edge_bounds(2, v >= 0.9, v <= 0.1)
+        assert (start, end) == (1, 4)
+
+    def test_falling_edge_clamps_both_ends(self):
+        """Test a falling edge that neither starts from nor settles at a threshold level."""
+        v = np.array([0.8, 0.6, 0.4, 0.2])
+        start, end = WaveformAnalyzer._edge_bounds(1, v >= 0.9, v <= 0.1)
+        assert (start, end) == (0, 3)
+
+    def test_edge_sample_meets_both_masks(self):
+        """Test that the edge sample itself counts on either side."""
+        v = np.array([0.5, 0.0, 1.0, 0.5])
+        assert WaveformAnalyzer._edge_bounds(1, v <= 0.1, v >= 0.9) == (1, 2)
+        assert WaveformAnalyzer._edge_bounds(2, v <= 0.1, v >= 0.9) == (1, 2)
+
+    def test_edge_at_record_ends(self):
+        """Test edges on the first and last sample."""
+        v = np.array([0.5, 0.5, 0.5])
+        assert WaveformAnalyzer._edge_bounds(0, v <= 0.1, v >= 0.9) == (0, 2)
+        assert WaveformAnalyzer._edge_bounds(2, v <= 0.1, v >= 0.9) == (0, 2)
+
+
+class TestAgainstOriginalAlgorithms:
+    """Compare the vectorized statistics with the original loop and sort implementations."""
+
+    @pytest.mark.parametrize("name", sorted(SIGNALS))
+    def test_rise_and_fall_times(self, name):
+        """Test that rise and fall times match the original sample-by-sample search."""
+        v = SIGNALS[name]
+        stats = WaveformAnalyzer.calculate_timing_stats(make_waveform(v))
+        rise_time, fall_time = reference_edge_times(v, 1 / SAMPLE_RATE)
+
+        assert stats["rise_time"] == pytest.approx(rise_time)
+        assert stats["fall_time"] == pytest.approx(fall_time)
+
+    def test_edges_are_measured(self):
+        """Test that the synthetic square wave yields its programmed edge length."""
+        stats = WaveformAnalyzer.calculate_timing_stats(make_waveform(SIGNALS["square"]))
+        # Ramp samples k/12: last at or below 10% is k=1, first at or above 90% is k=11
+        assert stats["rise_time"] == pytest.approx(10 / SAMPLE_RATE)
+        assert stats["fall_time"] == pytest.approx(10 / SAMPLE_RATE)
+
+    @pytest.mark.parametrize("name", sorted(SIGNALS))
+    def test_overshoot_and_undershoot(self, name):
+        """Test that the partitioned steady-state levels match the full sort."""
+        v = SIGNALS[name]
+        stats = WaveformAnalyzer.calculate_quality_stats(make_waveform(v))
+        overshoot, undershoot = reference_shoot(v)
+
+        assert stats["overshoot"] == pytest.approx(overshoot)
+        assert stats["undershoot"] == pytest.approx(undershoot)
+
+    @pytest.mark.parametrize("n", [1, 2, 3, 7, 19, 20, 21])
+    def test_overshoot_on_short_records(self, n):
+        """Test that tiny records, where the bands are empty or a single sample, match the full sort."""
+        v = np.random.default_rng(n).normal(0, 1, n)
+        # Empty bands average to NaN in both implementations
+        with np.errstate(all="ignore"), warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)
+            stats = WaveformAnalyzer.calculate_quality_stats(make_waveform(v))
+            overshoot, undershoot = reference_shoot(v)
+
+        np.testing.assert_equal(stats["overshoot"], overshoot)
+        np.testing.assert_equal(stats["undershoot"], undershoot)
+
+    def test_extrema_argument_matches_computed(self):
+        """Test that passing precomputed extrema gives the same results."""
+        waveform = make_waveform(SIGNALS["noisy_pulse"])
+        extrema = (np.min(waveform.voltage_data), np.max(waveform.voltage_data))
+
+        assert WaveformAnalyzer.calculate_timing_stats(waveform, extrema) == WaveformAnalyzer.calculate_timing_stats(waveform)
+        assert WaveformAnalyzer.calculate_quality_stats(waveform, extrema) == WaveformAnalyzer.calculate_quality_stats(waveform)
+
+
+class TestAnalyzeBatch:
+    """Test that analyze_batch() matches per-waveform analyze()."""
+
+    def assert_stats_equal(self, batch, single):
+        assert batch.keys() == single.keys()
+        for key in single:
+            if single[key] is None or isinstance(single[key], str):
+                assert batch[key] == single[key], key
+            else:
+                assert batch[key] == pytest.approx(single[key], rel=1e-9), key
+
+    def test_same_length_channels(self):
+        """Test a batch of same-length channels, which share one FFT."""
+        waveforms = [make_waveform(SIGNALS[name], name) for name in ("square", "noisy_square", "pulse", "ringing_pulse")]
+
+        batch = WaveformAnalyzer.analyze_batch(waveforms)
+
+        assert len(batch) == len(waveforms)
+        for stats, waveform in zip(batch, waveforms):
+            self.assert_stats_equal(stats, WaveformAnalyzer.analyze(waveform))
+
+    def test_mixed_lengths_keep_order(self):
+        """Test that unbatched lengths fall back to analyze() and results stay in input order."""
+        names = ("square", "truncated_rise", "noisy_pulse", "pulse", "truncated_fall")
+        waveforms = [make_waveform(SIGNALS[name], name) for name in names]
+
+        batch = WaveformAnalyzer.analyze_batch(waveforms, include_plateau_stability=True)
+
+        for stats, waveform in zip(batch, waveforms):
+            self.assert_stats_equal(stats, WaveformAnalyzer.analyze(waveform, include_plateau_stability=True))
+
+    def test_float32_channels(self):
+        """Test that float32 records batch to the same frequencies."""
+        waveforms = [make_waveform(SIGNALS[name].astype(np.float32), name) for name in ("square", "pulse")]
+
+        batch = WaveformAnalyzer.analyze_batch(waveforms)
+
+        for stats, waveform in zip(batch, waveforms):
+            single = WaveformAnalyzer.analyze(waveform)
+            assert stats["frequency"] == single["frequency"]
+            assert stats["period"] == single["period"]
+
+    def test_empty(self):
+        """Test that an empty batch returns an empty list."""
+        assert WaveformAnalyzer.analyze_batch([]) == []
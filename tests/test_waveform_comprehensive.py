@@ -109,6 +109,97 @@ class TestWaveform:
             waveform = waveform_handler.acquire(channel=channel)
             assert waveform.channel == channel
 
+    def test_acquire_into_reuses_buffer(self, waveform_handler, mock_scope):
+        """Test acquiring into a preallocated voltage buffer."""
+        mock_scope.read_raw.return_value = b"#9000001000" + bytes(b"\x19" * 1000)
+        mock_scope.query.side_effect = ["1.0E+00V", "0.0E+00V", "1.0E-03S", "1.0E+06Sa/s"]
+
+        out = np.empty(1000)
+        waveform = waveform_handler.acquire_into(1, out)
+
+        assert waveform.voltage is out
+        np.testing.assert_allclose(out, 1.0)
+
+    def test_acquire_into_allocates_on_size_change(self, waveform_handler, mock_scope):
+        """Test acquire_into allocates a new buffer when the record length changes."""
+        mock_scope.read_raw.return_value = b"#9000001000" + bytes(b"\x19" * 1000)
+        mock_scope.query.side_effect = ["1.0E+00V", "0.0E+00V", "1.0E-03S", "1.0E+06Sa/s"]
+
+        out = np.empty(500)
+        waveform = waveform_handler.acquire_into(1, out)
+
+        assert waveform.voltage is not out
+        assert len(waveform.voltage) == 1000
+
+    def test_acquire_into_float32_buffer(self, waveform_handler, mock_scope):
+        """Test that float32 buffers are filled in place and keep their dtype."""
+        mock_scope.read_raw.return_value = b"#9000001000" + bytes(b"\x19" * 1000)
+        mock_scope.query.side_effect = ["1.0E+00V", "0.0E+00V", "1.0E-03S", "1.0E+06Sa/s"] * 2
+
+        out = np.empty(1000, dtype=np.float32)
+        waveform = waveform_handler.acquire_into(1, out)
+        assert waveform.voltage is out
+        np.testing.assert_allclose(out, 1.0)
+
+        # Size mismatch allocates a new buffer of the same dtype
+        waveform = waveform_handler.acquire_into(1, np.empty(0, dtype=np.float32))
+        assert waveform.voltage.dtype == np.float32
+        assert len(waveform.voltage) == 1000
+
+    def test_acquire_default_dtype(self, waveform_handler, mock_scope):
+        """Test that 8-bit records convert to float32 and 16-bit codes to float64."""
+        mock_scope.read_raw.return_value = b"#9000001000" + bytes(b"\x19" * 1000)
+        mock_scope.query.side_effect = ["1.0E+00V", "5.0E-01V", "1.0E-03S", "1.0E+06Sa/s"]
+
+        waveform = waveform_handler.acquire(channel=1)
+        assert waveform.voltage.dtype == np.float32
+        np.testing.assert_allclose(waveform.voltage, 0.5)
+
+        codes = np.array([-6400, 0, 6400], dtype=np.int16)
+        voltage = waveform_handler._convert_to_voltage(codes, 1.0, 0.5)
+        assert voltage.dtype == np.float64
+        np.testing.assert_allclose(voltage, [-1.5, -0.5, 0.5])
+
+    def test_acquire_many_reports_failed_channel(self, waveform_handler, mock_scope):
+        """Test that acquire_many skips a failing channel when given on_error."""
+        mock_scope.query_many.return_value = ["1.0E-03S", "1.0E+06Sa/s"] + ["1.0E+00V", "0.0E+00V"] * 2
+        block = b"#9000001000" + bytes(b"\x19" * 1000)
+        mock_scope.read_raw.side_effect = [TimeoutError("timed out"), block]
+
+        errors = []
+        waveforms = waveform_handler.acquire_many([1, 2], on_error=lambda channel, e: errors.append((channel, str(e))))
+
+        assert [w.channel for w in waveforms] == [2]
+        assert errors == [(1, "timed out")]
+
+        # Without on_error the failure propagates
+        mock_scope.read_raw.side_effect = [TimeoutError("timed out"), block]
+        with pytest.raises(TimeoutError):
+            waveform_handler.acquire_many([1, 2])
+
+    def test_time_axis_reused(self, waveform_handler, mock_scope):
+        """Test that buffered acquisitions share the time axis while record length and sample rate are unchanged."""
+        mock_scope.read_raw.return_value = b"#9000001000" + bytes(b"\x80" * 1000)
+        mock_scope.query.side_effect = ["1.0E+00V", "0.0E+00V", "1.0E-03S", "1.0E+06Sa/s"] * 2
+
+        first = waveform_handler.acquire_into(1, np.empty(1000))
+        second = waveform_handler.acquire_into(2, np.empty(1000))
+
+        assert second.time is first.time
+        assert not first.time.flags.writeable
+
+    def test_acquire_returns_own_time_axis(self, waveform_handler, mock_scope):
+        """Test that acquire() returns a writable time array not shared with other waveforms."""
+        mock_scope.read_raw.return_value = b"#9000001000" + bytes(b"\x80" * 1000)
+        mock_scope.query.side_effect = ["1.0E+00V", "0.0E+00V", "1.0E-03S", "1.0E+06Sa/s"] * 2
+
+        first = waveform_handler.acquire(channel=1)
+        second = waveform_handler.acquire(channel=2)
+
+        assert second.time is not first.time
+        first.time *= 1e6
+        np.testing.assert_allclose(second.time * 1e6, first.time)
+
     def test_capture_invalid_channel(self, waveform_handler, mock_scope):
         """Test capturing with invalid channel number."""
         with pytest.raises(Exception, match="Invalid channel number"):
@@ -161,6 +252,34 @@ class TestWaveformSaving:
         assert "Time" in content or "time" in content
         assert "Voltage" in content or "voltage" in content
 
+    def test_save_waveform_csv_round_trip(self, waveform_handler, tmp_path, monkeypatch):
+        """Test that chunked CSV output reads back as the original samples."""
+        monkeypatch.setattr(waveform_handler, "CSV_CHUNK_ROWS", 7)
+        time = np.linspace(-1e-3, 1e-3, 50)
+        voltage = np.sin(2 * np.pi * 1000 * time).astype(np.float32)
+        waveform = WaveformData(time=time, voltage=voltage, channel=1)
+
+        filepath = tmp_path / "test.csv"
+        waveform_handler.save_waveform(waveform, str(filepath), format="CSV")
+
+        data = np.loadtxt(filepath, delimiter=",", skiprows=1)
+        assert data.shape == (50, 2)
+        np.testing.assert_array_equal(data[:, 0], time)
+        np.testing.assert_array_equal(data[:, 1].astype(np.float32), voltage)
+
+    def test_save_waveform_csv_float64_exact(self, waveform_handler, tmp_path):
+        """Test that float64 samples read back from CSV bit-exact."""
+        time = np.linspace(0, 1e-3, 1000)
+        voltage = np.array([0.1 + 0.2, 1 / 3, np.pi, -2.5e-300, 1e300] * 200)
+        waveform = WaveformData(time=time, voltage=voltage, channel=1)
+
+        filepath = tmp_path / "test.csv"
+        waveform_handler.save_waveform(waveform, str(filepath), format="CSV")
+
+        data = np.loadtxt(filepath, delimiter=",", skiprows=1)
+        np.testing.assert_array_equal(data[:, 0], time)
+        np.testing.assert_array_equal(data[:, 1], voltage)
+
     def test_save_waveform_npy(self, waveform_handler, tmp_path):
         """Test saving waveform as NPY (compressed numpy format)."""
         time = np.linspace(0, 1e-3, 100)